@@ -0,0 +1,41 @@
+import json
+import os
+
+import requests
+import requests.structures
+import requests.utils
+
+PAYLOADS_DIR = os.path.join(os.path.dirname(__file__), 'payloads')
+
+SPORTS = ['football', 'rugby', 'baseball', 'formula1', 'basketball', 'hockey']
+
+
+def load_payload(sport, size=2 * 1024 * 1024):
+    """
+    Recorded payload for ``sport`` (see record_payloads.py), with its rows replicated up to about ``size`` bytes.
+
+    :rtype: dict
+    """
+
+    with open(os.path.join(PAYLOADS_DIR, f'{sport}.json'), encoding='UTF-8') as stream:
+        payload = json.load(stream)
+
+    rows = payload['response']
+    copies = max(1, size // len(json.dumps(payload).encode('UTF-8')))
+    payload['response'] = rows * copies
+    payload['results'] = len(payload['response'])
+    return payload
+
+
+def make_response(payload, status_code=200, headers=None):
+    """
+    Build a :class:`requests.Response` as received from the API.
+    """
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'OK'
+    response.headers = requests.structures.CaseInsensitiveDict({'Content-Type': 'application/json', **(headers or {})})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = json.dumps(payload).encode('UTF-8')
+    return response
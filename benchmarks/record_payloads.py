@@ -0,0 +1,54 @@
+"""
+Extract the largest example response of every sport from the bundled OpenAPI specs into ``payloads/``.
+
+The API can not be called from CI, so these examples serve as recorded payloads for the benchmarks,
+which replicate their rows to get realistic response sizes.
+
+Usage: PYTHONPATH=src python benchmarks/record_payloads.py
+"""
+import json
+import os
+
+import yaml
+
+from apisports._client import ClientMeta
+
+SPECS = {
+    'football': 3,
+    'rugby': 1,
+    'baseball': 1,
+    'formula1': 1,
+    'basketball': 1,
+    'hockey': 1,
+}
+
+PAYLOADS_DIR = os.path.join(os.path.dirname(__file__), 'payloads')
+
+
+def examples(config):
+    for path, definition in config['paths'].items():
+        try:
+            content = definition['get']['responses']['200']['content']['application/json']
+        except KeyError:
+            continue
+
+        for example in content.get('examples', {}).values():
+            if isinstance(example.get('value'), dict) and example['value'].get('response'):
+                yield path.lstrip('/'), example['value']
+
+
+def main():
+    for kind, version in SPECS.items():
+        with open(os.path.join(ClientMeta.data_dir, f'{kind}-v{version}.yaml'), encoding='UTF-8') as stream:
+            config = yaml.safe_load(stream)
+
+        endpoint, value = max(examples(config), key=lambda example: len(json.dumps(example[1], default=str)))
+        filename = os.path.join(PAYLOADS_DIR, f'{kind}.json')
+        with open(filename, 'w', encoding='UTF-8') as stream:
+            json.dump(dict(value, get=endpoint), stream, default=str, ensure_ascii=False, indent=1)
+
+        print(f'{kind}: {endpoint} -> {filename}')
+
+
+if __name__ == '__main__':
+    main()
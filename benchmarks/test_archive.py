@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from apisports import Football
+from apisports.archive import Archive
+from apisports.decoder import get_decoder
+from apisports.response import AbstractResponse
+from conftest import load_payload, make_response
+
+RESPONSES = 20
+
+
+@pytest.fixture(scope='module')
+def payload():
+    return load_payload('football', size=512 * 1024)
+
+
+@pytest.fixture(scope='module')
+def files(tmpdir_factory, payload):
+    """Before: one JSON file per archived response"""
+
+    directory = tmpdir_factory.mktemp('files')
+    for i in range(RESPONSES):
+        directory.join(f'{i}.json').write_binary(json.dumps(payload).encode('UTF-8'))
+    return [str(directory.join(f'{i}.json')) for i in range(RESPONSES)]
+
+
+@pytest.fixture(scope='module')
+def archive(tmpdir_factory, payload):
+    archive = Archive(str(tmpdir_factory.mktemp('archive')))
+    response = AbstractResponse.create(Football(), make_response(payload))
+    for i in range(RESPONSES):
+        archive.append('players', {'league': 39, 'season': 2020, 'page': i + 1}, response, fetched_at=i)
+    yield archive
+    archive.close()
+
+
+def load_files(files, decode=json.loads):
+    rows = 0
+    for filename in files:
+        with open(filename, 'rb') as stream:
+            rows += len(decode(stream.read())['response'])
+    return rows
+
+
+def replay(archive):
+    return sum(len(entry.response) for entry in archive.replay(pages=True))
+
+
+@pytest.mark.benchmark(group='archive')
+@pytest.mark.parametrize('decoder', ['json', 'orjson'])
+def test_json_files(benchmark, files, decoder):
+    try:
+        decode = get_decoder(decoder)
+    except ImportError:
+        pytest.skip(f'{decoder} is not installed')
+    assert benchmark(load_files, files, decode)
+
+
+@pytest.mark.benchmark(group='archive')
+def test_archive_replay(benchmark, archive, files):
+    assert benchmark(replay, archive) == load_files(files)
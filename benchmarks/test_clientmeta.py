@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from apisports._client import ClientMeta
+
+KINDS = [
+    ('football', 3),
+    ('rugby', 1),
+    ('baseball', 1),
+    ('formula1', 1),
+    ('basketball', 1),
+    ('hockey', 1),
+]
+
+
+def spec_filename(kind, version):
+    return os.path.join(ClientMeta.data_dir, f'{kind}-v{version}.yaml')
+
+
+# the sports classes are built on first access, so touch them all to load every API config
+IMPORT_ALL = 'import apisports; [getattr(apisports, name) for name in apisports._client_classes]'
+
+
+def import_apisports(cache_dir):
+    subprocess.run(
+        [sys.executable, '-c', IMPORT_ALL],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), APISPORTS_CACHE_DIR=cache_dir),
+        check=True
+    )
+
+
+@pytest.mark.benchmark(group='clientmeta-football')
+def test_compile_yaml(benchmark):
+    """Before: parse the YAML spec"""
+
+    with open(spec_filename('football', 3), 'rb') as stream:
+        source = stream.read()
+
+    benchmark.pedantic(ClientMeta.compile, args=(source,), rounds=3)
+
+
+@pytest.mark.benchmark(group='clientmeta-football')
+def test_load_compiled(benchmark, tmpdir, monkeypatch):
+    """After: load the compiled registry"""
+
+    monkeypatch.setattr(ClientMeta, 'cache_dir', str(tmpdir))
+    filename = spec_filename('football', 3)
+    ClientMeta.load(filename)
+
+    benchmark(ClientMeta.load, filename)
+
+
+@pytest.mark.benchmark(group='clientmeta-all')
+def test_get_all_compiled(benchmark, tmpdir, monkeypatch):
+    monkeypatch.setattr(ClientMeta, 'cache_dir', str(tmpdir))
+
+    def get_all():
+        for kind, version in KINDS:
+            ClientMeta.get(kind, version)
+
+    get_all()
+    benchmark(get_all)
+
+
+@pytest.mark.benchmark(group='import')
+def test_import_cold_cache(benchmark, tmpdir):
+    """Before: a fresh interpreter building all sports classes without compiled registry"""
+
+    counter = iter(range(1000))
+    benchmark.pedantic(
+        lambda: import_apisports(str(tmpdir.join(str(next(counter))))),
+        rounds=3
+    )
+
+
+@pytest.mark.benchmark(group='import')
+def test_import_warm_cache(benchmark, tmpdir):
+    """After: a fresh interpreter building all sports classes with compiled registry"""
+
+    import_apisports(str(tmpdir))
+    benchmark.pedantic(import_apisports, args=(str(tmpdir),), rounds=10)
+
+
+@pytest.mark.benchmark(group='import')
+def test_import_baseline(benchmark):
+    """Reference: a fresh interpreter importing only requests"""
+
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, '-c', 'import requests'],),
+        kwargs=dict(env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)), check=True),
+        rounds=10
+    )
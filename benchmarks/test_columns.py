@@ -0,0 +1,51 @@
+import pytest
+
+from apisports import Football
+from apisports.response import AbstractResponse
+from conftest import load_payload, make_response
+
+FIELDS = ['player.id', 'player.age', 'player.injured', 'statistics.0.games.rating', 'statistics.0.goals.total']
+
+numpy = pytest.importorskip('numpy')
+
+
+@pytest.fixture(scope='module')
+def data():
+    # the recorded football payload holds players rows
+    return AbstractResponse.create(Football(), make_response(load_payload('football'))).data
+
+
+def lookup(row, field):
+    value = row
+    for key in field.split('.'):
+        try:
+            value = value[int(key) if key.isdigit() else key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return value
+
+
+def dict_loop(data):
+    """Before: a Python loop over the dicts per field, then convert to masked arrays"""
+
+    columns = {}
+    for field in FIELDS:
+        values = [lookup(row, field) for row in data]
+        columns[field] = numpy.ma.MaskedArray(
+            numpy.array([0 if value is None else value for value in values]),
+            mask=[value is None for value in values]
+        )
+    return columns
+
+
+@pytest.mark.benchmark(group='columns')
+def test_dict_loop(benchmark, data):
+    benchmark(dict_loop, data)
+
+
+@pytest.mark.benchmark(group='columns')
+@pytest.mark.parametrize('backend', ['numpy', 'arrow'])
+def test_to_columns(benchmark, data, backend):
+    if backend == 'arrow':
+        pytest.importorskip('pyarrow')
+    benchmark(data.to_columns, FIELDS, backend=backend)
@@ -0,0 +1,81 @@
+import pytest
+
+import apisports
+from apisports.data import AbstractData, PagedData
+from apisports.response import AbstractResponse
+from conftest import SPORTS, load_payload, make_response
+
+PAGES = 50
+
+
+@pytest.fixture(scope='module', params=SPORTS)
+def sport(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def client(sport):
+    return getattr(apisports, sport.title())()
+
+
+@pytest.fixture(scope='module')
+def payload(sport):
+    return load_payload(sport, size=64 * 1024)
+
+
+def test_create(benchmark, sport, client, payload):
+    """AbstractData.create picking the data class for a decoded payload"""
+
+    benchmark.group = 'data-create-' + sport
+    result = benchmark(AbstractData.create, client, payload)
+    assert len(result)
+
+
+def test_create_records(benchmark, sport, payload):
+    """AbstractData.create converting the rows to records (records=True)"""
+
+    benchmark.group = 'data-create-' + sport
+    client = getattr(apisports, sport.title())(records=True)
+    benchmark(AbstractData.create, client, payload)
+
+
+class PagesClient:
+    """Answers page requests with prebuilt responses, so only the iteration itself is measured"""
+
+    def __init__(self, client, payload, pages):
+        self.pages = [
+            make_response({
+                **payload,
+                "get": "pages",
+                "paging": {"current": page, "total": pages},
+            })
+            for page in range(1, pages + 1)
+        ]
+        self.client = client
+
+    @property
+    def json_decoder(self):
+        return self.client.json_decoder
+
+    def get(self, _endpoint, params):
+        return AbstractResponse.create(self, self.pages[params['page'] - 1])
+
+    def first(self):
+        data = AbstractResponse.create(self, self.pages[0]).data
+        assert type(data) is PagedData
+        return data
+
+
+@pytest.mark.parametrize('mode', ['iter', 'stream'])
+def test_paged_iteration(benchmark, sport, client, payload, mode):
+    """Iterating PagedData over %d offline pages, decoding included""" % PAGES
+
+    benchmark.group = f'paged-iteration-{sport}-{PAGES}-pages'
+    pages = PagesClient(client, payload, PAGES)
+    expected = PAGES * len(payload['response'])
+
+    def iterate():
+        data = pages.first()
+        return sum(1 for _ in (data if mode == 'iter' else data.stream()))
+
+    assert benchmark(iterate) == expected
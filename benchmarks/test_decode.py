@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from apisports import Football
+from apisports.decoder import get_decoder
+from apisports.response import AbstractResponse
+from conftest import SPORTS, load_payload, make_response
+
+
+def available_decoders():
+    for name in ('orjson', 'simdjson', 'ujson', 'json'):
+        try:
+            get_decoder(name)
+        except ImportError:
+            continue
+        yield name
+
+
+@pytest.fixture(scope='module', params=SPORTS)
+def sport(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def response(sport):
+    return make_response(load_payload(sport))
+
+
+def test_text_json_loads(benchmark, sport, response):
+    """Before: decode the body to str, then parse"""
+
+    benchmark.group = 'decode-' + sport
+    benchmark.extra_info['bytes'] = len(response.content)
+    benchmark(lambda: json.loads(response.text))
+
+
+@pytest.mark.parametrize('decoder', list(available_decoders()))
+def test_create(benchmark, sport, response, decoder):
+    """After: AbstractResponse.create parsing the body bytes with the client's decoder"""
+
+    benchmark.group = 'decode-' + sport
+    client = Football(json_decoder=decoder)
+    # decoding is deferred until the payload is used
+    result = benchmark(lambda: AbstractResponse.create(client, response).data)
+    assert len(result)
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from apisports import Football
+from apisports.decodepool import DecodePool
+from apisports.replay import RecordReplayAdapter
+from apisports.testing import StubAPI
+from conftest import load_payload
+
+PAGES = 8
+HOST = 'http://127.0.0.1'
+FIELDS = ['player.id', 'player.name', 'statistics.0.team.name', 'statistics.0.cards.yellow']
+
+
+@pytest.fixture(scope='module')
+def session(tmp_path_factory):
+    """Replays the pages, so the time measured is spent by the client only"""
+
+    payload = load_payload('football', size=2 * 1024 * 1024)
+    bodies = [{**payload, "get": "players", "paging": {"current": page, "total": PAGES}}
+              for page in range(1, PAGES + 1)]
+    directory = str(tmp_path_factory.mktemp('recording'))
+
+    with StubAPI(responses={'players': lambda params: bodies[int(params.get('page', 1)) - 1]}) as stub:
+        recorder = RecordReplayAdapter(directory, mode='record')
+        list(Football(host=stub.url, session=recorder.session()).players(season=2020).data.stream())
+        recorder.close()
+
+    return RecordReplayAdapter(directory).session()
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = DecodePool(min_size=256 * 1024)
+    yield pool
+    pool.shutdown()
+
+
+def measure(benchmark, run):
+    """Benchmark ``run``, with the CPU time of this process (the workers excluded) as extra info"""
+
+    cpu = []
+
+    def timed():
+        started = time.process_time()
+        run()
+        cpu.append(time.process_time() - started)
+
+    timed()  # start the workers
+    benchmark.pedantic(timed, rounds=3)
+    benchmark.extra_info['process_cpu'] = round(min(cpu), 3)
+
+
+@pytest.mark.parametrize('pooled', [False, True])
+def test_rows(benchmark, session, pool, pooled):
+    """Stream all rows of %d pages""" % PAGES
+
+    benchmark.group = 'decodepool-rows'
+    api = Football(host=HOST, session=session, decode_pool=pool if pooled else None)
+    measure(benchmark, lambda: sum(1 for _ in api.players(season=2020).data.stream(concurrency=4)))
+
+
+@pytest.mark.parametrize('pooled', [False, True])
+def test_columns(benchmark, session, pool, pooled):
+    """Columns of %d pages""" % PAGES
+
+    benchmark.group = 'decodepool-columns'
+    api = Football(host=HOST, session=session, decode_pool=pool if pooled else None)
+    measure(benchmark, lambda: api.players(season=2020).data.to_columns(FIELDS, concurrency=4))
@@ -0,0 +1,27 @@
+import pytest
+
+from apisports import Football
+from apisports.metrics import Hooks, MetricsCollector
+from conftest import make_response
+
+PAYLOAD = {"get": "status", "errors": [], "results": 1, "response": {"requests": {"current": 1, "limit_day": 100}}}
+
+
+class Session:
+    """Answers every request instantly, so only the client overhead is measured"""
+
+    def __init__(self):
+        self.response = make_response(PAYLOAD, headers={'x-ratelimit-requests-remaining': '99'})
+
+    def get(self, *args, **kwargs):
+        return self.response
+
+
+@pytest.mark.benchmark(group='metrics')
+@pytest.mark.parametrize('hooks', ['none', 'empty', 'collector'])
+def test_request(benchmark, hooks):
+    api = Football(session=Session(), hooks=[MetricsCollector()] if hooks == 'collector' else None)
+    if hooks == 'empty':
+        api._hooks = Hooks()
+
+    benchmark(lambda: api.status().data)
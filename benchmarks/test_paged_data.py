@@ -0,0 +1,94 @@
+import time
+import tracemalloc
+
+import pytest
+import requests
+import requests_mock
+
+from apisports import Football
+
+PAGES = 30
+PER_PAGE = 20
+LATENCY = 0.01
+
+
+MEMORY_PAGES = 100
+
+
+def players_api(pages, latency):
+    adapter = requests_mock.Adapter()
+
+    def players(request, context):
+        time.sleep(latency)
+        page = int(request.qs['page'][0]) if 'page' in request.qs else 1
+        return {
+            "get": "players",
+            "parameters": {"season": "2020", "league": "39"},
+            "errors": [],
+            "results": PER_PAGE,
+            "paging": {"current": page, "total": pages},
+            "response": [
+                {
+                    "player": {"id": page * PER_PAGE + i, "name": "Player %d" % (page * PER_PAGE + i), "age": 20 + i},
+                    "statistics": [{"team": {"id": 49, "name": "Chelsea"}, "games": {"appearences": i}}]
+                }
+                for i in range(PER_PAGE)
+            ]
+        }
+
+    adapter.register_uri('GET', 'http+mock://football/players', json=players)
+    session = requests.Session()
+    session.mount('http+mock://', adapter)
+    return Football(host='http+mock://football', session=session)
+
+
+@pytest.fixture(scope='module')
+def api():
+    return players_api(PAGES, LATENCY)
+
+
+def pull(api, concurrency):
+    data = api.players(season=2020, league=39).data
+    rows = list(data) if concurrency is None else list(data.prefetch(concurrency))
+    assert len(rows) == PAGES * PER_PAGE
+
+
+@pytest.mark.benchmark(group='paged-data-%d-pages' % PAGES)
+def test_sequential(benchmark, api):
+    benchmark.pedantic(pull, args=(api, None), rounds=5)
+
+
+@pytest.mark.benchmark(group='paged-data-%d-pages' % PAGES)
+@pytest.mark.parametrize('concurrency', [2, 4, 8])
+def test_prefetch(benchmark, api, concurrency):
+    benchmark.pedantic(pull, args=(api, concurrency), rounds=5)
+
+
+def peak_memory(api, iterate):
+    tracemalloc.start()
+    try:
+        data = api.players(season=2020, league=39).data
+        count = 0
+        for _ in iterate(data):
+            count += 1
+        assert count == MEMORY_PAGES * PER_PAGE
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark(group='paged-data-memory')
+@pytest.mark.parametrize('mode', ['iter', 'stream', 'stream-concurrent'])
+def test_peak_memory(benchmark, mode):
+    """Peak traced memory (tracemalloc) while consuming all pages, reported in extra_info.peak_kib"""
+
+    iterate = {
+        'iter': iter,
+        'stream': lambda data: data.stream(),
+        'stream-concurrent': lambda data: data.stream(concurrency=4),
+    }[mode]
+
+    api = players_api(MEMORY_PAGES, 0)
+    peak = benchmark.pedantic(peak_memory, args=(api, iterate), rounds=1)
+    benchmark.extra_info['peak_kib'] = peak // 1024
+    print(f'\n{mode}: peak {peak // 1024} KiB')
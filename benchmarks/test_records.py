@@ -0,0 +1,49 @@
+import gc
+import tracemalloc
+
+import pytest
+
+import apisports
+from apisports.response import AbstractResponse
+from conftest import SPORTS, load_payload, make_response
+
+
+@pytest.fixture(scope='module', params=SPORTS)
+def sport(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def response(sport):
+    return make_response(load_payload(sport))
+
+
+def rows(client, response):
+    return list(AbstractResponse.create(client, response))
+
+
+def retained_memory(client, response):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = rows(client, response)
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        assert result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize('records', [False, True], ids=['dicts', 'records'])
+def test_rows(benchmark, sport, response, records):
+    """Decoding the rows, retained memory (tracemalloc) of the rows is reported in extra_info.retained_kib"""
+
+    benchmark.group = 'records-' + sport
+    client = getattr(apisports, sport.title())(json_decoder='json', records=records)
+
+    size = retained_memory(client, response)
+    benchmark.extra_info['retained_kib'] = size // 1024
+    print(f'\n{sport} {"records" if records else "dicts"}: {size // 1024} KiB retained')
+
+    benchmark(rows, client, response)
@@ -0,0 +1,47 @@
+import pytest
+
+from apisports import Football
+from apisports.replay import RecordReplayAdapter
+from apisports.testing import StubAPI
+from conftest import load_payload
+
+REQUESTS = 200
+
+
+@pytest.fixture(scope='module')
+def stub():
+    payload = load_payload('football', size=64 * 1024)
+    with StubAPI(responses={'players/topyellowcards': payload}) as stub:
+        yield stub
+
+
+@pytest.fixture(scope='module')
+def recording(tmp_path_factory, stub):
+    directory = str(tmp_path_factory.mktemp('recording'))
+    adapter = RecordReplayAdapter(directory, mode='record')
+    api = Football(host=stub.url, session=adapter.session())
+    for league in range(REQUESTS):
+        api.players_topyellowcards(league=league, season=2020)
+    adapter.close()
+    return directory
+
+
+def calls(api):
+    for league in range(REQUESTS):
+        assert api.players_topyellowcards(league=league, season=2020).ok
+
+
+def test_live(benchmark, stub):
+    """Requests to the local stub API"""
+
+    benchmark.group = 'replay-%d-requests' % REQUESTS
+    benchmark.pedantic(calls, (Football(host=stub.url),), rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize('max_entries', [0, 1024])
+def test_replay(benchmark, stub, recording, max_entries):
+    """Replayed requests, bodies decompressed every time (0) or kept in memory"""
+
+    benchmark.group = 'replay-%d-requests' % REQUESTS
+    adapter = RecordReplayAdapter(recording, max_entries=max_entries)
+    benchmark.pedantic(calls, (Football(host=stub.url, session=adapter.session()),), rounds=5, warmup_rounds=1)
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+import requests
+import requests_mock
+
+from apisports import Football
+from conftest import load_payload
+
+
+def live_api(revalidate, etag):
+    """Football client polling ``fixtures?live=all``, the payload never changes"""
+
+    content = json.dumps(load_payload('football')).encode('UTF-8')
+    adapter = requests_mock.Adapter()
+
+    def fixtures(request, context):
+        context.headers['Content-Type'] = 'application/json'
+        if etag:
+            context.headers['ETag'] = '"1"'
+            if request.headers.get('If-None-Match') == '"1"':
+                context.status_code = 304
+                return b''
+        return content
+
+    adapter.register_uri('GET', 'http+mock://football/fixtures', content=fixtures)
+    session = requests.Session()
+    session.mount('http+mock://', adapter)
+    return Football(host='http+mock://football', session=session, revalidate=revalidate)
+
+
+def poll(api):
+    return len(list(api.fixtures(live='all')))
+
+
+@pytest.mark.benchmark(group='revalidate')
+@pytest.mark.parametrize('revalidate,etag', [(False, False), (True, False), (True, True)],
+                         ids=['plain', 'body-compare', 'etag'])
+def test_poll(benchmark, revalidate, etag):
+    api = live_api(revalidate, etag)
+    poll(api)
+    benchmark(poll, api)
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from apisports import AsyncFootball, Football
+from apisports.testing import StubAPI
+from conftest import load_payload
+
+REQUESTS = 200
+
+
+@pytest.fixture(scope='module')
+def server():
+    """Stub API answering every request with the recorded football payload"""
+
+    payload = load_payload('football', size=16 * 1024)
+    with StubAPI(responses={'players/topyellowcards': payload}) as stub:
+        yield stub.url
+
+
+def report(benchmark):
+    if benchmark.stats is None:
+        # --benchmark-disable
+        return
+    benchmark.extra_info['requests'] = REQUESTS
+    benchmark.extra_info['requests_per_second'] = round(REQUESTS / benchmark.stats.stats.median)
+
+
+def test_sequential(benchmark, server):
+    """One request after the other, decoding each response"""
+
+    benchmark.group = 'throughput-%d-requests' % REQUESTS
+    api = Football(host=server)
+
+    def run():
+        for league in range(REQUESTS):
+            assert len(api.players_topyellowcards(league=league, season=2020).data)
+
+    benchmark.pedantic(run, rounds=3, warmup_rounds=1)
+    report(benchmark)
+
+
+@pytest.mark.parametrize('concurrency', [4, 8, 16])
+def test_many(benchmark, server, concurrency):
+    """Client.many, requests run in a thread pool"""
+
+    benchmark.group = 'throughput-%d-requests' % REQUESTS
+    api = Football(host=server, pool_maxsize=concurrency)
+
+    def run():
+        for _, response in api.many('players_topyellowcards', concurrency=concurrency, ordered=False,
+                                    league=list(range(REQUESTS)), season=2020):
+            assert len(response.data)
+
+    benchmark.pedantic(run, rounds=3, warmup_rounds=1)
+    report(benchmark)
+
+
+@pytest.mark.parametrize('concurrency', [8, 32])
+def test_async(benchmark, server, concurrency):
+    """AsyncClient.many on a single event loop"""
+
+    benchmark.group = 'throughput-%d-requests' % REQUESTS
+    loop = asyncio.new_event_loop()
+
+    async def run():
+        async with AsyncFootball(host=server) as api:
+            async for _, response in api.many('players_topyellowcards', concurrency=concurrency, ordered=False,
+                                              league=list(range(REQUESTS)), season=2020):
+                assert len(response.data)
+
+    try:
+        benchmark.pedantic(lambda: loop.run_until_complete(run()), rounds=3, warmup_rounds=1)
+    finally:
+        loop.close()
+    report(benchmark)
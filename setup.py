@@ -1,4 +1,9 @@
+import glob
+import importlib.util
+import os
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 
 
 def contents(file_name):
@@ -13,6 +18,32 @@ def contents_list(file_name):
     return ls
 
 
+class BuildPyCompiled(build_py):
+    """
+    Also compile the API configs, so importing the installed package does not need to parse the YAML files.
+    The compiled configs are specific to the Python version building the package, other versions compile (and cache)
+    them at runtime.
+    """
+
+    def run(self):
+        super().run()
+
+        if self.dry_run:
+            return
+
+        # only needs yaml (a build requirement, see pyproject.toml), not the runtime dependencies of the package
+        spec = importlib.util.spec_from_file_location(
+            'apisports_registry', os.path.join(self.build_lib, 'apisports', '_registry.py')
+        )
+        registry = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(registry)
+
+        # next to the YAML files, where the installed package looks first
+        for filename in sorted(glob.glob(os.path.join(self.build_lib, 'apisports', 'data', '*.yaml'))):
+            self.announce(f'compiling {filename}', level=2)
+            registry.load(filename)
+
+
 VERSION = contents('VERSION')
 long_description = contents('README.rst')
 
@@ -35,9 +66,13 @@ setup(
     packages=find_packages("src"),
     package_dir={"": "src"},
     package_data={'apisports': ['data/*.yaml']},
+    cmdclass={'build_py': BuildPyCompiled},
     install_requires=requirements,
     extras_require={
         'test': requirements_test,
+        'async': ['aiohttp>=3.6'],
+        'numpy': ['numpy'],
+        'arrow': ['pyarrow'],
     },
     platforms='any'
 )
@@ -1,18 +1,60 @@
-from ._client import ClientMeta, Client
+import sys
+from threading import Lock
 
+from ._client import ClientMeta, Client, AsyncClient
 
-def _client_class(kind, version=None):
+
+def _client_class(kind, version=None, base=Client, name=None):
     """
     :return: :class:`type`
     :rtype: type
     """
 
-    return type(kind, (Client,), ClientMeta.get(kind.lower(), version=version))
+    return type(kind if name is None else name, (base,), ClientMeta.get(kind.lower(), version=version))
+
+
+_client_classes = {
+    'Football': 3,
+    'Rugby': None,
+    'Baseball': None,
+    'Formula1': None,
+    'Basketball': None,
+    'Hockey': None,
+}
+
+_client_classes_lock = Lock()
+
+__all__ = [
+    'ClientMeta', 'Client', 'AsyncClient',
+    *_client_classes,
+    *(f'Async{name}' for name in _client_classes)
+]
+
+
+def __getattr__(name):
+    """
+    Build the sports client classes on first access (PEP 562), so importing the package only costs what is used.
+    """
+
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _client_classes_lock:
+        if name not in globals():
+            if name.startswith('Async'):
+                kind = name[len('Async'):]
+                globals()[name] = _client_class(kind, _client_classes[kind], base=AsyncClient, name=name)
+            else:
+                globals()[name] = _client_class(name, _client_classes[name])
+
+    return globals()[name]
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
 
 
-Football = _client_class('Football', 3)
-Rugby = _client_class('Rugby')
-Baseball = _client_class('Baseball')
-Formula1 = _client_class('Formula1')
-Basketball = _client_class('Basketball')
-Hockey = _client_class('Hockey')
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported, build everything upfront
+    for _name in __all__:
+        __getattr__(_name)
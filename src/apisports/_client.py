@@ -1,11 +1,19 @@
 import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice, product
 from keyword import kwlist
+from types import MethodType
+from urllib.parse import urlencode
 
 import requests
 import requests.structures
-import yaml
-from m2r import convert
+import requests.utils
 
+from . import _registry
+from .data import PagedData
+from .decoder import get_decoder
 from .response import AbstractResponse
 
 
@@ -13,6 +21,73 @@ class ClientInitError(ImportError):
     pass
 
 
+class BatchError(Exception):
+    """Raised when one of the requests of :meth:`Client.by_ids` fails"""
+
+    def __init__(self, message, error_description=''):
+        super().__init__(': '.join((message, error_description)))
+
+
+def request_key(endpoint, params=None):
+    """
+    Key identifying a request, parameters without value are ignored and the order of parameters does not matter.
+
+    :rtype: str
+    """
+
+    if not params:
+        return endpoint
+
+    return endpoint + '?' + urlencode(sorted((k, str(v)) for k, v in params.items() if v is not None))
+
+
+def _expand(endpoint, params):
+    # every combination of the values of list, tuple or set parameters
+    expanded = [key for key, value in params.items() if isinstance(value, (list, tuple, set))]
+
+    for values in product(*(params[key] for key in expanded)):
+        yield endpoint, {**params, **dict(zip(expanded, values))}
+
+
+def plan_ids(ids, max_ids=None):
+    """
+    Split ``ids`` into the fewest chunks of at most ``max_ids`` ids, duplicates are only requested once.
+
+    :param ids: The ids
+    :type ids: Iterable[Union[int, str]]
+
+    :param max_ids: Maximum number of ids per request, `None` for no maximum
+    :type max_ids: Union[int, None]
+
+    :return: Dash-separated ids per request, e.g. ``['1-2-3', '4']``
+    :rtype: List[str]
+    """
+
+    ids = list(dict.fromkeys(str(i) for i in ids))
+    if not ids:
+        return []
+
+    size = len(ids) if max_ids is None else max_ids
+    return ['-'.join(ids[start:start + size]) for start in range(0, len(ids), size)]
+
+
+def _field_path(field):
+    """The keys of a dotted field path, e.g. ``statistics.0.goals`` gives ``('statistics', 0, 'goals')``"""
+
+    return tuple(int(key) if key.isdigit() else key for key in field.split('.'))
+
+
+def _lookup(row, path):
+    """The value at ``path`` (see :func:`_field_path`) in ``row``, `None` if there is none"""
+
+    for key in path:
+        try:
+            row = row[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return row
+
+
 class Client:
     """
 
@@ -26,6 +101,56 @@ class Client:
 
     :param session: The `requests` session to use, if None given, a new session will be used.
     :type session: :class:`Session <requests.Session>` object
+
+    :param cache: Cache for successful responses, e.g. :class:`MemoryCache <apisports.cache.MemoryCache>`
+    :type cache: Union[apisports.cache.AbstractCache, None]
+
+    :param rate_limiter: Paces requests to stay within the API rate limits
+    :type rate_limiter: Union[apisports.ratelimit.RateLimiter, None]
+
+    :param coalesce: Let identical concurrent requests share one API call, see :attr:`coalescer`
+    :type coalesce: bool
+
+    :param json_decoder: JSON decoder to use, see :func:`get_decoder <apisports.decoder.get_decoder>`
+    :type json_decoder: Union[str, Callable[[bytes], Any]]
+
+    :param records: Return rows as compact :class:`Record <apisports.records.Record>` objects instead of dicts
+    :type records: bool
+
+    :param pool_connections: Number of hosts to keep a connection pool for (only used for new sessions)
+    :type pool_connections: int
+
+    :param pool_maxsize: Maximum number of connections kept open per host (only used for new sessions), set it to
+        the number of threads sharing the client
+    :type pool_maxsize: int
+
+    :param pool_block: Wait for a free connection when all ``pool_maxsize`` connections are in use, instead of
+        opening (and afterwards discarding) an extra one (only used for new sessions)
+    :type pool_block: bool
+
+    :param keepalive: Keep connections open for subsequent requests
+    :type keepalive: bool
+
+    :param timeout: Seconds to wait for the server, as a single value or a (connect, read) tuple, `None` waits forever
+    :type timeout: Union[float, Tuple[float, float], None]
+
+    :param retry: Retries transient failures (connection errors, HTTP 429 and 5xx), `None` to never retry
+    :type retry: Union[apisports.retry.RetryPolicy, None]
+
+    :param revalidate: Send conditional requests and share the data of unchanged responses, see :attr:`revalidator`.
+        `True` or a :class:`Revalidator <apisports.revalidate.Revalidator>`
+    :type revalidate: Union[bool, apisports.revalidate.Revalidator]
+
+    :param archive: Archive of all successful responses, see :class:`Archive <apisports.archive.Archive>`
+    :type archive: Union[apisports.archive.Archive, None]
+
+    :param hooks: Instrumentation listeners, e.g. a :class:`MetricsCollector <apisports.metrics.MetricsCollector>`,
+        see :attr:`hooks`
+    :type hooks: Union[Iterable[apisports.metrics.Listener], None]
+
+    :param decode_pool: Decode response bodies in worker processes, see :attr:`decode_pool`. Either `True` or a
+        :class:`DecodePool <apisports.decodepool.DecodePool>`
+    :type decode_pool: Union[bool, apisports.decodepool.DecodePool]
     """
 
     default_host = ''
@@ -35,18 +160,160 @@ class Client:
     :type: str
     """
 
-    def __init__(self, host=None, api_key=None, session=None):
+    _row_shapes = {}
+
+    _multi_ids = {}
+
+    def __init__(self, host=None, api_key=None, session=None, cache=None, rate_limiter=None, coalesce=False,
+                 json_decoder='auto', records=False, pool_connections=10, pool_maxsize=10, pool_block=False,
+                 keepalive=True, timeout=None, retry=None, revalidate=False, archive=None, hooks=None,
+                 decode_pool=False):
         if host is None:
             host = self.default_host
+
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keepalive = keepalive
+        self._timeout = timeout
+        self._retry = retry
+        self._archive = archive
+        self._hooks = None
+        if hooks:
+            from .metrics import Hooks
+            self._hooks = Hooks(hooks)
+        self._pool_stats = None
+
         if session is None:
-            session = requests.session()
+            from .pool import PoolStats
+            self._pool_stats = PoolStats()
+            session = self._create_session()
 
         self._url = host.rstrip('/') + '/{endpoint}'
         self._session = session
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._json_decoder = get_decoder(json_decoder)
+        self._coalescer = None
+        self._records = None
+        self._revalidator = None
+        self._decode_pool = None
+
+        if coalesce:
+            from .coalesce import Coalescer
+            self._coalescer = Coalescer()
+        if revalidate is True:
+            from .revalidate import Revalidator
+            self._revalidator = Revalidator()
+        elif revalidate is not False and revalidate is not None:
+            self._revalidator = revalidate
+        if decode_pool is True:
+            from .decodepool import DecodePool
+            self._decode_pool = DecodePool()
+        elif decode_pool is not False and decode_pool is not None:
+            self._decode_pool = decode_pool
+        if records:
+            from .records import RecordFactory
+            self._records = RecordFactory(self._row_shapes)
         self._headers = {
             'x-rapidapi-key': api_key,
             'x-rapidapi-host': host,
         }
+        if not keepalive:
+            self._headers['Connection'] = 'close'
+
+    def _create_session(self):
+        from .pool import PoolAdapter
+
+        session = requests.session()
+        adapter = PoolAdapter(
+            self._pool_stats,
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def pool_stats(self):
+        """
+        Counters of the connection pool, see :class:`PoolStats <apisports.pool.PoolStats>`. `None` when the client
+        was given a session.
+
+        :rtype: Union[dict, None]
+        """
+
+        return None if self._pool_stats is None else self._pool_stats.as_dict()
+
+    @property
+    def json_decoder(self):
+        """
+        Function used to decode the JSON response bodies.
+
+        :rtype: Callable[[bytes], Any]
+        """
+
+        return self._json_decoder
+
+    @property
+    def coalescer(self):
+        """
+        The :class:`Coalescer <apisports.coalesce.Coalescer>` sharing identical concurrent requests, its ``stats``
+        show how many calls were coalesced. `None` unless enabled with ``coalesce=True``.
+
+        :rtype: Union[apisports.coalesce.Coalescer, None]
+        """
+
+        return self._coalescer
+
+    @property
+    def revalidator(self):
+        """
+        The :class:`Revalidator <apisports.revalidate.Revalidator>` when created with ``revalidate=True``, `None`
+        otherwise.
+
+        :rtype: Union[apisports.revalidate.Revalidator, None]
+        """
+
+        return self._revalidator
+
+    @property
+    def decode_pool(self):
+        """
+        The :class:`DecodePool <apisports.decodepool.DecodePool>` decoding response bodies in worker processes. `None`
+        unless enabled with ``decode_pool=True``.
+
+        :rtype: Union[apisports.decodepool.DecodePool, None]
+        """
+
+        return self._decode_pool
+
+    @property
+    def hooks(self):
+        """
+        Instrumentation listeners, see :class:`Listener <apisports.metrics.Listener>`. Register one with
+        ``client.hooks.add(listener)``.
+
+        :rtype: apisports.metrics.Hooks
+        """
+
+        if self._hooks is None:
+            from .metrics import Hooks
+            self._hooks = Hooks()
+        return self._hooks
+
+    @property
+    def records(self):
+        """
+        The :class:`RecordFactory <apisports.records.RecordFactory>` converting rows to records. `None` unless
+        enabled with ``records=True``.
+
+        :rtype: Union[apisports.records.RecordFactory, None]
+        """
+
+        return self._records
 
     def status(self):
         """
@@ -66,86 +333,777 @@ class Client:
 
         return self.get('status')
 
+    def batch(self, requests, concurrency=4, ordered=True):
+        """
+        Perform many requests, at most ``concurrency`` at the same time, e.g.
+        ``api.batch([('fixtures/events', {'fixture': 1}), ('fixtures/lineups', {'fixture': 1})])``.
+
+        Requests are sent from a pool of threads sharing this client, so they go through its session, cache and rate
+        limiter. ``requests`` is consumed as results are yielded, it can be a (long) generator.
+
+        :param requests: ``(endpoint, params)`` tuples
+        :type requests: Iterable[Tuple[str, Union[dict, None]]]
+
+        :param concurrency: Maximum number of requests in flight
+        :type concurrency: int
+
+        :param ordered: Yield results in the order of ``requests``, or as soon as they complete
+        :type ordered: bool
+
+        :return: ``((endpoint, params), response)`` tuples
+        :rtype: Iterator[Tuple[Tuple[str, Union[dict, None]], apisports.response.AbstractResponse]]
+        """
+
+        requests = iter(requests)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = deque()
+
+        def submit(request_list):
+            for endpoint, params in request_list:
+                pending.append(((endpoint, params), executor.submit(self.get, endpoint, params)))
+
+        try:
+            submit(islice(requests, concurrency))
+
+            while pending:
+                index = 0
+                if not ordered:
+                    wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                    index = next(i for i, (_, future) in enumerate(pending) if future.done())
+
+                request, future = pending[index]
+                del pending[index]
+                response = future.result()
+                # keep the workers busy while the caller handles the result
+                submit(islice(requests, 1))
+                yield request, response
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def many(self, method, concurrency=4, ordered=True, **params):
+        """
+        Call an endpoint method for many parameter values, e.g. ``api.many('fixtures_events', fixture=[1, 2, 3])``.
+
+        Parameters given as list, tuple or set are expanded: a request is made for every combination of their values.
+        See :meth:`batch`.
+
+        :param method: Name of the endpoint method
+        :type method: str
+
+        :param concurrency: Maximum number of requests in flight
+        :type concurrency: int
+
+        :param ordered: Yield results in the order of the expanded parameters, or as soon as they complete
+        :type ordered: bool
+
+        :return: ``((endpoint, params), response)`` tuples
+        :rtype: Iterator[Tuple[Tuple[str, dict], apisports.response.AbstractResponse]]
+        """
+
+        return self.batch(_expand(self._endpoint(method), params), concurrency=concurrency, ordered=ordered)
+
+    def by_ids(self, method, ids, concurrency=4, **params):
+        """
+        Get rows for many ids using the fewest requests, for endpoints accepting multiple ids in one parameter, e.g.
+        ``api.by_ids('fixtures', fixture_ids)`` asks for 20 fixtures per request using ``ids=1-2-...-20``.
+
+        The responses are split up per id again. Requests are performed using :meth:`batch`.
+
+        :param method: Name of the endpoint method
+        :type method: str
+
+        :param ids: The ids
+        :type ids: Iterable[Union[int, str]]
+
+        :param concurrency: Maximum number of requests in flight
+        :type concurrency: int
+
+        :return: The row per id, in the order of ``ids``, `None` for ids the API returned nothing for
+        :rtype: dict
+
+        :raises BatchError: if a request fails
+        :raises ValueError: if the endpoint does not accept multiple ids
+        """
+
+        ids = list(ids)
+        rows = {}
+
+        for (_, request_params), response in self.batch(
+                self._plan(method, ids, params), concurrency=concurrency, ordered=False):
+            self._add_rows(rows, method, request_params, response)
+
+        return {i: rows.get(str(i)) for i in ids}
+
+    def watch(self, method, interval=15., key=None, **params):
+        """
+        Poll an endpoint and yield what changed since the previous poll, e.g. goals, cards and status changes of
+        ``api.watch('fixtures', live='all')``.
+
+        Rows are matched on ``key``. All rows are ``added`` in the first poll, after that only the rows ``added``,
+        ``removed`` or ``changed`` are yielded. Polls returning the same body as the previous one are not decoded,
+        create the client with ``revalidate=True`` to also let the API skip sending it. For paged data, the body
+        only covers the first page, so the rows of all pages are compared on every poll.
+
+        The generator polls forever, stop iterating to stop polling.
+
+        :param method: Name of the endpoint method
+        :type method: str
+
+        :param interval: Seconds between the start of two polls
+        :type interval: float
+
+        :param key: Dotted path of the key of each row or a function returning it, defaults to the id field of the
+            endpoint (e.g. ``fixture.id``)
+        :type key: Union[str, Callable[[Any], Hashable], None]
+
+        :return: The changes of each poll, see :class:`Change <apisports.watch.Change>`
+        :rtype: Iterator[apisports.watch.Change]
+
+        :raises WatchError: if a poll fails
+        """
+
+        endpoint = self._endpoint(method)
+        unchanged, update = self._poller(endpoint, key)
+
+        while True:
+            started = time.monotonic()
+            response = self.get(endpoint, params)
+            if not unchanged(response):
+                yield from update(response)
+
+            delay = started + interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    def _poller(self, endpoint, key):
+        from .watch import Watcher, WatchError
+
+        watcher = Watcher(self._watch_key(endpoint) if key is None else key)
+        previous = None
+        paged = False
+
+        def unchanged(response):
+            nonlocal previous, paged
+
+            if not response.ok:
+                raise WatchError(f"Could not poll {endpoint}", response.error_description)
+
+            # the body only tells about the first page, the rows of all pages are compared for paged data
+            content = response.raw.content
+            if not paged and previous is not None and (response.not_modified or content == previous):
+                return True
+
+            previous = content
+            paged = isinstance(response.data, PagedData)
+            return False
+
+        return unchanged, watcher.update
+
+    def _watch_key(self, endpoint):
+        if endpoint in self._multi_ids:
+            return self._multi_ids[endpoint][2]
+
+        # the id of the row itself, or of the object named after the endpoint, e.g. players: player.id
+        shapes = self._row_shapes.get(endpoint)
+        shape = shapes[0] if shapes else None
+        shape = shape[0] if type(shape) is list else shape
+        if type(shape) is tuple:
+            fields = dict(shape)
+            name = endpoint[:-1] if endpoint.endswith('s') else endpoint
+            if fields.get('id') == 'int':
+                return 'id'
+            if type(fields.get(name)) is tuple and 'id' in dict(fields[name]):
+                return f'{name}.id'
+
+        raise ValueError(f"Don't know the key of the rows of {endpoint!r}, pass key")
+
+    def _plan(self, method, ids, params):
+        endpoint = self._endpoint(method)
+        if endpoint not in self._multi_ids:
+            raise ValueError(f"{method!r} does not accept multiple ids")
+
+        param, max_ids, _ = self._multi_ids[endpoint]
+        return [(endpoint, {**params, param: chunk}) for chunk in plan_ids(ids, max_ids)]
+
+    def _add_rows(self, rows, method, request_params, response):
+        param, _, id_field = self._multi_ids[self._endpoint(method)]
+
+        if not response.ok:
+            raise BatchError(f"Could not fetch {param}={request_params[param]}", response.error_description)
+
+        path = _field_path(id_field)
+        for row in response:
+            rows[str(_lookup(row, path))] = row
+
+    def _endpoint(self, method):
+        endpoint = getattr(getattr(self, method, None), '__func__', None)
+        if not isinstance(endpoint, EndpointMethod):
+            raise AttributeError(f"{type(self).__name__!r} has no endpoint method {method!r}")
+        return endpoint.endpoint
+
     def get(self, endpoint, params=None):
         """
         :return: :class:`AbstractResponse <apisports.response.AbstractResponse>` object
         :rtype: apisports.response.AbstractResponse
         """
 
-        return AbstractResponse.create(
-            self,
-            self._session.get(
-                self._url.format(endpoint=endpoint),
-                params=params,
-                headers=self._headers
-            )
+        key = request_key(endpoint, params)
+
+        if self._cache is not None:
+            response = self._cache.get(self, key)
+            if response is not None:
+                return response
+
+        if self._coalescer is not None:
+            return self._coalescer.call(key, lambda: self._request(endpoint, params, key))
+
+        return self._request(endpoint, params, key)
+
+    def _request(self, endpoint, params, key):
+        headers = self._headers
+        if self._revalidator is not None:
+            headers = self._revalidator.headers(key, headers)
+
+        attempt = 0
+
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+
+            try:
+                response = self._send(endpoint, params, headers)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+                delay = None if self._retry is None else self._retry.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update(response)
+                if self._revalidator is not None:
+                    response = self._revalidator.update(key, response)
+
+                delay = None if self._retry is None or response.ok else self._retry.delay(attempt, response)
+                if delay is None:
+                    break
+
+            attempt += 1
+            self._retry.sleep(delay)
+
+        if self._decode_pool is not None:
+            self._decode_pool.submit(self, response)
+
+        if self._archive is not None:
+            self._archive.append(endpoint, params, response)
+
+        if self._cache is not None:
+            self._cache.set(endpoint, key, response)
+
+        return response
+
+    def _send(self, endpoint, params, headers):
+        hooks = self._hooks
+        if hooks is not None:
+            hooks.request_start(endpoint, params)
+            started = time.perf_counter()
+
+        try:
+            raw = self._session.get(self._url.format(endpoint=endpoint), params=params, headers=headers,
+                                    timeout=self._timeout)
+        except Exception as exc:
+            if hooks is not None:
+                hooks.request_end(endpoint, params, None, time.perf_counter() - started, exc)
+            raise
+
+        response = AbstractResponse.create(self, raw)
+        if hooks is not None:
+            hooks.request_end(endpoint, params, response, time.perf_counter() - started)
+        return response
+
+
+class AsyncClient(Client):
+    """
+    Asyncio based client, endpoint methods return awaitables resolving to the same
+    :class:`AbstractResponse <apisports.response.AbstractResponse>` objects as :class:`Client`.
+
+    Requires the optional ``aiohttp`` dependency (``pip install apisports[async]``). All requests share one pool of
+    HTTP/1.1 keep-alive connections, use ``async with`` or :meth:`close` to release it.
+
+    :param host: Host to call the api on, will use ``default_host`` if `None`
+    :type host: Union[str, None]
+
+    :param api_key: The API key to use for requests.
+    :type api_key: str
+
+    :param session: The `aiohttp` session to use, if None given, a new session will be created on first use.
+    :type session: :class:`ClientSession <aiohttp.ClientSession>` object
+
+    :param cache: Cache for successful responses, e.g. :class:`MemoryCache <apisports.cache.MemoryCache>`
+    :type cache: Union[apisports.cache.AbstractCache, None]
+
+    :param rate_limiter: Paces requests to stay within the API rate limits
+    :type rate_limiter: Union[apisports.ratelimit.RateLimiter, None]
+
+    :param coalesce: Let identical concurrent requests share one API call, see :attr:`coalescer`
+    :type coalesce: bool
+
+    :param json_decoder: JSON decoder to use, see :func:`get_decoder <apisports.decoder.get_decoder>`
+    :type json_decoder: Union[str, Callable[[bytes], Any]]
+
+    :param records: Return rows as compact :class:`Record <apisports.records.Record>` objects instead of dicts
+    :type records: bool
+
+    :param pool_maxsize: Maximum number of simultaneous connections in the pool (only used for new sessions).
+    :type pool_maxsize: int
+
+    :param keepalive_timeout: Seconds to keep idle connections alive (only used for new sessions).
+    :type keepalive_timeout: float
+
+    :param keepalive: Keep connections open for subsequent requests (only used for new sessions)
+    :type keepalive: bool
+
+    :param timeout: Seconds to wait for the server, as a single value or a (connect, read) tuple, `None` waits forever
+    :type timeout: Union[float, Tuple[float, float], None]
+
+    :param retry: Retries transient failures (connection errors, HTTP 429 and 5xx), `None` to never retry
+    :type retry: Union[apisports.retry.RetryPolicy, None]
+
+    :param revalidate: Send conditional requests and share the data of unchanged responses, see :attr:`revalidator`.
+        `True` or a :class:`Revalidator <apisports.revalidate.Revalidator>`
+    :type revalidate: Union[bool, apisports.revalidate.Revalidator]
+
+    :param archive: Archive of all successful responses, see :class:`Archive <apisports.archive.Archive>`
+    :type archive: Union[apisports.archive.Archive, None]
+
+    :param hooks: Instrumentation listeners, e.g. a :class:`MetricsCollector <apisports.metrics.MetricsCollector>`,
+        see :attr:`hooks`
+    :type hooks: Union[Iterable[apisports.metrics.Listener], None]
+
+    :param decode_pool: Decode response bodies in worker processes, see :attr:`decode_pool`. Either `True` or a
+        :class:`DecodePool <apisports.decodepool.DecodePool>`
+    :type decode_pool: Union[bool, apisports.decodepool.DecodePool]
+    """
+
+    def __init__(self, host=None, api_key=None, session=None, cache=None, rate_limiter=None, coalesce=False,
+                 json_decoder='auto', records=False, pool_maxsize=100, keepalive_timeout=15, keepalive=True,
+                 timeout=None, retry=None, revalidate=False, archive=None, hooks=None, decode_pool=False):
+        self._keepalive_timeout = keepalive_timeout
+        super().__init__(
+            host=host, api_key=api_key, session=session, cache=cache, rate_limiter=rate_limiter, coalesce=coalesce,
+            json_decoder=json_decoder, records=records, pool_maxsize=pool_maxsize, keepalive=keepalive,
+            timeout=timeout, retry=retry, revalidate=revalidate, archive=archive, hooks=hooks,
+            decode_pool=decode_pool
         )
+        # like requests, do not send headers without value; aiohttp closes connections itself when not kept alive
+        self._headers = {k: v for k, v in self._headers.items() if v is not None and k != 'Connection'}
+
+    def _create_session(self):
+        # created on first use in :attr:`session`, as aiohttp needs a running event loop
+        return None
+
+    @property
+    def session(self):
+        """
+        The `aiohttp` session, created on first access as it needs a running event loop.
+
+        :rtype: aiohttp.ClientSession
+        """
+
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as exc:
+                raise ImportError("AsyncClient requires aiohttp, install apisports[async]") from exc
+
+            from .pool import trace_config
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_maxsize,
+                    keepalive_timeout=None if not self._keepalive else self._keepalive_timeout,
+                    force_close=not self._keepalive
+                ),
+                trace_configs=[trace_config(self._pool_stats)]
+            )
+
+        return self._session
+
+    async def batch(self, requests, concurrency=4, ordered=True):
+        """
+        Asynchronous version of :meth:`Client.batch`, an asynchronous iterator to use with ``async for``. The same
+        goes for :meth:`Client.many`.
+        """
+
+        import asyncio
+
+        requests = iter(requests)
+        pending = deque()
+
+        def submit(request_list):
+            for endpoint, params in request_list:
+                pending.append(((endpoint, params), asyncio.ensure_future(self.get(endpoint, params))))
+
+        try:
+            submit(islice(requests, concurrency))
+
+            while pending:
+                index = 0
+                if not ordered:
+                    await asyncio.wait([task for _, task in pending], return_when=asyncio.FIRST_COMPLETED)
+                    index = next(i for i, (_, task) in enumerate(pending) if task.done())
+
+                request, task = pending[index]
+                del pending[index]
+                response = await task
+                submit(islice(requests, 1))
+                yield request, response
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def by_ids(self, method, ids, concurrency=4, **params):
+        """
+        Asynchronous version of :meth:`Client.by_ids`.
+        """
+
+        ids = list(ids)
+        rows = {}
+
+        async for (_, request_params), response in self.batch(
+                self._plan(method, ids, params), concurrency=concurrency, ordered=False):
+            self._add_rows(rows, method, request_params, response)
+
+        return {i: rows.get(str(i)) for i in ids}
+
+    async def watch(self, method, interval=15., key=None, **params):
+        """
+        Asynchronous version of :meth:`Client.watch`, an asynchronous iterator to use with ``async for``.
+        """
+
+        import asyncio
+
+        endpoint = self._endpoint(method)
+        unchanged, update = self._poller(endpoint, key)
+
+        while True:
+            started = time.monotonic()
+            response = await self.get(endpoint, params)
+            if not unchanged(response):
+                rows = [row async for row in response] if isinstance(response.data, PagedData) else response
+                for change in update(rows):
+                    yield change
+
+            delay = started + interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def get(self, endpoint, params=None):
+        """
+        :return: :class:`AbstractResponse <apisports.response.AbstractResponse>` object
+        :rtype: apisports.response.AbstractResponse
+        """
+
+        key = request_key(endpoint, params)
+
+        if self._cache is not None:
+            response = self._cache.get(self, key)
+            if response is not None:
+                return response
+
+        if self._coalescer is not None:
+            return await self._coalescer.async_call(key, lambda: self._request(endpoint, params, key))
+
+        return await self._request(endpoint, params, key)
+
+    async def _request(self, endpoint, params, key):
+        import asyncio
+        import aiohttp
+
+        # let requests encode the url, so query strings are identical to the ones sent by Client
+        url = requests.Request('GET', self._url.format(endpoint=endpoint), params=params).prepare().url
+
+        timeout = self._timeout
+        if timeout is not None:
+            connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+        headers = self._headers
+        if self._revalidator is not None:
+            headers = self._revalidator.headers(key, headers)
+
+        attempt = 0
+
+        while True:
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            try:
+                response = await self._send(endpoint, params, url, headers, timeout)
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                delay = None if self._retry is None else self._retry.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update(response)
+                if self._revalidator is not None:
+                    response = self._revalidator.update(key, response)
+
+                delay = None if self._retry is None or response.ok else self._retry.delay(attempt, response)
+                if delay is None:
+                    break
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+        if self._decode_pool is not None:
+            self._decode_pool.submit(self, response)
+
+        if self._archive is not None:
+            self._archive.append(endpoint, params, response)
+
+        if self._cache is not None:
+            self._cache.set(endpoint, key, response)
+
+        return response
+
+    async def _send(self, endpoint, params, url, headers, timeout):
+        from yarl import URL
+
+        hooks = self._hooks
+        if hooks is not None:
+            hooks.request_start(endpoint, params)
+            started = time.perf_counter()
+
+        try:
+            async with self.session.get(URL(url, encoded=True), headers=headers, **(
+                    {} if timeout is None else dict(timeout=timeout))) as http_response:
+                raw = requests.Response()
+                raw.url = url
+                raw.status_code = http_response.status
+                raw.reason = http_response.reason
+                raw.headers = requests.structures.CaseInsensitiveDict(http_response.headers)
+                raw.encoding = requests.utils.get_encoding_from_headers(raw.headers)
+                raw._content = await http_response.read()
+        except Exception as exc:
+            if hooks is not None:
+                hooks.request_end(endpoint, params, None, time.perf_counter() - started, exc)
+            raise
+
+        response = AbstractResponse.create(self, raw)
+        if hooks is not None:
+            hooks.request_end(endpoint, params, response, time.perf_counter() - started)
+        return response
+
+    async def close(self):
+        """
+        Close the session and its connection pool.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
 
 
 class ClientMeta:
     data_dir = os.path.join(os.path.dirname(__file__), 'data')
 
+    cache_dir = os.environ.get('APISPORTS_CACHE_DIR')
+    """
+    Directory to store compiled API configs in, defaults to the ``APISPORTS_CACHE_DIR`` environment variable
+    or ``__pycache__`` inside ``data_dir``.
+
+    :type: Union[str, None]
+    """
+
+    compiled_format = _registry.COMPILED_FORMAT
+
     @classmethod
     def get(cls, kind, version=None):
         if version is None:
             version = 1
         filename = os.path.join(cls.data_dir, f'{kind}-v{version}.yaml')
         try:
-            with open(filename, encoding='UTF-8') as stream:
-                config = yaml.safe_load(stream)
+            spec = cls.load(filename)
 
             return {
-                "default_host": config['servers'][0]['url'],
+                "default_host": spec['default_host'],
+                "_row_shapes": spec['shapes'],
+                "_multi_ids": spec['multi_ids'],
                 **{
-                    cls.operation_id_to_method_name(p['get']['operationId']): cls._get_method(
+                    name: cls._get_method(
                         class_name=kind,
-                        name=cls.operation_id_to_method_name(p['get']['operationId']),
-                        description=p['get']['description'] if 'description' in p['get'] else '',
-                        endpoint=k.lstrip('/'),
-                        params=[
-                            param
-                            for param in p['get']['parameters']
-                            if param['in'] == 'query'
-                        ]
-                        if 'parameters' in p['get'] else [],
-                    ) for k, p in config['paths'].items()
+                        name=name,
+                        description=description,
+                        endpoint=endpoint,
+                        params=params,
+                    ) for name, endpoint, description, params in spec['operations']
                 }
             }
-        except (KeyError, OSError, TypeError, yaml.YAMLError) as exc:
+        except (KeyError, OSError, TypeError, ValueError) as exc:
             raise ClientInitError(f"Could not load API config for {kind} from {filename}") from exc
 
+    @classmethod
+    def load(cls, filename):
+        """
+        Load the compiled API config for ``filename``, compiling (and caching) it when needed.
+
+        Compiled configs are keyed by the hash of the YAML file and the Python version, so changes to the YAML are
+        picked up automatically. The configs shipped with the package are compiled when it is built.
+
+        :param filename: Path to the OpenAPI YAML file
+        :type filename: str
+
+        :return: Compiled API config
+        :rtype: dict
+        """
+
+        return _registry.load(filename, cls.cache_dir, cls.compile)
+
+    @classmethod
+    def compile(cls, source):
+        """
+        Compile the OpenAPI YAML source into the compact form used to build the client classes.
+
+        :param source: The OpenAPI YAML source
+        :type source: Union[bytes, str]
+
+        :return: Compiled API config
+        :rtype: dict
+        """
+
+        return _registry.compile(source)
+
+    @classmethod
+    def _response_shapes(cls, paths):
+        """
+        The shapes of the ``response`` field per endpoint, see :func:`response_shapes
+        <apisports._registry.response_shapes>`.
+
+        :rtype: dict
+        """
+
+        return _registry.response_shapes(paths)
+
+    @classmethod
+    def _compiled_filename(cls, filename, source):
+        return _registry.compiled_path(filename, source, cls.cache_dir)
+
     @staticmethod
     def _get_method(class_name, name, description, endpoint, params):
-        def _(self, **kwargs):
-            return self.get(endpoint, kwargs)
-
-        _.__name__ = name
-        _.__module__ = f'apisports.{class_name}'
-
-        _.__doc__ = convert(description) + '\n\n'
-
-        for p in params:
-            _.__doc__ += ":param {name}: {description}{pattern}\n".format(**{
-                "description": '',
-                "pattern": (' (' + p['schema']['pattern'] + ')' if 'pattern' in p['schema'] else ''),
-                **p
-            })
-            if 'type' in p['schema']:
-                _.__doc__ += ":type {name}: {type}\n".format(
-                    name=p['name'] + '_' if p['name'] in kwlist else p['name'],
-                    type=p['schema']['type'],
+        return EndpointMethod(class_name, name, description, endpoint, params)
+
+    @staticmethod
+    def _get_doc(description, params):
+        from m2r import convert
+
+        doc = convert(description) + '\n\n'
+
+        for name, param_description, pattern, param_type in params:
+            doc += ":param {name}: {description}{pattern}\n".format(
+                name=name,
+                description=param_description,
+                pattern=(' (' + pattern + ')' if pattern is not None else ''),
+            )
+            if param_type is not None:
+                doc += ":type {name}: {type}\n".format(
+                    name=name + '_' if name in kwlist else name,
+                    type=param_type,
                 )
 
-        _.__doc__ += '\n:return: :class:`AbstractResponse <apisports.response.AbstractResponse>` object'
-        _.__doc__ += '\n:rtype: apisports.response.AbstractResponse'
-        return _
+        doc += '\n:return: :class:`AbstractResponse <apisports.response.AbstractResponse>` object'
+        doc += '\n:rtype: apisports.response.AbstractResponse'
+        return doc
 
     @staticmethod
     def operation_id_to_method_name(operation_id):
-        name = operation_id[4:].replace('-', '_')
+        return _registry.operation_id_to_method_name(operation_id)
+
+
+class _EndpointDoc:
+    """
+    ``__doc__`` of :class:`EndpointMethod`: the class docstring on the class, the docstring rendered on first access
+    on instances.
+    """
+
+    def __init__(self, doc):
+        self._doc = doc
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self._doc
+        if instance._doc is None:
+            instance._doc = ClientMeta._get_doc(instance._description, instance._params)
+        return instance._doc
+
+
+class EndpointMethod:
+    """
+    Method calling an API endpoint, as generated by :class:`ClientMeta`.
+
+    The docstring is only rendered (from the Markdown description in the API config) when it is first accessed, either
+    through the bound method or through the plain function returned when accessed on the class (e.g. by Sphinx).
+    """
+
+    __doc__ = _EndpointDoc(__doc__)
+
+    def __init__(self, class_name, name, description, endpoint, params):
+        self.__name__ = name
+        self.__module__ = f'apisports.{class_name}'
+        self._endpoint = endpoint
+        self._description = description
+        self._params = params
+        self._doc = None
+        self._function = None
+
+    @property
+    def endpoint(self):
+        """
+        The endpoint called, e.g. ``fixtures/events``.
+
+        :rtype: str
+        """
+
+        return self._endpoint
+
+    def __call__(self, client, **kwargs):
+        return client.get(self._endpoint, kwargs)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.function
+        return MethodType(self, instance)
+
+    @property
+    def __signature__(self):
+        from inspect import signature
+        return signature(self.function)
+
+    @property
+    def function(self):
+        """
+        Plain function equivalent of this method, including the rendered docstring.
+
+        :rtype: function
+        """
+
+        if self._function is None:
+            endpoint = self._endpoint
+
+            def _(self, **kwargs):
+                return self.get(endpoint, kwargs)
 
-        # avoid using python keywords for parameters
-        if name in kwlist:
-            name = name + '_'
+            _.__name__ = self.__name__
+            _.__module__ = self.__module__
+            _.__doc__ = self.__doc__
+            self._function = _
 
-        return name
+        return self._function
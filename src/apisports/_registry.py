@@ -0,0 +1,185 @@
+"""
+Compiling the OpenAPI YAML configs into the compact registry the client classes are built from.
+
+This module only depends on the standard library and ``yaml``, so the configs can be compiled while the package is
+built, see ``setup.py``. Use it through :class:`ClientMeta <apisports._client.ClientMeta>`.
+"""
+
+import hashlib
+import marshal
+import os
+import re
+import sys
+from keyword import kwlist
+
+#: Version of the compiled form, compiled configs of other versions are compiled again
+COMPILED_FORMAT = 5
+
+# a dash-separated list of ids, e.g. "id-id-id"; "id-id" is used for pairs (e.g. h2h) instead
+_MULTI_ID_PATTERN = re.compile(r'^id(-id){2,}$', re.IGNORECASE)
+
+
+def load(filename, cache_dir=None, compile_source=None):
+    """
+    Load the compiled API config for ``filename``, compiling (and caching) it when needed.
+
+    :param filename: Path to the OpenAPI YAML file
+    :type filename: str
+
+    :param cache_dir: Directory of the compiled configs, `None` for ``__pycache__`` next to ``filename``
+    :type cache_dir: Union[str, None]
+
+    :param compile_source: Function compiling the YAML source, defaults to :func:`compile`
+    :type compile_source: Union[Callable[[bytes], dict], None]
+
+    :return: Compiled API config
+    :rtype: dict
+    """
+
+    with open(filename, 'rb') as stream:
+        source = stream.read()
+
+    compiled_filename = compiled_path(filename, source, cache_dir)
+
+    try:
+        with open(compiled_filename, 'rb') as stream:
+            spec = marshal.load(stream)
+        if spec.get('format') == COMPILED_FORMAT:
+            return spec
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+
+    spec = (compile if compile_source is None else compile_source)(source)
+
+    try:
+        os.makedirs(os.path.dirname(compiled_filename), exist_ok=True)
+        tmp_filename = f'{compiled_filename}.{os.getpid()}.tmp'
+        with open(tmp_filename, 'wb') as stream:
+            marshal.dump(spec, stream)
+        os.replace(tmp_filename, compiled_filename)
+    except OSError:
+        # caching is best effort, e.g. on read-only installs
+        pass
+
+    return spec
+
+
+def compiled_path(filename, source, cache_dir=None):
+    """
+    Path of the compiled config of ``filename``, keyed by the hash of its ``source`` and the Python version.
+
+    :rtype: str
+    """
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(filename), '__pycache__')
+
+    # marshal data is specific to the Python version, like bytecode
+    tag = sys.implementation.cache_tag or f'marshal{marshal.version}'
+    name = os.path.splitext(os.path.basename(filename))[0]
+    digest = hashlib.sha1(source).hexdigest()[:16]
+    return os.path.join(cache_dir, f'{name}.{digest}.{tag}.marshal')
+
+
+def compile(source):
+    """
+    Compile the OpenAPI YAML source into the compact form used to build the client classes.
+
+    :param source: The OpenAPI YAML source
+    :type source: Union[bytes, str]
+
+    :return: Compiled API config
+    :rtype: dict
+    """
+
+    import yaml
+
+    try:
+        config = yaml.safe_load(source)
+    except yaml.YAMLError as exc:
+        raise ValueError(str(exc)) from exc
+
+    return {
+        "format": COMPILED_FORMAT,
+        "default_host": config['servers'][0]['url'],
+        "operations": [
+            (
+                operation_id_to_method_name(p['get']['operationId']),
+                k.lstrip('/'),
+                p['get']['description'] if 'description' in p['get'] else '',
+                [
+                    (
+                        param['name'],
+                        param['description'] if 'description' in param else '',
+                        param['schema']['pattern'] if 'pattern' in param['schema'] else None,
+                        param['schema']['type'] if 'type' in param['schema'] else None,
+                    )
+                    for param in p['get']['parameters']
+                    if param['in'] == 'query'
+                ]
+                if 'parameters' in p['get'] else [],
+            ) for k, p in config['paths'].items()
+        ],
+        "shapes": response_shapes(config['paths']),
+        "multi_ids": {
+            k.lstrip('/'): (param['name'], param.get('x-max-ids'), param['x-id-field'])
+            for k, p in config['paths'].items()
+            for param in p['get'].get('parameters', [])
+            if param['in'] == 'query' and 'x-id-field' in param
+            and _MULTI_ID_PATTERN.match(param['schema'].get('pattern', ''))
+        },
+    }
+
+
+def response_shapes(paths):
+    """
+    The shapes of the ``response`` field per endpoint, as found in the first example with a non-empty response.
+    The response schemas of the API configs do not describe the rows, so the examples are all there is.
+
+    Responses are matched on their ``get`` field, which is not always the endpoint (e.g. all ``rankings/...``
+    endpoints of Formula 1 report ``rankings``), so shapes are listed under both.
+
+    :return: Per endpoint, a list of candidate shapes. A shape is the type name (``bool``, ``int``, ``float``
+        or ``str``) for scalars, `None` for nulls, a list containing the shape of the items for lists or a tuple
+        of (key, shape) pairs for objects.
+    :rtype: dict
+    """
+
+    shapes = {}
+
+    for path, operation in paths.items():
+        try:
+            examples = operation['get']['responses']['200']['content']['application/json']['examples']
+        except (KeyError, TypeError):
+            continue
+
+        for example in examples.values():
+            value = example.get('value') if isinstance(example, dict) else None
+            if isinstance(value, dict) and value.get('response'):
+                shape = _shape(value['response'])
+                for endpoint in {path.lstrip('/'), value.get('get')} - {None}:
+                    if shape not in shapes.setdefault(endpoint, []):
+                        shapes[endpoint].append(shape)
+                break
+
+    return shapes
+
+
+def _shape(value):
+    if isinstance(value, dict) and value:
+        return tuple((key, _shape(item)) for key, item in value.items())
+    if isinstance(value, list) and value:
+        return [_shape(value[0])]
+    if isinstance(value, (bool, int, float, str)):
+        return type(value).__name__
+    return None
+
+
+def operation_id_to_method_name(operation_id):
+    name = operation_id[4:].replace('-', '_')
+
+    # avoid using python keywords for parameters
+    if name in kwlist:
+        name = name + '_'
+
+    return name
@@ -0,0 +1,313 @@
+import json
+import marshal
+import mmap
+import os
+import re
+import sqlite3
+import time
+from collections import namedtuple
+from threading import Lock
+
+import requests
+import requests.structures
+import requests.utils
+
+from ._client import request_key
+from .response import HttpErrorResponse, SuccessResponse, _UNDECODED
+
+
+class ArchiveEntry(namedtuple('ArchiveEntry', 'endpoint params fetched_at response')):
+    """
+    A response read back from an :class:`Archive`.
+
+    * ``endpoint``: the endpoint called
+    * ``params``: the request parameters
+    * ``fetched_at``: when the response was received, as UNIX timestamp
+    * ``response``: the :class:`ArchivedResponse`
+    """
+
+    __slots__ = ()
+
+
+class Archive:
+    """
+    Append-only archive of responses, e.g. for replays and backtesting. Pass an instance as ``archive`` to a
+    :class:`Client <apisports._client.Client>` to archive all of its successful responses, or :meth:`append`
+    responses yourself.
+
+    The decoded data of each response is appended in :mod:`marshal` format to a log split in segment files, indexed
+    by endpoint, parameters and time of fetching in an SQLite database. Reading back memory-maps the segments and
+    skips JSON parsing altogether, the data of a response is only loaded when it is used.
+
+    The response bodies are not kept, use the data of the responses read back.
+
+    :param directory: Directory of the archive, created if it does not exist
+    :type directory: str
+
+    :param segment_size: Size in bytes after which a new segment file is started
+    :type segment_size: int
+
+    :param client: Client whose settings apply to the responses read back (e.g. ``records=True``)
+    :type client: Union[apisports._client.Client, None]
+    """
+
+    def __init__(self, directory, segment_size=64 * 1024 * 1024, client=None):
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory = directory
+        self._segment_size = segment_size
+        self._client = client
+        self._lock = Lock()
+        self._maps = {}
+
+        self._db = sqlite3.connect(os.path.join(directory, 'index.sqlite'), check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT, endpoint TEXT, params TEXT, page INTEGER, fetched_at REAL, '
+            'segment INTEGER, offset INTEGER, length INTEGER, status INTEGER, reason TEXT, url TEXT, headers TEXT)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_key ON responses (key, fetched_at)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at)')
+
+        segments = [int(name[:-len('.segment')]) for name in os.listdir(directory) if _SEGMENT.match(name)]
+        self._segment = max(segments, default=1)
+        self._file = open(self._filename(self._segment), 'ab')
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @property
+    def records(self):
+        return getattr(self._client, 'records', None)
+
+    @property
+    def _row_shapes(self):
+        return getattr(self._client, '_row_shapes', {})
+
+    def append(self, endpoint, params, response, fetched_at=None):
+        """
+        Archive a successful response.
+
+        :param endpoint: Endpoint that was called
+        :type endpoint: str
+
+        :param params: The request parameters
+        :type params: Union[dict, None]
+
+        :param response: The response
+        :type response: apisports.response.AbstractResponse
+
+        :param fetched_at: When the response was received as UNIX timestamp, defaults to now
+        :type fetched_at: Union[float, None]
+        """
+
+        if not response.ok:
+            return
+
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        raw = response.raw
+        # marshal stores repeated objects once, so share equal strings (names, dates, statuses...) first: this makes
+        # the archive smaller and loading faster
+        blob = marshal.dumps(_share_strings(response._data, {}))
+
+        with self._lock:
+            if self._file.tell() > 0 and self._file.tell() + len(blob) > self._segment_size:
+                self._file.close()
+                self._segment += 1
+                self._file = open(self._filename(self._segment), 'ab')
+
+            offset = self._file.tell()
+            self._file.write(blob)
+            self._file.flush()
+
+            self._db.execute('INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+                request_key(endpoint, params), endpoint, json.dumps(params, sort_keys=True),
+                int(params.get('page', 1)), time.time() if fetched_at is None else fetched_at,
+                self._segment, offset, len(blob), raw.status_code, raw.reason, raw.url, json.dumps(dict(raw.headers))
+            ))
+
+    def get(self, endpoint, params=None, at=None):
+        """
+        Get the response archived last for a request.
+
+        Next pages of paged data are read from the archive as well, the pages fetched closest in time to the first
+        page are used.
+
+        :param endpoint: Endpoint that was called
+        :type endpoint: str
+
+        :param params: The request parameters
+        :type params: Union[dict, None]
+
+        :param at: Get the response archived last at or before this UNIX timestamp, `None` for the latest
+        :type at: Union[float, None]
+
+        :return: The :class:`ArchivedResponse`, or a HTTP 404 error response if there is none
+        :rtype: apisports.response.AbstractResponse
+        """
+
+        key = request_key(endpoint, params)
+        with self._lock:
+            row = self._db.execute(
+                f'SELECT {_COLUMNS} FROM responses WHERE key = ? AND fetched_at <= ? '
+                'ORDER BY fetched_at DESC LIMIT 1',
+                (key, float('inf') if at is None else at)
+            ).fetchone()
+
+        return self._response(row, key)
+
+    def replay(self, endpoint=None, since=None, until=None, pages=False):
+        """
+        Iterate over archived responses in the order they were fetched.
+
+        :param endpoint: Only responses of this endpoint, `None` for all
+        :type endpoint: Union[str, None]
+
+        :param since: Only responses fetched at or after this UNIX timestamp
+        :type since: Union[float, None]
+
+        :param until: Only responses fetched before this UNIX timestamp
+        :type until: Union[float, None]
+
+        :param pages: Include next pages of paged data, which are already available through the data of their first
+            page
+        :type pages: bool
+
+        :rtype: Iterator[ArchiveEntry]
+        """
+
+        conditions = ['fetched_at >= ?', 'fetched_at < ?']
+        args = [float('-inf') if since is None else since, float('inf') if until is None else until]
+        if endpoint is not None:
+            conditions.append('endpoint = ?')
+            args.append(endpoint)
+        if not pages:
+            conditions.append('page = 1')
+
+        with self._lock:
+            rows = self._db.execute(
+                f'SELECT key, endpoint, params, {_COLUMNS} FROM responses WHERE {" AND ".join(conditions)} '
+                'ORDER BY fetched_at',
+                args
+            ).fetchall()
+
+        for key, endpoint, params, *row in rows:
+            yield ArchiveEntry(endpoint, json.loads(params), row[0], self._response(row, key))
+
+    def close(self):
+        """
+        Close the archive files.
+        """
+
+        with self._lock:
+            self._file.close()
+            for segment in self._maps.values():
+                segment.close()
+            self._maps.clear()
+            self._db.close()
+
+    def _filename(self, segment):
+        return os.path.join(self._directory, '%06d.segment' % segment)
+
+    def _response(self, row, key):
+        if row is None:
+            return _not_archived(self, key)
+
+        fetched_at, segment, offset, length, status, reason, url, headers = row
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.url = url
+        response.headers = requests.structures.CaseInsensitiveDict(json.loads(headers))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = b''
+
+        return ArchivedResponse(_Replay(self, fetched_at), response, lambda: self._load(segment, offset, length))
+
+    def _load(self, segment, offset, length):
+        with self._lock:
+            mapped = self._maps.get(segment)
+            if mapped is None or len(mapped) < offset + length:
+                if mapped is not None:
+                    mapped.close()
+                if segment == self._segment:
+                    self._file.flush()
+                with open(self._filename(segment), 'rb') as stream:
+                    mapped = self._maps[segment] = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+            return marshal.loads(mapped[offset:offset + length])
+
+    def _nearest(self, endpoint, params, at):
+        key = request_key(endpoint, params)
+        with self._lock:
+            row = self._db.execute(
+                f'SELECT {_COLUMNS} FROM responses WHERE key = ? ORDER BY ABS(fetched_at - ?) LIMIT 1',
+                (key, at)
+            ).fetchone()
+
+        return self._response(row, key)
+
+
+_SEGMENT = re.compile(r'^\d+\.segment$')
+
+_COLUMNS = 'fetched_at, segment, offset, length, status, reason, url, headers'
+
+
+class ArchivedResponse(SuccessResponse):
+    """
+    Successful response read back from an :class:`Archive`, its data is loaded on first use.
+    """
+
+    def __init__(self, client, response, load):
+        super().__init__(client, response)
+        self._load = load
+        self._errors = None
+
+    @property
+    def _data(self):
+        if self._decoded is _UNDECODED:
+            self._decoded = self._load()
+        return self._decoded
+
+
+class _Replay:
+    """Client of archived responses, next pages of paged data are read from the archive"""
+
+    def __init__(self, archive, fetched_at):
+        self._archive = archive
+        self._fetched_at = fetched_at
+
+    @property
+    def records(self):
+        return self._archive.records
+
+    @property
+    def _row_shapes(self):
+        return self._archive._row_shapes
+
+    def get(self, endpoint, params=None):
+        return self._archive._nearest(endpoint, params, self._fetched_at)
+
+
+def _share_strings(value, strings):
+    value_type = type(value)
+
+    if value_type is str:
+        return strings.setdefault(value, value)
+    if value_type is list:
+        return [_share_strings(item, strings) for item in value]
+    if value_type is dict:
+        return {strings.setdefault(key, key): _share_strings(item, strings) for key, item in value.items()}
+    return value
+
+
+def _not_archived(client, key):
+    response = requests.Response()
+    response.status_code = 404
+    response.reason = 'Not Archived'
+    response.url = key
+    response._content = b''
+    return HttpErrorResponse(client, response, {})
@@ -0,0 +1,240 @@
+import json
+import marshal
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+
+import requests
+import requests.structures
+import requests.utils
+
+from ._client import request_key
+from .response import SuccessResponse
+
+
+class AbstractCache:
+    """
+    Base class for response caches, pass an instance as ``cache`` to a :class:`Client <apisports._client.Client>`.
+
+    Only successful responses are cached, keyed on the endpoint and the normalized request parameters.
+    When the cache is full, the least recently used responses are evicted first.
+
+    :param ttl: Default time to live in seconds, ``0`` disables caching for endpoints not in ``ttls``
+    :type ttl: float
+
+    :param ttls: Time to live in seconds per endpoint (e.g. ``{"countries": 86400}``), overrides ``ttl``
+    :type ttls: Union[dict, None]
+
+    :param max_entries: Maximum amount of cached responses, `None` for unlimited
+    :type max_entries: Union[int, None]
+
+    :param max_bytes: Maximum total size of the cached response bodies, `None` for unlimited
+    :type max_bytes: Union[int, None]
+    """
+
+    def __init__(self, ttl=60, ttls=None, max_entries=None, max_bytes=None):
+        self._ttl = ttl
+        self._ttls = {} if ttls is None else {endpoint.strip('/'): ttl for endpoint, ttl in ttls.items()}
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = Lock()
+
+    key = staticmethod(request_key)
+
+    def ttl(self, endpoint):
+        """
+        Time to live for responses of ``endpoint``.
+
+        :rtype: float
+        """
+
+        return self._ttls.get(endpoint, self._ttl)
+
+    def get(self, client, key):
+        """
+        Get a cached response.
+
+        :param client: The client requesting the response
+        :type client: apisports._client.Client
+
+        :param key: Cache key, see :func:`request_key <apisports._client.request_key>`
+        :type key: str
+
+        :return: The cached response, or `None` if not available
+        :rtype: Union[apisports.response.AbstractResponse, None]
+        """
+
+        raise NotImplementedError('get needs to be implemented in subclass')
+
+    def set(self, endpoint, key, response):
+        """
+        Cache a response, if it is successful and ``endpoint`` has a time to live.
+
+        :param endpoint: Endpoint that was called
+        :type endpoint: str
+
+        :param key: Cache key, see :func:`request_key <apisports._client.request_key>`
+        :type key: str
+
+        :param response: The response to cache
+        :type response: apisports.response.AbstractResponse
+        """
+
+        ttl = self.ttl(endpoint)
+        if ttl <= 0 or not response.ok:
+            return
+
+        self._set(key, response, ttl)
+
+    def _set(self, key, response, ttl):
+        raise NotImplementedError('_set needs to be implemented in subclass')
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+
+        raise NotImplementedError('clear needs to be implemented in subclass')
+
+    def _full(self, entries, size):
+        return (self._max_entries is not None and entries > self._max_entries) or \
+            (self._max_bytes is not None and size > self._max_bytes)
+
+
+class MemoryCache(AbstractCache):
+    """
+    In-memory cache, cached hits return the same response object, skipping both the HTTP request and JSON decoding.
+    """
+
+    def __init__(self, ttl=60, ttls=None, max_entries=1024, max_bytes=None):
+        super().__init__(ttl=ttl, ttls=ttls, max_entries=max_entries, max_bytes=max_bytes)
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, client, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            expires, size, response = self._entries[key]
+            if expires < time.monotonic():
+                del self._entries[key]
+                self._size -= size
+                return None
+
+            self._entries.move_to_end(key)
+            return response
+
+    def _set(self, key, response, ttl):
+        size = len(response.raw.content)
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+
+            self._entries[key] = (time.monotonic() + ttl, size, response)
+            self._size += size
+
+            while self._entries and self._full(len(self._entries), self._size):
+                self._size -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SqliteCache(AbstractCache):
+    """
+    On-disk cache using SQLite, can be shared between processes and survives restarts.
+
+    Next to the response body, the decoded data is stored in :mod:`marshal` format, so cached hits skip the HTTP
+    request and JSON decoding.
+
+    :param filename: Path of the SQLite database, created if it does not exist
+    :type filename: str
+    """
+
+    def __init__(self, filename, ttl=60, ttls=None, max_entries=None, max_bytes=None):
+        super().__init__(ttl=ttl, ttls=ttls, max_entries=max_entries, max_bytes=max_bytes)
+        self._db = sqlite3.connect(filename, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, expires REAL, used REAL, size INTEGER, '
+            'status INTEGER, reason TEXT, url TEXT, headers TEXT, body BLOB, data BLOB)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_used ON responses (used)')
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get(self, client, key):
+        now = time.time()
+
+        with self._lock:
+            row = self._db.execute(
+                'SELECT expires, status, reason, url, headers, body, data FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            expires, status, reason, url, headers, body, data = row
+            if expires < now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+
+            self._db.execute('UPDATE responses SET used = ? WHERE key = ?', (now, key))
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.url = url
+        response.headers = requests.structures.CaseInsensitiveDict(json.loads(headers))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = body
+
+        return SuccessResponse(client, response, marshal.loads(data))
+
+    def _set(self, key, response, ttl):
+        raw = response.raw
+        now = time.time()
+        row = (
+            key, now + ttl, now, len(raw.content), raw.status_code, raw.reason, raw.url,
+            json.dumps(dict(raw.headers)), raw.content, marshal.dumps(response._data)
+        )
+
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+
+            entries, size = self._db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+            if not self._full(entries, size):
+                return
+
+            # evict least recently used entries until within limits
+            evict = []
+            for evict_key, evict_size in self._db.execute('SELECT key, size FROM responses ORDER BY used'):
+                if not self._full(entries, size):
+                    break
+                evict.append((evict_key,))
+                entries -= 1
+                size -= evict_size
+            self._db.executemany('DELETE FROM responses WHERE key = ?', evict)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+
+        with self._lock:
+            self._db.close()
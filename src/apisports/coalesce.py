@@ -0,0 +1,102 @@
+from concurrent.futures import Future
+from threading import Lock
+
+
+class Coalescer:
+    """
+    Single-flight deduplication of identical requests, enable with ``coalesce=True`` on a
+    :class:`Client <apisports._client.Client>`.
+
+    While a request is in flight, identical requests (same endpoint and normalized parameters) wait for it and
+    receive the same :class:`AbstractResponse <apisports.response.AbstractResponse>` instead of calling the API.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._in_flight = {}
+        self._async_in_flight = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self):
+        """
+        Counters: ``calls`` made and how many of them were ``coalesced`` into a request already in flight.
+
+        :rtype: dict
+        """
+
+        with self._lock:
+            return dict(calls=self._calls, coalesced=self._coalesced)
+
+    def call(self, key, func):
+        """
+        Call ``func``, unless a call for ``key`` is already in flight, then wait for and return its result.
+
+        :param key: Request key
+        :type key: str
+
+        :param func: Performs the request
+        :type func: Callable[[], apisports.response.AbstractResponse]
+
+        :rtype: apisports.response.AbstractResponse
+        """
+
+        with self._lock:
+            self._calls += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._coalesced += 1
+            else:
+                leader = self._in_flight[key] = Future()
+
+        if future is not None:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            leader.set_exception(exc)
+            raise
+        else:
+            leader.set_result(result)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+        return result
+
+    async def async_call(self, key, func):
+        """
+        Asynchronous version of :meth:`call`, ``func`` returns an awaitable.
+
+        :param key: Request key
+        :type key: str
+
+        :param func: Performs the request
+        :type func: Callable[[], Awaitable[apisports.response.AbstractResponse]]
+
+        :rtype: apisports.response.AbstractResponse
+        """
+
+        import asyncio
+
+        async def request():
+            try:
+                return await func()
+            finally:
+                with self._lock:
+                    del self._async_in_flight[key]
+
+        with self._lock:
+            self._calls += 1
+            task = self._async_in_flight.get(key)
+            if task is not None:
+                self._coalesced += 1
+            else:
+                # the request runs as its own task, so cancelling any of the callers doesn't cancel it for the others
+                task = self._async_in_flight[key] = asyncio.ensure_future(request())
+                # don't warn about never retrieved exceptions when all callers were cancelled
+                task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+        return await asyncio.shield(task)
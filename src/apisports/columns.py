@@ -0,0 +1,180 @@
+import json
+
+from ._client import _field_path, _lookup
+from .records import _asdict
+
+_KINDS = ('bool', 'int', 'float', 'str')
+
+
+def to_columns(rows, fields, shape=None, backend='auto'):
+    """
+    Collect fields of ``rows`` into arrays, walking the rows once.
+
+    Fields are dotted paths into the rows, e.g. ``player.age``, numbers index lists (``statistics.0.team.name``).
+    Missing fields and nulls are masked.
+
+    The type of a column is the type of the field in the example response of the API config, when known and the
+    values fit. Otherwise, it is inferred from the values: ``bool``, ``int``, ``float`` or ``str`` if all values
+    agree, an ``object`` column if they don't (e.g. nested objects).
+
+    :param rows: The rows
+    :type rows: Iterable[Union[dict, apisports.records.Record]]
+
+    :param fields: Dotted field paths
+    :type fields: Sequence[str]
+
+    :param shape: Shape of the rows, see :class:`RecordFactory <apisports.records.RecordFactory>`
+    :type shape: Union[tuple, None]
+
+    :param backend: ``numpy`` for :class:`numpy.ma.MaskedArray`, ``arrow`` for :class:`pyarrow.Array` or ``auto``
+        for Arrow when ``pyarrow`` is installed, NumPy otherwise
+    :type backend: str
+
+    :return: Array per field, in the order of ``fields``
+    :rtype: dict
+    """
+
+    build = _builder(backend)
+
+    paths = [_field_path(field) for field in fields]
+    columns = [[] for _ in paths]
+    lookups = list(zip(paths, columns))
+
+    for row in rows:
+        for path, column in lookups:
+            column.append(_lookup(row, path))
+
+    return {
+        field: build(column, _kind(_declared_kind(shape, path), column))
+        for field, path, column in zip(fields, paths, columns)
+    }
+
+
+def concat_columns(parts, fields):
+    """
+    Concatenate the columns of consecutive parts of the rows, e.g. of every page.
+
+    :param parts: Arrays per field of every part, as returned by :func:`to_columns`, all built using the same backend
+    :type parts: Sequence[dict]
+
+    :param fields: Dotted field paths
+    :type fields: Sequence[str]
+
+    :return: Array per field, in the order of ``fields``
+    :rtype: dict
+    """
+
+    return {field: _concat([part[field] for part in parts]) for field in fields}
+
+
+def _concat(arrays):
+    if len(arrays) == 1:
+        return arrays[0]
+
+    module = type(arrays[0]).__module__
+    if module.startswith('numpy'):
+        import numpy
+        return numpy.ma.concatenate(arrays)
+
+    import pyarrow
+    try:
+        return pyarrow.concat_arrays(arrays)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # the parts ended up with different types, e.g. a field that is null on a whole page
+        column = [value for array in arrays for value in array.to_pylist()]
+        return _arrow_array(pyarrow, column, _kind(None, column))
+
+
+def _builder(backend):
+    if backend == 'auto':
+        try:
+            import pyarrow
+            return lambda column, kind: _arrow_array(pyarrow, column, kind)
+        except ImportError:
+            backend = 'numpy'
+
+    if backend == 'arrow':
+        try:
+            import pyarrow
+        except ImportError as exc:
+            raise ImportError("Arrow columns require pyarrow, install apisports[arrow]") from exc
+        return lambda column, kind: _arrow_array(pyarrow, column, kind)
+
+    if backend == 'numpy':
+        try:
+            import numpy
+        except ImportError as exc:
+            raise ImportError("NumPy columns require numpy, install apisports[numpy]") from exc
+        return lambda column, kind: _numpy_array(numpy, column, kind)
+
+    raise ValueError(f"Unknown backend {backend!r}, use 'numpy', 'arrow' or 'auto'")
+
+
+def _declared_kind(shape, path):
+    for key in path:
+        if type(key) is int:
+            if type(shape) is not list:
+                return None
+            shape = shape[0]
+        elif type(shape) is tuple:
+            shape = dict(shape).get(key)
+        else:
+            return None
+
+    return shape if shape in _KINDS else None
+
+
+def _kind(declared, column):
+    types = {type(value) for value in column if value is not None}
+
+    if not types:
+        return declared or 'object'
+
+    if types <= {bool}:
+        kind = 'bool'
+    elif types <= {int}:
+        kind = 'int'
+    elif types <= {int, float}:
+        kind = 'float'
+    elif types <= {str}:
+        kind = 'str'
+    else:
+        return 'object'
+
+    # e.g. an integer field declared as float, because the example happened to have a fraction
+    if declared == 'float' and kind == 'int':
+        return declared
+
+    return kind
+
+
+_NUMPY_TYPES = {'bool': ('bool', False), 'int': ('int64', 0), 'float': ('float64', 0.)}
+
+_ARROW_TYPES = {'bool': 'bool_', 'int': 'int64', 'float': 'float64', 'str': 'string'}
+
+
+def _numpy_array(numpy, column, kind):
+    mask = [value is None for value in column]
+
+    if kind in _NUMPY_TYPES:
+        dtype, fill = _NUMPY_TYPES[kind]
+        values = numpy.array([fill if value is None else value for value in column], dtype=dtype)
+    else:
+        # filled one by one, numpy would turn nested lists into extra dimensions
+        values = numpy.empty(len(column), dtype=object)
+        for index, value in enumerate(column):
+            values[index] = value
+
+    return numpy.ma.MaskedArray(values, mask=mask)
+
+
+def _arrow_array(pyarrow, column, kind):
+    if kind in _ARROW_TYPES:
+        return pyarrow.array(column, type=getattr(pyarrow, _ARROW_TYPES[kind])())
+
+    column = [_asdict(value) for value in column]
+    try:
+        return pyarrow.array(column)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        # mixed types, fall back to their JSON representation
+        return pyarrow.array([None if value is None else json.dumps(value) for value in column], type=pyarrow.string())
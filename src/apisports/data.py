@@ -1,11 +1,29 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from .records import shape_index
+
+
 class PagedDataError(Exception):
-    """Raised when :class:`PagedData` encounters an error when fetching the next page"""
+    """
+    Raised when :class:`PagedData` encounters an error when fetching the next page.
+
+    The rows fetched so far are kept, see :meth:`PagedData.resume` to continue from the failed :attr:`page`.
+    """
 
-    def __init__(self, message, error_description=''):
+    def __init__(self, message, error_description='', page=None):
         super().__init__(': '.join((message, error_description)))
 
+        #: The page that could not be fetched, `None` if not applicable
+        self.page = page
+
 
 class AbstractData:
+    # shape of the rows according to the API config, see :class:`RecordFactory <apisports.records.RecordFactory>`
+    _row_shape = None
+
     @staticmethod
     def create(client, data):
         """
@@ -21,26 +39,112 @@ class AbstractData:
         if 'response' not in data or data['response'] is None:
             return NoneData
 
+        records = getattr(client, 'records', None)
+        if records is not None and 'get' in data:
+            data = {**data, 'response': records.convert(data['get'], data['response'])}
+
         response = data['response']
 
         if 'paging' in data and \
                 data['paging']['total'] > 1 and \
                 data['paging']['current'] == 1:
-            return PagedData(client, data)
+            result = PagedData(client, data)
+        elif type(response) is not list:
+            result = SingleData(response)
+        elif len(response) == 0:
+            return NoneData
+        elif len(response) == 1:
+            result = SingleData(response[0])
+        else:
+            result = SimpleData(response)
 
-        if type(response) is not list:
-            return SingleData(response)
+        shapes = getattr(client, '_row_shapes', {}).get(data.get('get'))
+        if shapes:
+            shape = shapes[shape_index(shapes, response)]
+            result._row_shape = shape[0] if type(shape) is list else shape
 
-        length = len(response)
-        if length == 0:
-            return NoneData
-        if length == 1:
-            return SingleData(response[0])
-        return SimpleData(response)
+        return result
 
     def __iter__(self):
         raise NotImplementedError('__iter__ needs to be implemented in subclass')
 
+    async def __aiter__(self):
+        """
+        Asynchronous iteration, for use with :class:`AsyncClient <apisports._client.AsyncClient>` responses.
+        """
+
+        for row in self:
+            yield row
+
+    def prefetch(self, concurrency=4):
+        """
+        Iterate while fetching upcoming pages concurrently, only differs from normal iteration for :class:`PagedData`.
+
+        :param concurrency: Maximum number of pages fetched at the same time
+        :type concurrency: int
+
+        :return: Iterator over all rows, in page order
+        :rtype: Iterator
+        """
+
+        return iter(self)
+
+    def stream(self, concurrency=None):
+        """
+        Iterate without keeping fetched data in memory, only differs from normal iteration for :class:`PagedData`.
+
+        :param concurrency: Maximum number of pages fetched at the same time
+        :type concurrency: Union[int, None]
+
+        :return: Iterator over all rows, in page order
+        :rtype: Iterator
+        """
+
+        return iter(self)
+
+    def to_columns(self, fields, backend='auto', concurrency=None):
+        """
+        Collect fields of all rows into arrays, e.g. ``data.to_columns(['player.name', 'player.age'])``.
+
+        Rows are walked once, for :class:`PagedData` using :meth:`stream`. See
+        :func:`to_columns <apisports.columns.to_columns>` for the field paths, types and backends.
+
+        :param fields: Dotted field paths
+        :type fields: Sequence[str]
+
+        :param backend: ``numpy``, ``arrow`` or ``auto`` (Arrow if ``pyarrow`` is installed)
+        :type backend: str
+
+        :param concurrency: Maximum number of pages fetched at the same time, `None` fetches pages one by one
+        :type concurrency: Union[int, None]
+
+        :return: :class:`numpy.ma.MaskedArray` or :class:`pyarrow.Array` per field
+        :rtype: dict
+        """
+
+        from .columns import to_columns
+
+        return to_columns(self.stream(concurrency), fields, shape=self._row_shape, backend=backend)
+
+    async def to_columns_async(self, fields, backend='auto'):
+        """
+        Collect fields of all rows into arrays like :meth:`to_columns`, for use with
+        :class:`AsyncClient <apisports._client.AsyncClient>` responses: next pages are fetched with ``async for``.
+
+        :param fields: Dotted field paths
+        :type fields: Sequence[str]
+
+        :param backend: ``numpy``, ``arrow`` or ``auto`` (Arrow if ``pyarrow`` is installed)
+        :type backend: str
+
+        :return: :class:`numpy.ma.MaskedArray` or :class:`pyarrow.Array` per field
+        :rtype: dict
+        """
+
+        from .columns import to_columns
+
+        return to_columns([row async for row in self], fields, shape=self._row_shape, backend=backend)
+
     def __len__(self):
         raise NotImplementedError('__len__ needs to be implemented in subclass')
 
@@ -132,7 +236,13 @@ class PagedData(AbstractData):
         # estimate of the amount of elements (maximum)
         self._length = data['results'] * (self._total_pages - self._current_page + 1)
 
-        self._data = data['response']
+        # a copy, as next pages are added to it and the response data may be shared, e.g. by revalidated responses
+        self._data = list(data['response'])
+        # index in _data of the first row of each page fetched, starting at _first_page
+        self._first_page = self._current_page
+        self._offsets = [0]
+        # guards fetching and adding pages, the object may be shared between threads
+        self._lock = Lock()
         self._get = data['get'] if 'get' in data else None
         self._parameters = data['parameters'] if 'parameters' in data else {}
 
@@ -143,37 +253,286 @@ class PagedData(AbstractData):
 
         return self._length
 
-    def _fetch_next_page(self):
+    def _next_page_params(self):
         if self._get is None:
             raise PagedDataError("Don't know how to fetch next page", "no request-uri known")
 
         if self._client is None:
             raise PagedDataError("Don't know how to fetch next page", "no client class known")
 
-        result = self._client.get(
-            self._get,
-            {
-                **self._parameters,
-                "page": self._current_page + 1
-            })
+        return {
+            **self._parameters,
+            "page": self._current_page + 1
+        }
+
+    def _add_page(self, result, page):
         if not result.ok:
-            raise PagedDataError("Could not fetch next page", result.error_description)
+            raise PagedDataError("Could not fetch next page", result.error_description, page)
+        self._offsets.append(len(self._data))
         self._data += list(iter(result.data))
-        self._current_page += 1
+        self._current_page = page
+
+    async def _async_fetch_next_page(self):
+        params = self._next_page_params()
+        hooks = getattr(self._client, '_hooks', None)
+        started = 0. if hooks is None else time.perf_counter()
+        result = await self._client.get(self._get, params)
+        if hooks is not None:
+            hooks.page(self._get, params['page'], time.perf_counter() - started)
+        with self._lock:
+            # another iteration may have added the page in the meantime
+            if params['page'] == self._current_page + 1:
+                self._add_page(result, params['page'])
+
+    def _pages(self, concurrency=None, start=None):
+        """
+        Yield the page number and response of all pages after the already fetched ones (or from page ``start`` on),
+        in page order.
 
-    def __iter__(self):
-        for row in self._data:
-            yield row
+        When ``concurrency`` is given, up to that many pages are fetched at the same time using a thread pool.
+        """
+
+        if start is None:
+            start = self._current_page + 1
+
+        if start > self._total_pages:
+            return
 
-        if self._current_page >= self._total_pages:
+        params = self._next_page_params()
+        pages = range(start, self._total_pages + 1)
+        hooks = getattr(self._client, '_hooks', None)
+
+        if concurrency is None:
+            for page in pages:
+                started = 0. if hooks is None else time.perf_counter()
+                result = self._client.get(self._get, {**params, "page": page})
+                if hooks is not None:
+                    hooks.page(self._get, page, time.perf_counter() - started)
+                yield page, result
             return
 
-        length = len(self._data)
-        while self._current_page < self._total_pages:
-            self._fetch_next_page()
-            for i in range(len(self._data) - length):
-                yield self._data[i + length]
-            length = len(self._data)
+        futures = deque()
+
+        def result():
+            page, future = futures.popleft()
+            started = 0. if hooks is None else time.perf_counter()
+            response = future.result()
+            if hooks is not None:
+                hooks.page(self._get, page, time.perf_counter() - started)
+            return page, response
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                for page in pages:
+                    futures.append((page, executor.submit(self._client.get, self._get, {**params, "page": page})))
+                    if len(futures) >= concurrency:
+                        yield result()
+                while futures:
+                    yield result()
+            finally:
+                # stopped early (error or abandoned iterator), don't start any pending requests
+                for _, future in futures:
+                    future.cancel()
+
+    def _check_sync(self, method):
+        """Raise a :class:`TypeError` when ``method`` would need to await the client for the next pages"""
+
+        from ._client import AsyncClient
+
+        if isinstance(self._client, AsyncClient):
+            raise TypeError(f'{method}() needs a synchronous client to fetch next pages, use "async for" '
+                            f'or to_columns_async() with an AsyncClient')
+
+    def _fetched(self):
+        """The amount of rows and the last page fetched so far, consistent with each other"""
+
+        with self._lock:
+            return len(self._data), self._current_page
+
+    def _iter_pages(self, concurrency=None, start=0):
+        """
+        Yield the rows from index ``start`` on, fetching the next pages when needed.
+
+        Rows are yielded by index and the next page is only fetched (and added) when no other iteration did so in
+        the meantime, so several threads can iterate over the same object, e.g. a response shared by coalesced
+        requests or a cache.
+        """
+
+        index = start
+        pages = None
+        next_page = None
+
+        try:
+            while True:
+                while index < len(self._data):
+                    yield self._data[index]
+                    index += 1
+
+                with self._lock:
+                    if index < len(self._data):
+                        # added by another iteration while waiting for the lock
+                        continue
+
+                    if self._current_page >= self._total_pages:
+                        # update length to precise length
+                        self._length = len(self._data)
+                        return
+
+                    if pages is not None and next_page != self._current_page + 1:
+                        # other iterations added pages in the meantime, don't request these again
+                        pages.close()
+                        pages = None
+
+                    if pages is None:
+                        pages = self._pages(concurrency, self._current_page + 1)
+
+                    page, result = next(pages)
+                    next_page = page + 1
+                    self._add_page(result, page)
+        finally:
+            if pages is not None:
+                pages.close()
+
+    def __iter__(self):
+        self._check_sync('__iter__')
+        return self._iter_pages()
+
+    def prefetch(self, concurrency=4):
+        """
+        Iterate over all rows, fetching up to ``concurrency`` of the remaining pages at the same time using a thread
+        pool. Rows are still yielded in page order.
+
+        :param concurrency: Maximum number of pages fetched at the same time
+        :type concurrency: int
+
+        :return: Iterator over all rows
+        :rtype: Iterator
+        """
+
+        self._check_sync('prefetch')
+        return self._iter_pages(concurrency)
+
+    def resume(self, concurrency=None):
+        """
+        Continue an iteration interrupted by a :class:`PagedDataError`: iterate over the rows of the pages that were
+        not fetched yet, starting at the failed page. Pages fetched before are not requested again.
+
+        .. code-block:: python3
+
+            rows = []
+            try:
+                rows.extend(data)
+            except PagedDataError:
+                time.sleep(60)
+                rows.extend(data.resume())
+
+        :param concurrency: Maximum number of pages fetched at the same time, `None` fetches pages one by one
+        :type concurrency: Union[int, None]
+
+        :return: Iterator over the remaining rows, in page order
+        :rtype: Iterator
+        """
+
+        self._check_sync('resume')
+        return self._iter_pages(concurrency, self._fetched()[0])
+
+    def stream(self, concurrency=None, page=None):
+        """
+        Iterate over all rows without keeping the fetched pages, each page is released once its rows are consumed.
+
+        Memory use is bounded by the first page plus the pages being fetched, regardless of the amount of pages.
+        Pages fetched this way are not available for subsequent iterations.
+
+        :param concurrency: Maximum number of pages fetched at the same time, `None` fetches pages one by one
+        :type concurrency: Union[int, None]
+
+        :param page: Only iterate over the rows from this page on, e.g. the :attr:`PagedDataError.page` of an
+            interrupted stream, `None` for all rows
+        :type page: Union[int, None]
+
+        :return: Iterator over all rows, in page order
+        :rtype: Iterator
+        """
+
+        self._check_sync('stream')
+        return self._stream(concurrency, page)
+
+    def _stream(self, concurrency, page):
+        if page is None or page <= self._first_page:
+            page = self._first_page
+
+        length, current_page = self._fetched()
+        if page <= current_page:
+            for i in range(self._offsets[page - self._first_page], length):
+                yield self._data[i]
+            page = current_page + 1
+
+        for page, result in self._pages(concurrency, page):
+            if not result.ok:
+                raise PagedDataError("Could not fetch next page", result.error_description, page)
+            yield from result.data
+
+    def to_columns(self, fields, backend='auto', concurrency=None):
+        """
+        Collect fields of all rows into arrays, see :meth:`AbstractData.to_columns`.
+
+        With a :class:`DecodePool <apisports.decodepool.DecodePool>` on the client, the columns of the pages still to
+        be fetched are built by its worker processes, the rows are never decoded in this process. Pages the pool
+        can't handle (e.g. with a ``json_decoder`` that can't be pickled) are decoded here instead.
+        """
+
+        self._check_sync('to_columns')
+
+        pool = getattr(self._client, 'decode_pool', None)
+        if pool is None:
+            return super().to_columns(fields, backend=backend, concurrency=concurrency)
+
+        from .columns import concat_columns, to_columns
+
+        length, current_page = self._fetched()
+        parts = [to_columns(self._data[:length], fields, shape=self._row_shape, backend=backend)]
+        futures = []
+
+        for page, result in self._pages(concurrency, current_page + 1):
+            if not result.ok:
+                raise PagedDataError("Could not fetch next page", result.error_description, page)
+            # the rows themselves are not needed, unless the response is used elsewhere
+            if result._pending is not None and result._pending.cancel():
+                result._pending = None
+            try:
+                future = pool.columns(self._client, result.raw.content, fields, self._row_shape, backend)
+            except Exception:
+                future = None
+            futures.append((result, future))
+
+        for result, future in futures:
+            columns = None
+            if future is not None:
+                try:
+                    columns = future.result()
+                except Exception:
+                    # e.g. a broken pool or a decoder that can not be sent to other processes, build them here instead
+                    pass
+            if columns is None:
+                columns = to_columns(result.data, fields, shape=self._row_shape, backend=backend)
+            parts.append(columns)
+
+        return concat_columns(parts, fields)
+
+    async def __aiter__(self):
+        """
+        Asynchronous iteration, awaits the :class:`AsyncClient <apisports._client.AsyncClient>` for next pages.
+        """
+
+        index = 0
+        while True:
+            while index < len(self._data):
+                yield self._data[index]
+                index += 1
+
+            if self._current_page >= self._total_pages:
+                break
+
+            await self._async_fetch_next_page()
 
-        # update length to precise length
-        self._length = length
+        self._length = len(self._data)
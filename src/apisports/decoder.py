@@ -0,0 +1,66 @@
+import json
+
+
+def _orjson():
+    import orjson
+    return orjson.loads
+
+
+def _simdjson():
+    import simdjson
+    return simdjson.loads
+
+
+def _ujson():
+    import ujson
+    return ujson.loads
+
+
+def _json():
+    return json.loads
+
+
+_decoders = {
+    'orjson': _orjson,
+    'simdjson': _simdjson,
+    'ujson': _ujson,
+    'json': _json,
+}
+
+_auto = None
+
+
+def get_decoder(name='auto'):
+    """
+    Get a JSON decoder, decoding straight from the response body bytes.
+
+    :param name: ``"auto"`` for the fastest installed decoder (orjson, simdjson, ujson or the standard library json
+        module, in that order), one of ``"orjson"``, ``"simdjson"``, ``"ujson"``, ``"json"``, or a callable taking
+        the response body as bytes and returning the decoded data.
+    :type name: Union[str, Callable[[bytes], Any]]
+
+    :return: The decoder, raises :class:`ValueError` (or a subclass) on invalid JSON
+    :rtype: Callable[[bytes], Any]
+    """
+
+    global _auto
+
+    if callable(name):
+        return name
+
+    if name == 'auto':
+        if _auto is None:
+            for factory in _decoders.values():
+                try:
+                    _auto = factory()
+                    break
+                except ImportError:
+                    continue
+        return _auto
+
+    try:
+        factory = _decoders[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON decoder {name!r}, expected one of: auto, {', '.join(_decoders)}") from None
+
+    return factory()
@@ -0,0 +1,346 @@
+from bisect import bisect_left
+from threading import Lock
+
+
+class Listener:
+    """
+    Base class of instrumentation listeners, register instances with ``hooks`` on a
+    :class:`Client <apisports._client.Client>` or through :attr:`Client.hooks <apisports._client.Client.hooks>`.
+
+    Override the events of interest, they are called synchronously from the thread (or event loop) doing the work,
+    so keep them short. Durations are in seconds.
+    """
+
+    def request_start(self, endpoint, params):
+        """
+        A HTTP request is about to be sent, retries are requests of their own.
+
+        :param endpoint: The endpoint
+        :type endpoint: str
+
+        :param params: The request parameters
+        :type params: Union[dict, None]
+        """
+
+    def request_end(self, endpoint, params, response, duration, error=None):
+        """
+        A HTTP request has completed, the body is received but not decoded yet.
+
+        :param endpoint: The endpoint
+        :type endpoint: str
+
+        :param params: The request parameters
+        :type params: Union[dict, None]
+
+        :param response: The response, `None` when the request failed with ``error``
+        :type response: Union[apisports.response.AbstractResponse, None]
+
+        :param duration: Time from sending the request until the body was received
+        :type duration: float
+
+        :param error: The exception raised by the HTTP library, if any
+        :type error: Union[Exception, None]
+        """
+
+    def decode(self, size, duration):
+        """
+        A response body has been decoded, which happens on first use of its data.
+
+        :param size: Size of the body in bytes
+        :type size: int
+
+        :param duration: Time spent decoding
+        :type duration: float
+        """
+
+    def page(self, endpoint, page, wait):
+        """
+        Iterating :class:`PagedData <apisports.data.PagedData>` has moved on to the next page.
+
+        :param endpoint: The endpoint
+        :type endpoint: str
+
+        :param page: The page number
+        :type page: int
+
+        :param wait: Time the iteration was blocked waiting for the page to be fetched, (close to) zero when it was
+            prefetched
+        :type wait: float
+        """
+
+
+class Hooks:
+    """
+    The listeners registered on a client, forwards every event to each of them.
+
+    :param listeners: The listeners
+    :type listeners: Iterable[Listener]
+    """
+
+    def __init__(self, listeners=()):
+        self._listeners = tuple(listeners)
+
+    def __iter__(self):
+        return iter(self._listeners)
+
+    def __len__(self):
+        return len(self._listeners)
+
+    def add(self, listener):
+        """
+        Register a listener.
+
+        :param listener: The listener
+        :type listener: Listener
+
+        :return: ``listener``
+        :rtype: Listener
+        """
+
+        self._listeners += (listener,)
+        return listener
+
+    def remove(self, listener):
+        """
+        Unregister a listener.
+
+        :param listener: The listener
+        :type listener: Listener
+        """
+
+        self._listeners = tuple(registered for registered in self._listeners if registered is not listener)
+
+    def request_start(self, endpoint, params):
+        for listener in self._listeners:
+            listener.request_start(endpoint, params)
+
+    def request_end(self, endpoint, params, response, duration, error=None):
+        for listener in self._listeners:
+            listener.request_end(endpoint, params, response, duration, error)
+
+    def decode(self, size, duration):
+        for listener in self._listeners:
+            listener.decode(size, duration)
+
+    def page(self, endpoint, page, wait):
+        for listener in self._listeners:
+            listener.page(endpoint, page, wait)
+
+
+class Histogram:
+    """
+    Counts of observed values per bucket, like a Prometheus histogram.
+
+    Not thread-safe on its own, :class:`MetricsCollector` takes care of locking.
+
+    :param buckets: Upper bounds of the buckets, in increasing order, a last bucket without upper bound is added
+    :type buckets: Sequence[float]
+    """
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.
+
+    def observe(self, value):
+        """
+        Add an observed value.
+
+        :type value: float
+        """
+
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        Estimate a quantile, by linear interpolation within the bucket holding it.
+
+        :param q: The quantile, between 0 and 1 (e.g. ``.99``)
+        :type q: float
+
+        :return: The estimate, `None` if nothing was observed
+        :rtype: Union[float, None]
+        """
+
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1] if self.buckets else None
+                lower = self.buckets[index - 1] if index else 0.
+                return lower + (self.buckets[index] - lower) * (rank - seen) / count
+            seen += count
+
+        return self.buckets[-1] if self.buckets else None
+
+
+#: Buckets of the duration histograms, in seconds
+DURATION_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1., 2.5, 5., 10.)
+
+#: Buckets of the response size histograms, in bytes
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+_QUOTA = ('requests_limit', 'requests_remaining', 'rate_limit', 'rate_limit_remaining')
+
+
+class MetricsCollector(Listener):
+    """
+    Collects request, decode and paging metrics in memory, per endpoint, and the latest rate limit headers.
+
+    .. code-block:: python3
+
+        metrics = MetricsCollector()
+        api = Football(api_key='XXXXXXXX', hooks=[metrics])
+        ...
+        print(metrics.histogram('request_duration_seconds', 'players').quantile(.99))
+        print(metrics.prometheus())
+    """
+
+    def __init__(self, duration_buckets=DURATION_BUCKETS, size_buckets=SIZE_BUCKETS):
+        self._duration_buckets = duration_buckets
+        self._size_buckets = size_buckets
+        self._lock = Lock()
+        self._histograms = {}
+        self._requests = {}
+        self._quota = {}
+
+    def _observe(self, name, label, value, buckets):
+        histogram = self._histograms.get((name, label))
+        if histogram is None:
+            histogram = self._histograms[(name, label)] = Histogram(buckets)
+        histogram.observe(value)
+
+    def request_end(self, endpoint, params, response, duration, error=None):
+        status = type(error).__name__ if response is None else str(response.raw.status_code)
+
+        with self._lock:
+            self._requests[(endpoint, status)] = self._requests.get((endpoint, status), 0) + 1
+            self._observe('request_duration_seconds', endpoint, duration, self._duration_buckets)
+
+            if response is None:
+                return
+
+            self._observe('response_bytes', endpoint, len(response.raw.content), self._size_buckets)
+
+            headers = response.headers
+            for name in _QUOTA:
+                value = getattr(headers, name)
+                if value is not None:
+                    try:
+                        self._quota[name] = float(value)
+                    except ValueError:
+                        pass
+
+    def decode(self, size, duration):
+        with self._lock:
+            self._observe('decode_duration_seconds', None, duration, self._duration_buckets)
+
+    def page(self, endpoint, page, wait):
+        with self._lock:
+            self._observe('page_wait_seconds', endpoint, wait, self._duration_buckets)
+
+    def histogram(self, name, endpoint=None):
+        """
+        Get a histogram: ``request_duration_seconds``, ``response_bytes`` or ``page_wait_seconds`` of an endpoint, or
+        ``decode_duration_seconds``.
+
+        :return: The histogram, `None` if nothing was observed
+        :rtype: Union[Histogram, None]
+        """
+
+        with self._lock:
+            return self._histograms.get((name, endpoint))
+
+    @property
+    def quota(self):
+        """
+        Latest rate limit header values: ``requests_limit``, ``requests_remaining`` (daily), ``rate_limit`` and
+        ``rate_limit_remaining`` (per minute), see :class:`Headers <apisports.response.Headers>`.
+
+        :rtype: dict
+        """
+
+        with self._lock:
+            return dict(self._quota)
+
+    @property
+    def requests(self):
+        """
+        Number of requests per ``(endpoint, status)``, the status being the HTTP status code or the name of the
+        exception when no response was received.
+
+        :rtype: dict
+        """
+
+        with self._lock:
+            return dict(self._requests)
+
+    def prometheus(self, prefix='apisports_'):
+        """
+        Export the metrics in the Prometheus text exposition format, e.g. to serve on a ``/metrics`` endpoint.
+
+        :param prefix: Prefix of the metric names
+        :type prefix: str
+
+        :rtype: str
+        """
+
+        lines = []
+
+        with self._lock:
+            lines += [
+                f'# HELP {prefix}requests_total HTTP requests sent, by endpoint and status',
+                f'# TYPE {prefix}requests_total counter',
+            ]
+            for (endpoint, status), count in sorted(self._requests.items()):
+                lines.append(f'{prefix}requests_total{_labels(endpoint=endpoint, status=status)} {count}')
+
+            for name, description in _HISTOGRAMS:
+                histograms = sorted(
+                    ((label, histogram) for (key, label), histogram in self._histograms.items() if key == name),
+                    key=lambda item: item[0] or ''
+                )
+                lines += [f'# HELP {prefix}{name} {description}', f'# TYPE {prefix}{name} histogram']
+                for label, histogram in histograms:
+                    labels = {} if label is None else {'endpoint': label}
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                        cumulative += count
+                        le = '+Inf' if bound == float('inf') else repr(float(bound))
+                        lines.append(f'{prefix}{name}_bucket{_labels(**labels, le=le)} {cumulative}')
+                    lines.append(f'{prefix}{name}_sum{_labels(**labels)} {histogram.sum!r}')
+                    lines.append(f'{prefix}{name}_count{_labels(**labels)} {histogram.count}')
+
+            lines += [
+                f'# HELP {prefix}quota Latest rate limit header values',
+                f'# TYPE {prefix}quota gauge',
+            ]
+            for name, value in sorted(self._quota.items()):
+                lines.append(f'{prefix}quota{_labels(name=name)} {value!r}')
+
+        return '\n'.join(lines) + '\n'
+
+
+_HISTOGRAMS = (
+    ('request_duration_seconds', 'Time from sending a request until its body was received'),
+    ('response_bytes', 'Size of the response bodies'),
+    ('decode_duration_seconds', 'Time spent decoding response bodies'),
+    ('page_wait_seconds', 'Time paged data iteration waited for the next page'),
+)
+
+
+def _labels(**labels):
+    if not labels:
+        return ''
+
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in labels.items()) + '}'
@@ -0,0 +1,103 @@
+from threading import Lock
+
+from requests.adapters import HTTPAdapter
+
+
+class PoolStats:
+    """
+    Connection pool counters of a :class:`Client <apisports._client.Client>`, see its ``pool_stats``.
+
+    * ``requests``: connections taken from the pool to send a request
+    * ``hits``: requests reusing an open (keep-alive) connection
+    * ``misses``: requests that had to open a new connection
+    * ``waited``: requests that had to wait for a connection, as all were in use
+    * ``discarded``: connections closed after use as the pool was full, increase the pool size if this keeps growing
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counts = dict(requests=0, hits=0, misses=0, waited=0, discarded=0)
+
+    def add(self, **counts):
+        """
+        Increment counters, e.g. ``stats.add(requests=1, hits=1)``.
+        """
+
+        with self._lock:
+            for name, count in counts.items():
+                self._counts[name] += count
+
+    def as_dict(self):
+        """
+        :return: A copy of the counters
+        :rtype: dict
+        """
+
+        with self._lock:
+            return dict(self._counts)
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    :class:`HTTPAdapter <requests.adapters.HTTPAdapter>` keeping :class:`PoolStats` of its connection pools.
+
+    :param stats: Receives the counts
+    :type stats: PoolStats
+
+    Other parameters are passed to :class:`HTTPAdapter <requests.adapters.HTTPAdapter>`.
+    """
+
+    def __init__(self, stats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(pool_class, self._stats)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+def _counting_pool_class(pool_class, stats):
+    class CountingPool(pool_class):
+        def _get_conn(self, timeout=None):
+            # the pool holds a placeholder per allowed connection, it is only empty when all of them are in use
+            waited = self.block and self.pool is not None and self.pool.empty()
+            conn = super()._get_conn(timeout)
+            reused = conn.sock is not None
+            stats.add(requests=1, hits=int(reused), misses=int(not reused), waited=int(waited))
+            return conn
+
+        def _put_conn(self, conn):
+            if conn is not None and self.pool is not None and self.pool.full():
+                stats.add(discarded=1)
+            super()._put_conn(conn)
+
+    CountingPool.__name__ = CountingPool.__qualname__ = 'Counting' + pool_class.__name__
+    return CountingPool
+
+
+def trace_config(stats):
+    """
+    :class:`TraceConfig <aiohttp.TraceConfig>` feeding :class:`PoolStats` from an `aiohttp` session.
+
+    :param stats: Receives the counts
+    :type stats: PoolStats
+
+    :rtype: aiohttp.TraceConfig
+    """
+
+    import aiohttp
+
+    def counter(**counts):
+        async def on_event(session, context, params):
+            stats.add(**counts)
+        return on_event
+
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(counter(waited=1))
+    config.on_connection_reuseconn.append(counter(requests=1, hits=1))
+    config.on_connection_create_end.append(counter(requests=1, misses=1))
+    return config
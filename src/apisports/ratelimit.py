@@ -0,0 +1,150 @@
+import time
+from threading import Lock
+
+
+class TokenBucket:
+    """
+    Token bucket allowing bursts of ``capacity`` requests, refilled at ``capacity`` tokens per ``period`` seconds.
+
+    Tokens are handed out as reservations: when the bucket is empty, the balance goes negative and the caller is told
+    how long to wait for its turn. This keeps concurrent callers queued in order instead of racing for tokens.
+
+    Not thread-safe on its own, :class:`RateLimiter` takes care of locking.
+
+    :param period: Refill period in seconds
+    :type period: float
+
+    :param capacity: Maximum number of tokens, `None` while unknown (no limit)
+    :type capacity: Union[int, None]
+    """
+
+    def __init__(self, period, capacity=None, clock=time.monotonic):
+        self._period = period
+        self._clock = clock
+        self._updated = clock()
+        self.capacity = capacity
+        self.tokens = capacity
+
+    def _refill(self):
+        now = self._clock()
+        if self.capacity is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.capacity / self._period)
+        self._updated = now
+
+    def reserve(self):
+        """
+        Take a token.
+
+        :return: Seconds to wait before the token may be used
+        :rtype: float
+        """
+
+        self._refill()
+
+        if self.capacity is None:
+            return 0.
+
+        self.tokens -= 1
+        if self.tokens >= 0 or self.capacity <= 0:
+            return 0.
+
+        return -self.tokens * self._period / self.capacity
+
+    def update(self, capacity, remaining):
+        """
+        Adapt the bucket to the limits reported by the API.
+
+        :param capacity: Maximum number of requests per period, `None` if not reported
+        :type capacity: Union[int, None]
+
+        :param remaining: Remaining number of requests, `None` if not reported
+        :type remaining: Union[int, None]
+        """
+
+        self._refill()
+
+        if capacity is not None:
+            if self.capacity is None:
+                self.tokens = capacity
+            self.capacity = capacity
+
+        if remaining is not None and self.capacity is not None:
+            # the API does not know about requests still in flight, so never hand out more than either side allows
+            self.tokens = min(self.tokens, remaining)
+
+    def drain(self):
+        """
+        Empty the bucket, e.g. after the API reported too many requests.
+        """
+
+        self._refill()
+        if self.capacity is not None:
+            self.tokens = min(self.tokens, 0)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter, pass an instance as ``rate_limiter`` to a :class:`Client <apisports._client.Client>`.
+
+    Requests are paced by two token buckets, one for the per-minute rate limit and one for the daily quota. Both
+    budgets adapt to the rate limit headers (see :class:`Headers <apisports.response.Headers>`) of every response,
+    so no configuration is needed. A HTTP 429 response empties the per-minute bucket.
+
+    Thread-safe, one instance can be shared by clients used from several threads.
+
+    :param per_minute: Initial number of requests allowed per minute, `None` to learn it from the responses
+    :type per_minute: Union[int, None]
+
+    :param per_day: Initial number of requests allowed per day, `None` to learn it from the responses
+    :type per_day: Union[int, None]
+    """
+
+    def __init__(self, per_minute=None, per_day=None, clock=time.monotonic, sleep=time.sleep):
+        self._lock = Lock()
+        self._sleep = sleep
+        self.minute = TokenBucket(60, per_minute, clock=clock)
+        self.day = TokenBucket(86400, per_day, clock=clock)
+
+    def reserve(self):
+        """
+        Reserve a request.
+
+        :return: Seconds to wait before sending the request
+        :rtype: float
+        """
+
+        with self._lock:
+            return max(self.minute.reserve(), self.day.reserve())
+
+    def acquire(self):
+        """
+        Reserve a request and block until it may be sent.
+        """
+
+        delay = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+
+    def update(self, response):
+        """
+        Adapt the budgets to the rate limit headers of ``response``.
+
+        :param response: The response received from the API
+        :type response: apisports.response.AbstractResponse
+        """
+
+        headers = response.headers
+
+        with self._lock:
+            self.minute.update(_int(headers.rate_limit), _int(headers.rate_limit_remaining))
+            self.day.update(_int(headers.requests_limit), _int(headers.requests_remaining))
+
+            if response.raw.status_code == 429:
+                self.minute.drain()
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,243 @@
+from collections.abc import Mapping
+import keyword
+
+
+class Record(Mapping):
+    """
+    Base class of the typed rows returned when a :class:`Client <apisports._client.Client>` is created with
+    ``records=True``.
+
+    Fields are stored in ``__slots__``, available as attributes (``row.team.name``) and, like the plain dicts they
+    replace, by key (``row['team']['name']``). Field names that are Python keywords or clash with the mapping methods
+    get a trailing underscore as attribute name (``row.substitutes.in_``), the key is left untouched.
+
+    Records compare equal to dicts with the same content, use :meth:`_asdict` to get plain dicts, e.g. for
+    serialization.
+    """
+
+    __slots__ = ()
+
+    #: Keys, in order
+    _fields = ()
+
+    #: Attribute name of each field, in the same order as :attr:`_fields`
+    _attributes = ()
+
+    _index = {}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._index[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return '{cls}({fields})'.format(
+            cls=self.__class__.__name__,
+            fields=', '.join(f'{attribute}={getattr(self, attribute)!r}' for attribute in self._attributes)
+        )
+
+    def _asdict(self):
+        """
+        Convert to plain (nested) dicts and lists.
+
+        :rtype: dict
+        """
+
+        return {key: _asdict(getattr(self, attribute)) for key, attribute in zip(self._fields, self._attributes)}
+
+
+def _asdict(value):
+    if isinstance(value, Record):
+        return value._asdict()
+    if type(value) is list:
+        return [_asdict(item) for item in value]
+    if type(value) is dict:
+        return {key: _asdict(item) for key, item in value.items()}
+    return value
+
+
+def _attribute(key):
+    if keyword.iskeyword(key) or key.startswith('_') or hasattr(Record, key):
+        return key + '_'
+    return key
+
+
+def record_class(name, fields):
+    """
+    Create a :class:`Record` subclass.
+
+    :param name: Class name
+    :type name: str
+
+    :param fields: Keys of the records
+    :type fields: Sequence[str]
+
+    :return: The record class, `None` if a key can not be used as attribute name
+    :rtype: Union[type, None]
+    """
+
+    fields = tuple(fields)
+    attributes = tuple(_attribute(key) for key in fields)
+
+    if not all(attribute.isidentifier() for attribute in attributes) or len(set(attributes)) != len(attributes):
+        return None
+
+    # like collections.namedtuple, generate __init__ as assigning the slots one by one is a lot slower
+    namespace = {}
+    exec(
+        'def __init__(self, {args}):\n    {body}\n'.format(
+            args=', '.join(attributes),
+            body='\n    '.join(f'self.{attribute} = {attribute}' for attribute in attributes) or 'pass',
+        ),
+        namespace
+    )
+
+    return type(name, (Record,), {
+        '__slots__': attributes,
+        '__init__': namespace['__init__'],
+        '_fields': fields,
+        '_attributes': attributes,
+        '_index': dict(zip(fields, attributes)),
+    })
+
+
+def shape_index(shapes, response):
+    """
+    Pick the shape of ``response`` among the candidate shapes of an endpoint.
+
+    :param shapes: Candidate shapes, see :class:`RecordFactory`
+    :type shapes: list
+
+    :param response: The decoded ``response`` field
+    :type response: Union[list, dict]
+
+    :return: Index of the shape matching the keys of the first row, ``0`` if there is no better match
+    :rtype: int
+    """
+
+    if len(shapes) < 2:
+        return 0
+
+    # several endpoints report the same "get", pick the shape matching the keys of the first row
+    row = response[0] if type(response) is list and response else response
+    if type(row) is dict:
+        for index, shape in enumerate(shapes):
+            shape = shape[0] if type(shape) is list else shape
+            if type(shape) is tuple and row.keys() == {key for key, _ in shape}:
+                return index
+
+    return 0
+
+
+class RecordFactory:
+    """
+    Converts decoded response rows into :class:`Record` objects, using the row shapes found in the API config.
+
+    Objects are converted when they have exactly the keys expected, anything else (e.g. fields added to the API
+    later on) stays a dict. Short strings (team names, statuses, dates...) are deduplicated, so repeated values share
+    a single string object.
+
+    :param shapes: Candidate shapes of the response per endpoint, as found in the API config by
+        :meth:`ClientMeta.compile <apisports._client.ClientMeta.compile>`
+    :type shapes: dict
+
+    :param max_strings: Maximum amount of distinct strings kept for deduplication
+    :type max_strings: int
+    """
+
+    #: Longer strings are not deduplicated, they are unlikely to be repeated
+    max_string_length = 64
+
+    def __init__(self, shapes, max_strings=65536):
+        self._shapes = shapes
+        self._max_strings = max_strings
+        self._strings = {}
+        self._converters = {}
+
+    def convert(self, endpoint, response):
+        """
+        Convert the ``response`` of a call to ``endpoint``.
+
+        :param endpoint: The endpoint, as reported in the ``get`` field of the response
+        :type endpoint: str
+
+        :param response: The decoded ``response`` field
+        :type response: Union[list, dict]
+
+        :return: The converted response, unchanged if the shape of the endpoint is unknown
+        :rtype: Union[list, Record, dict]
+        """
+
+        shapes = self._shapes.get(endpoint)
+        if not shapes:
+            return response
+
+        index = shape_index(shapes, response)
+        converter = self._converters.get((endpoint, index))
+
+        if converter is None:
+            name = ''.join(part.title() for part in endpoint.replace('-', '/').split('/'))
+            converter = self._converters[(endpoint, index)] = self._converter(name, shapes[index])
+
+        return converter(response)
+
+    def _converter(self, name, shape):
+        if type(shape) is not list and type(shape) is not tuple:
+            return self._value
+
+        if type(shape) is list:
+            return self._list_converter(self._converter(name, shape[0]))
+
+        fields = tuple(key for key, _ in shape)
+        cls = record_class(name, fields)
+        if cls is None:
+            return self._value
+
+        converters = tuple(self._converter(key.title().replace('_', ''), child) for key, child in shape)
+        items = tuple(zip(fields, converters))
+        generic = self._value
+
+        def convert(value):
+            if type(value) is not dict or value.keys() != cls._index.keys():
+                return generic(value)
+            return cls(*[converter(value[key]) for key, converter in items])
+
+        return convert
+
+    def _list_converter(self, item):
+        generic = self._value
+
+        def convert(value):
+            if type(value) is not list:
+                return generic(value)
+            return [item(element) for element in value]
+
+        return convert
+
+    def _value(self, value):
+        value_type = type(value)
+
+        if value_type is str:
+            if len(value) > self.max_string_length:
+                return value
+            try:
+                return self._strings[value]
+            except KeyError:
+                if len(self._strings) < self._max_strings:
+                    self._strings[value] = value
+                return value
+
+        if value_type is list:
+            return [self._value(item) for item in value]
+
+        if value_type is dict:
+            return {key: self._value(item) for key, item in value.items()}
+
+        return value
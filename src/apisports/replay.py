@@ -0,0 +1,207 @@
+import json
+import mmap
+import os
+import sqlite3
+import zlib
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+import requests.structures
+import requests.utils
+from requests.adapters import HTTPAdapter
+
+from ._client import request_key
+
+
+class NotRecordedError(requests.RequestException):
+    """Raised when replaying a request that was not recorded"""
+
+
+class RecordReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter recording HTTP traffic to disk and replaying it, mount it on the ``session`` of a
+    :class:`Client <apisports._client.Client>` (see :meth:`session`) to run backtests and CI performance runs offline.
+    Responses go through the same :meth:`AbstractResponse.create <apisports.response.AbstractResponse.create>` path
+    as live ones.
+
+    * ``record``: send the requests and record the responses
+    * ``replay``: serve recorded responses without network access, :class:`NotRecordedError` for others
+    * ``auto``: replay recorded requests, send and record the others
+
+    Responses are kept compressed in a single data file, indexed by host, endpoint and parameters (in any order) in an
+    SQLite database. A request recorded more than once is replayed in the recorded order, repeating the last response
+    once they are used up, e.g. to backtest polling.
+
+    :param directory: Directory of the recording, created if it does not exist
+    :type directory: str
+
+    :param mode: ``record``, ``replay`` or ``auto``
+    :type mode: str
+
+    :param max_entries: Maximum amount of decompressed bodies kept in memory, the least recently used ones are dropped
+        first
+    :type max_entries: int
+
+    :param compression: zlib compression level of the bodies recorded
+    :type compression: int
+    """
+
+    modes = ('record', 'replay', 'auto')
+
+    def __init__(self, directory, mode='replay', max_entries=1024, compression=6, **kwargs):
+        if mode not in self.modes:
+            raise ValueError(f"mode should be one of {', '.join(self.modes)}, got {mode!r}")
+
+        super().__init__(**kwargs)
+        os.makedirs(directory, exist_ok=True)
+
+        self._mode = mode
+        self._max_entries = max_entries
+        self._compression = compression
+        self._lock = Lock()
+        self._bodies = OrderedDict()
+        self._played = {}
+        self._map = None
+
+        self._db = sqlite3.connect(os.path.join(directory, 'index.sqlite'), check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT, host TEXT, endpoint TEXT, params TEXT, offset INTEGER, length INTEGER, '
+            'status INTEGER, reason TEXT, url TEXT, headers TEXT)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_key ON responses (key)')
+
+        # the index is small, load it once so replaying is only a dict lookup away
+        self._index = {}
+        for row in self._db.execute('SELECT key, offset, length, status, reason, url, headers FROM responses '
+                                    'ORDER BY rowid'):
+            self._index.setdefault(row[0], []).append(row[1:])
+
+        self._filename = os.path.join(directory, 'responses.bin')
+        self._file = open(self._filename, 'ab')
+
+    @property
+    def mode(self):
+        """
+        :rtype: str
+        """
+
+        return self._mode
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(rows) for rows in self._index.values())
+
+    def session(self):
+        """
+        A session with this adapter mounted, to pass as ``session`` to a client.
+
+        When replaying, the session does not look up proxy settings in the environment, which otherwise is a large
+        part of the time spent per request.
+
+        :rtype: requests.Session
+        """
+
+        session = requests.Session()
+        session.trust_env = self._mode != 'replay'
+        session.mount('https://', self)
+        session.mount('http://', self)
+        return session
+
+    def send(self, request, **kwargs):
+        """
+        Replay or send (and record) a request, depending on the mode.
+
+        :param request: The request
+        :type request: requests.PreparedRequest
+
+        :rtype: requests.Response
+
+        :raises NotRecordedError: if replaying a request that was not recorded
+        """
+
+        url = urlsplit(request.url)
+        endpoint = url.path.lstrip('/')
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        key = f'{url.hostname}/{request_key(endpoint, params)}'
+
+        if self._mode != 'record':
+            with self._lock:
+                rows = self._index.get(key)
+                if rows is not None:
+                    played = self._played.get(key, 0)
+                    self._played[key] = played + 1
+                    row = rows[min(played, len(rows) - 1)]
+
+            if rows is not None:
+                return self._response(request, row)
+
+            if self._mode == 'replay':
+                raise NotRecordedError(f'Request {key} was not recorded', request=request)
+
+        response = super().send(request, **kwargs)
+        self._record(key, url.hostname, endpoint, params, response)
+        return response
+
+    def close(self):
+        super().close()
+
+        with self._lock:
+            self._file.close()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._db.close()
+
+    def _record(self, key, host, endpoint, params, response):
+        blob = zlib.compress(response.content, self._compression)
+        headers = json.dumps(dict(response.headers))
+
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(blob)
+            self._file.flush()
+
+            row = (offset, len(blob), response.status_code, response.reason, response.url, headers)
+            self._db.execute('INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                             (key, host, endpoint, json.dumps(params, sort_keys=True), *row))
+            self._index.setdefault(key, []).append(row)
+
+    def _body(self, offset, length):
+        with self._lock:
+            body = self._bodies.get(offset)
+            if body is not None:
+                self._bodies.move_to_end(offset)
+                return body
+
+            if self._map is None or len(self._map) < offset + length:
+                if self._map is not None:
+                    self._map.close()
+                self._file.flush()
+                with open(self._filename, 'rb') as stream:
+                    self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+            body = self._bodies[offset] = zlib.decompress(self._map[offset:offset + length])
+            while len(self._bodies) > self._max_entries:
+                self._bodies.popitem(last=False)
+
+            return body
+
+    def _response(self, request, row):
+        offset, length, status, reason, url, headers = row
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.url = url
+        response.headers = requests.structures.CaseInsensitiveDict(json.loads(headers))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = self._body(offset, length)
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(0)
+        return response
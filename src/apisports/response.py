@@ -1,7 +1,13 @@
 import json
+import marshal
+import re
+import time
 
 from .data import NoneData, AbstractData
 
+# marks data (or errors) that have not been decoded from the response body yet
+_UNDECODED = object()
+
 
 class AbstractResponse:
     """
@@ -13,15 +19,35 @@ class AbstractResponse:
     :param response: :class:`Response <requests.Response>` object
     :type response: requests.Response
 
-    :param data: The data object returned by the API call
+    :param data: The data object returned by the API call, decoded from the response body on first use if omitted
     :type data: Union[None, dict]
     """
 
-    def __init__(self, client, response, data=None):
+    _not_modified = False
+    # future of the data decoded by a DecodePool
+    _pending = None
+
+    def __init__(self, client, response, data=_UNDECODED):
         self._client = client
         self._response = response
         self._data_object = None
-        self._data = dict() if data is None else data
+        self._decoded = dict() if data is None else data
+        self._errors = _UNDECODED
+
+    @property
+    def _data(self):
+        if self._decoded is _UNDECODED:
+            self._decoded = _decode(self._client, self._response.content, self._pending)
+            self._pending = None
+            # the errors found by scanning the body are void if the body as a whole turns out invalid
+            self._errors = _UNDECODED
+        return self._decoded
+
+    def _raw_errors(self):
+        if self._errors is _UNDECODED:
+            data = self._data
+            self._errors = data['errors'] if isinstance(data, dict) and 'errors' in data else None
+        return self._errors
 
     @staticmethod
     def create(client, response):
@@ -38,18 +64,21 @@ class AbstractResponse:
         :rtype: AbstractResponse
         """
 
-        try:
-            data = json.loads(response.text)
-        except (json.JSONDecodeError, KeyError) as exc:
-            data = dict(errors=str(exc))
+        if response.status_code != 200:
+            return HttpErrorResponse(client, response)
 
-        response_class = SuccessResponse
+        # only look at the top-level "errors" key, the payload is decoded when it is used
+        errors = _scan_errors(response.content)
+        if errors is not _UNDECODED:
+            response_class = ErrorResponse if errors else SuccessResponse
+            result = response_class(client, response)
+            result._errors = errors
+            return result
 
-        if response.status_code == 200:
-            if (data is None) or ('errors' in data and data['errors']):
-                response_class = ErrorResponse
-        else:
-            response_class = HttpErrorResponse
+        data = _decode(client, response.content)
+        response_class = SuccessResponse
+        if (data is None) or ('errors' in data and data['errors']):
+            response_class = ErrorResponse
 
         return response_class(client, response, data)
 
@@ -82,10 +111,7 @@ class AbstractResponse:
         :rtype: dict
         """
 
-        if 'errors' not in self._data:
-            return {}
-
-        errors = self._data['errors']
+        errors = self._raw_errors()
 
         if not errors:
             return {}
@@ -109,6 +135,17 @@ class AbstractResponse:
 
         return "Success" if self.ok else '\n'.join([f"{k}: {v}" for k, v in self.errors.items()])
 
+    @property
+    def not_modified(self):
+        """
+        Whether the response is unchanged since the previous identical request, and shares its data. Only set for
+        clients created with ``revalidate=True``, see :class:`Revalidator <apisports.revalidate.Revalidator>`.
+
+        :type: bool
+        """
+
+        return self._not_modified
+
     @property
     def headers(self):
         """
@@ -146,6 +183,13 @@ class AbstractResponse:
 
         return iter(self.data)
 
+    def __aiter__(self):
+        """
+        Delegates asynchronous iteration to the :class:`AbstractData <apisports.data.AbstractData>` class.
+        """
+
+        return self.data.__aiter__()
+
     def __len__(self):
         """
         Delegates ``len()`` to the :class:`AbstractData <apisports.data.AbstractData>` class.
@@ -178,7 +222,8 @@ class HttpErrorResponse(ErrorResponse):
 class SuccessResponse(AbstractResponse):
     @property
     def ok(self):
-        return True
+        # False if the body only turns out to be invalid when decoding the payload
+        return not self._raw_errors()
 
     @property
     def data(self):
@@ -261,3 +306,98 @@ class Headers:
         :rtype: CaseInsensitiveDict
         """
         return self._headers
+
+
+def _decode(client, content, pending=None):
+    # decode straight from the body bytes, avoiding charset detection and a decoded copy of the body
+    loads = getattr(client, 'json_decoder', json.loads)
+    hooks = getattr(client, '_hooks', None)
+    started = 0. if hooks is None else time.perf_counter()
+
+    try:
+        if pending is not None:
+            try:
+                return marshal.loads(pending.result())
+            except Exception:
+                # e.g. a broken pool or a decoder that can not be sent to other processes, decode it here instead
+                pass
+        return loads(content)
+    except (ValueError, KeyError) as exc:
+        return dict(errors=str(exc))
+    finally:
+        if hooks is not None:
+            hooks.decode(len(content), time.perf_counter() - started)
+
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.S)
+_SCALAR = re.compile(rb'[^,:\]}\s"\[{]+')
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+
+
+def _scan_errors(content, limit=65536):
+    """
+    Find the value of the top-level ``errors`` key without decoding the rest of the body.
+
+    Values preceding ``errors`` are skipped, not decoded. Gives up, returning ``_UNDECODED``, on anything unexpected
+    or when ``errors`` is not found within the first ``limit`` bytes; the caller then decodes the whole body.
+
+    :return: Decoded value of ``errors``, `None` if the body has no ``errors`` key or ``_UNDECODED``
+    """
+
+    try:
+        pos = _WHITESPACE.match(content).end()
+        if content[pos:pos + 1] != b'{':
+            return _UNDECODED
+        pos = _WHITESPACE.match(content, pos + 1).end()
+        if content[pos:pos + 1] == b'}':
+            return None
+
+        while pos < limit:
+            key = _STRING.match(content, pos)
+            pos = _WHITESPACE.match(content, key.end()).end()
+            if content[pos:pos + 1] != b':':
+                return _UNDECODED
+
+            start = _WHITESPACE.match(content, pos + 1).end()
+            end = _skip_value(content, start, limit)
+            if key.group() == b'"errors"':
+                return json.loads(content[start:end])
+
+            pos = _WHITESPACE.match(content, end).end()
+            separator = content[pos:pos + 1]
+            if separator == b'}':
+                return None
+            if separator != b',':
+                return _UNDECODED
+            pos = _WHITESPACE.match(content, pos + 1).end()
+    except (AttributeError, ValueError):
+        # no match (None.end()) or invalid JSON
+        pass
+
+    return _UNDECODED
+
+
+def _skip_value(content, pos, limit):
+    first = content[pos:pos + 1]
+
+    if first == b'"':
+        return _STRING.match(content, pos).end()
+
+    if first not in (b'[', b'{'):
+        return _SCALAR.match(content, pos).end()
+
+    depth = 0
+    while pos < limit:
+        char = _STRUCTURAL.search(content, pos)
+        token = char.group()
+        if token == b'"':
+            pos = _STRING.match(content, char.start()).end()
+            continue
+
+        pos = char.end()
+        depth += 1 if token in b'[{' else -1
+        if depth == 0:
+            return pos
+
+    raise ValueError('limit exceeded')
@@ -0,0 +1,116 @@
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    Retries transient failures, pass an instance as ``retry`` to a :class:`Client <apisports._client.Client>`.
+
+    A request is retried when the connection fails or times out, when the API answers with one of ``statuses`` or
+    when it reports one of ``errors`` (API-Sports reports exceeding the per-minute rate limit as a ``rateLimit``
+    error with HTTP status 200).
+
+    The n-th retry waits ``backoff * 2 ** (n - 1)`` seconds, at most ``max_backoff``. With ``jitter`` a random part of
+    that delay is used instead ("full jitter"), so clients failing at the same moment don't retry at the same moment.
+    A ``Retry-After`` header sent by the API takes precedence, if it asks to wait longer than ``max_retry_after``
+    the request is not retried.
+
+    :param retries: Maximum number of retries per request
+    :type retries: int
+
+    :param backoff: Delay before the first retry, in seconds
+    :type backoff: float
+
+    :param max_backoff: Maximum delay between retries, in seconds
+    :type max_backoff: float
+
+    :param jitter: Randomize the delays
+    :type jitter: bool
+
+    :param statuses: HTTP status codes to retry
+    :type statuses: Collection[int]
+
+    :param errors: Keys of API errors to retry
+    :type errors: Collection[str]
+
+    :param max_retry_after: Maximum delay accepted from a ``Retry-After`` header, in seconds
+    :type max_retry_after: float
+    """
+
+    def __init__(self, retries=3, backoff=.5, max_backoff=30., jitter=True, statuses=(429, 500, 502, 503, 504),
+                 errors=('rateLimit',), max_retry_after=120., random=random.random, sleep=time.sleep):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.errors = frozenset(errors)
+        self.max_retry_after = max_retry_after
+        self._random = random
+        self.sleep = sleep
+
+    def transient(self, response):
+        """
+        Whether the failure of ``response`` is worth a retry.
+
+        :param response: The response received from the API
+        :type response: apisports.response.AbstractResponse
+
+        :rtype: bool
+        """
+
+        if response.raw.status_code in self.statuses:
+            return True
+
+        return response.raw.status_code == 200 and not response.ok and not self.errors.isdisjoint(response.errors)
+
+    def delay(self, attempt, response=None):
+        """
+        Decide on retrying a failed request.
+
+        :param attempt: Number of retries done so far
+        :type attempt: int
+
+        :param response: The response received from the API, `None` if the connection failed
+        :type response: Union[apisports.response.AbstractResponse, None]
+
+        :return: Seconds to wait before retrying, `None` to give up
+        :rtype: Union[float, None]
+        """
+
+        if attempt >= self.retries:
+            return None
+
+        if response is not None:
+            if not self.transient(response):
+                return None
+
+            retry_after = _retry_after(response.headers['Retry-After'])
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return delay * self._random() if self.jitter else delay
+
+
+def _retry_after(value):
+    """Seconds to wait according to a ``Retry-After`` header, either in seconds or as a HTTP date"""
+
+    if not value:
+        return None
+
+    try:
+        return max(0., float(value))
+    except ValueError:
+        pass
+
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0., (moment - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from threading import Lock
+
+import requests
+import requests.structures
+
+from .data import PagedData
+from .response import SuccessResponse
+
+
+class Revalidator:
+    """
+    Skips downloading and decoding responses that did not change since the previous identical request, enable with
+    ``revalidate=True`` on a :class:`Client <apisports._client.Client>`. Meant for endpoints that are polled, e.g.
+    ``fixtures(live='all')``.
+
+    The last successful response per request is kept. When the API sent an ``ETag`` or ``Last-Modified`` header, the
+    next request is conditional (``If-None-Match`` / ``If-Modified-Since``) and the API may answer ``304 Not
+    Modified`` without a body. Otherwise, the body received is compared to the previous one. Either way, an unchanged
+    response shares the decoded data and :class:`AbstractData <apisports.data.AbstractData>` object of the previous
+    one and has :attr:`not_modified <apisports.response.AbstractResponse.not_modified>` set, while its headers (e.g.
+    the rate limits) are the ones just received. Only the first page of paged data is revalidated: the next pages
+    are requested again.
+
+    :param max_entries: Maximum amount of responses kept, the least recently used ones are dropped first
+    :type max_entries: int
+    """
+
+    def __init__(self, max_entries=1024):
+        self._max_entries = max_entries
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._requests = 0
+        self._not_modified = 0
+        self._unchanged = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        """
+        Counters: ``requests`` revalidated, answered ``not_modified`` (HTTP 304) by the API and found ``unchanged``
+        by comparing the body.
+
+        :rtype: dict
+        """
+
+        with self._lock:
+            return dict(requests=self._requests, not_modified=self._not_modified, unchanged=self._unchanged)
+
+    def headers(self, key, headers):
+        """
+        Add the conditional request headers for ``key``.
+
+        :param key: Request key, see :func:`request_key <apisports._client.request_key>`
+        :type key: str
+
+        :param headers: Request headers
+        :type headers: dict
+
+        :return: The request headers to send
+        :rtype: dict
+        """
+
+        with self._lock:
+            previous = self._entries.get(key)
+
+        if previous is None:
+            return headers
+
+        etag = previous.raw.headers.get('ETag')
+        last_modified = previous.raw.headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return headers
+
+        headers = dict(headers)
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        if last_modified is not None:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def update(self, key, response):
+        """
+        Compare ``response`` to the previous response for ``key``, and keep it for the next request.
+
+        :param key: Request key, see :func:`request_key <apisports._client.request_key>`
+        :type key: str
+
+        :param response: The response received from the API
+        :type response: apisports.response.AbstractResponse
+
+        :return: ``response``, or when unchanged, a response sharing the data of the previous one
+        :rtype: apisports.response.AbstractResponse
+        """
+
+        raw = response.raw
+
+        with self._lock:
+            self._requests += 1
+            previous = self._entries.get(key)
+
+        if previous is not None:
+            if raw.status_code == 304:
+                response = _reuse(previous, _merge(previous.raw, raw))
+                counter = '_not_modified'
+            elif raw.status_code == 200 and raw.content == previous.raw.content:
+                response = _reuse(previous, raw)
+                counter = '_unchanged'
+            else:
+                counter = None
+
+            if counter is not None:
+                with self._lock:
+                    setattr(self, counter, getattr(self, counter) + 1)
+
+        if not response.ok:
+            return response
+
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return response
+
+    def clear(self):
+        """
+        Forget all responses.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+
+def _merge(previous, raw):
+    """The previous raw response with the headers of ``raw``, a 304 response without body"""
+
+    merged = requests.Response()
+    merged.status_code = previous.status_code
+    merged.reason = previous.reason
+    merged.url = raw.url
+    merged.headers = requests.structures.CaseInsensitiveDict(previous.headers)
+    merged.headers.update((k, v) for k, v in raw.headers.items() if not k.lower().startswith('content-'))
+    merged.encoding = previous.encoding
+    merged._content = previous.content
+    return merged
+
+
+def _reuse(previous, raw):
+    """A response for ``raw`` sharing the decoded data of ``previous``"""
+
+    data = previous.data
+    response = SuccessResponse(previous._client, raw, previous._data)
+    response._errors = previous._raw_errors()
+    if not isinstance(data, PagedData):
+        # paged data holds the next pages of the previous request, these may have changed and are requested again
+        response._data_object = data
+    response._not_modified = True
+    return response
@@ -0,0 +1,376 @@
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qsl, urlsplit
+
+from ._client import ClientMeta
+
+
+class StubAPI:
+    """
+    Local fake of an API-Sports API, e.g. to load test without spending quota or to run integration tests offline.
+
+    Every endpoint of the API config also used by :class:`ClientMeta <apisports._client.ClientMeta>` is served, with
+    synthetic rows shaped like the examples in the config, ``paging`` for endpoints accepting a ``page`` parameter
+    and the rate limit headers of the real API. Unknown and malformed parameters are reported as API errors.
+
+    .. code-block:: python3
+
+        with StubAPI('football', latency=.05, error_rate=.01) as stub:
+            api = Football(host=stub.url, retry=RetryPolicy())
+            for player in api.players(league=39, season=2020).data:
+                ...
+
+    The server is multi-threaded and uses HTTP/1.1 keep-alive, response bodies are built once per request and
+    reused (up to ``max_entries`` of them), so it sustains thousands of requests per second.
+
+    :param kind: The sport, e.g. ``football``
+    :type kind: str
+
+    :param version: Version of the API config, defaults to the version used by the client class of ``kind``
+    :type version: Union[int, None]
+
+    :param rows: Number of rows per response (per page)
+    :type rows: int
+
+    :param pages: Number of pages of paged endpoints
+    :type pages: int
+
+    :param latency: Seconds to wait before answering, or a function returning them
+    :type latency: Union[float, Callable[[], float]]
+
+    :param error_rate: Fraction of the requests answered with HTTP status ``error_status``, chosen at random
+    :type error_rate: float
+
+    :param error_status: HTTP status code of the injected errors
+    :type error_status: int
+
+    :param rate_limit: Requests allowed per minute, further requests are answered with HTTP status 429 and a
+        ``Retry-After`` header, `None` for no limit
+    :type rate_limit: Union[int, None]
+
+    :param bursts: ``(every, length)``: out of every ``every`` requests, the last ``length`` are answered with HTTP
+        status 429, e.g. ``(100, 5)``
+    :type bursts: Union[Tuple[int, int], None]
+
+    :param daily_limit: Requests allowed per day, as reported in the headers (it is not enforced)
+    :type daily_limit: int
+
+    :param responses: Bodies to serve instead of synthetic ones, per endpoint (e.g. ``players/topscorers``), either
+        the JSON payload or a function of the request parameters returning it
+    :type responses: Union[Dict[str, Union[dict, Callable[[dict], dict]]], None]
+
+    :param seed: Seed of the synthetic data and the error injection
+    :type seed: int
+
+    :param address: Address to listen on, port 0 picks a free port
+    :type address: Tuple[str, int]
+
+    :param max_entries: Maximum amount of response bodies kept for reuse, the least recently used ones are dropped
+        first
+    :type max_entries: int
+    """
+
+    def __init__(self, kind='football', version=None, rows=20, pages=3, latency=0., error_rate=0., error_status=500,
+                 rate_limit=None, bursts=None, daily_limit=100, responses=None, seed=0, address=('127.0.0.1', 0),
+                 max_entries=1024):
+        if version is None:
+            from . import _client_classes
+            version = _client_classes.get(kind.title())
+
+        kind = kind.lower()
+        spec = ClientMeta.load(os.path.join(ClientMeta.data_dir, f'{kind}-v{version or 1}.yaml'))
+
+        self._routes = {
+            f'/{endpoint}': _Route(endpoint, params, spec['shapes'].get(endpoint), spec['multi_ids'].get(endpoint))
+            for _, endpoint, _, params in spec['operations']
+        }
+        self._rows = rows
+        self._pages = pages
+        self._latency = latency
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._rate_limit = rate_limit
+        self._bursts = bursts
+        self._daily_limit = daily_limit
+        self._responses = dict(responses or {})
+        self._seed = seed
+        self._max_entries = max_entries
+        self._address = address
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._bodies = OrderedDict()
+        self._window = deque()
+        self._requests = 0
+        self._errors = 0
+        self._throttled = 0
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def url(self):
+        """
+        URL of the server, to pass as ``host`` to a client.
+
+        :rtype: str
+        """
+
+        return 'http://%s:%d' % self._server.server_address[:2]
+
+    @property
+    def stats(self):
+        """
+        Counters: ``requests`` received, answered with an injected ``errors`` and ``throttled`` (HTTP status 429).
+
+        :rtype: dict
+        """
+
+        with self._lock:
+            return dict(requests=self._requests, errors=self._errors, throttled=self._throttled)
+
+    def start(self):
+        """
+        Start serving in a background thread.
+
+        :return: ``self``
+        :rtype: StubAPI
+        """
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, headers, content = stub._handle(self.path)
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                for key, value in headers:
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = _ThreadingHTTPServer(self._address, Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving.
+        """
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _handle(self, path):
+        url = urlsplit(path)
+
+        now = time.monotonic()
+        with self._lock:
+            index = self._requests
+            self._requests += 1
+            while self._window and self._window[0] <= now - 60.:
+                self._window.popleft()
+
+            retry_after = None
+            if self._rate_limit is not None and len(self._window) >= self._rate_limit:
+                retry_after = math.ceil(self._window[0] + 60. - now)
+            elif self._bursts is not None and index % self._bursts[0] >= self._bursts[0] - self._bursts[1]:
+                retry_after = 1
+            else:
+                self._window.append(now)
+
+            failed = retry_after is None and self._error_rate > 0 and self._random.random() < self._error_rate
+            self._throttled += retry_after is not None
+            self._errors += failed
+
+            headers = [
+                ('x-ratelimit-requests-limit', str(self._daily_limit)),
+                ('x-ratelimit-requests-remaining', str(max(0, self._daily_limit - self._requests))),
+            ]
+            if self._rate_limit is not None:
+                headers += [
+                    ('X-RateLimit-Limit', str(self._rate_limit)),
+                    ('X-RateLimit-Remaining', str(self._rate_limit - len(self._window))),
+                ]
+
+        latency = self._latency() if callable(self._latency) else self._latency
+        if latency > 0:
+            time.sleep(latency)
+
+        if retry_after is not None:
+            headers.append(('Retry-After', str(retry_after)))
+            return 429, headers, b'{"message":"Too many requests"}'
+
+        if failed:
+            return self._error_status, headers, b'{"message":"Internal Server Error"}'
+
+        return 200, headers, self._body(url.path, url.query)
+
+    def _body(self, path, query):
+        key = (path, query)
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                return body
+
+        params = dict(parse_qsl(query, keep_blank_values=True))
+        route = self._routes.get(path)
+        endpoint = path.lstrip('/')
+
+        if endpoint in self._responses:
+            payload = self._responses[endpoint]
+            body = json.dumps(payload(params) if callable(payload) else payload).encode('UTF-8')
+            # functions may answer differently each time, don't reuse their bodies
+            if callable(payload):
+                return body
+        elif route is None:
+            body = _envelope(endpoint, params, {'endpoint': 'This endpoint does not exist.'})
+        else:
+            body = route.body(params, self._rows, self._pages, random.Random(f'{self._seed}:{path}?{query}'))
+
+        with self._lock:
+            body = self._bodies.setdefault(key, body)
+            self._bodies.move_to_end(key)
+            while len(self._bodies) > self._max_entries:
+                self._bodies.popitem(last=False)
+            return body
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _Route:
+    """An endpoint of the stub: parameter validation and synthetic responses"""
+
+    def __init__(self, endpoint, params, shapes, multi_ids):
+        self.endpoint = endpoint
+        self.patterns = {name: _pattern(pattern, param_type) for name, _, pattern, param_type in params}
+        self.shape = shapes[0] if shapes else []
+        self.multi_ids = multi_ids
+
+    def body(self, params, rows, pages, rng):
+        errors = {}
+        for name, value in params.items():
+            if name not in self.patterns:
+                errors[name] = f'The {name} field does not exist.'
+            elif self.patterns[name] is not None and not self.patterns[name].match(value):
+                errors[name] = f'The {name} field is invalid.'
+        if errors:
+            return _envelope(self.endpoint, params, errors)
+
+        paged = 'page' in self.patterns
+        page = int(params.get('page', 1))
+        total = pages if paged else 1
+
+        if type(self.shape) is not list:
+            # a single object, e.g. teams/statistics
+            response = _generate(self.shape, rng)
+        elif page > total:
+            response = []
+        else:
+            path, ids = self._ids(params)
+            response = [_generate(self.shape[0], rng) for _ in range(rows if ids is None else len(ids))]
+            for row, row_id in zip(response, ids or ()):
+                _assign(row, path, row_id)
+
+        return _envelope(self.endpoint, params, [], response, page, total)
+
+    def _ids(self, params):
+        """The path of the id field in the rows and the ids asked for, to answer with rows having these ids"""
+
+        field = self.multi_ids[2] if self.multi_ids is not None else 'id'
+        if self.multi_ids is not None and self.multi_ids[0] in params:
+            ids = params[self.multi_ids[0]].split('-')
+        elif 'id' in params and (field != 'id' or self.shape and type(self.shape[0]) is tuple
+                                 and 'id' in dict(self.shape[0])):
+            ids = [params['id']]
+        else:
+            return field, None
+
+        return field, [int(i) if i.isdigit() else i for i in ids]
+
+
+# the patterns in the API configs are descriptions, these are the ones that can be checked
+_FORMATS = {
+    'yyyy-mm-dd': re.compile(r'^\d{4}-\d{2}-\d{2}$'),
+    'yyyy': re.compile(r'^\d{4}$'),
+    'id-id': re.compile(r'^\d+-\d+$'),
+    'id-id-id': re.compile(r'^\d+(-\d+)*$'),
+}
+
+_INTEGER = re.compile(r'^-?\d+$')
+
+
+def _pattern(pattern, param_type):
+    if pattern is not None:
+        pattern = _FORMATS.get(pattern.split('|')[0].strip().lower())
+        if pattern is not None:
+            return pattern
+
+    return _INTEGER if param_type == 'integer' else None
+
+
+def _envelope(endpoint, params, errors, response=None, page=1, total=1):
+    response = [] if response is None else response
+    return json.dumps({
+        "get": endpoint,
+        "parameters": params,
+        "errors": errors,
+        "results": len(response) if type(response) is list else 1,
+        "paging": {"current": page, "total": total},
+        "response": response,
+    }).encode('UTF-8')
+
+
+def _generate(shape, rng, name=''):
+    """A synthetic value of ``shape``, see :meth:`ClientMeta._response_shapes`"""
+
+    if type(shape) is tuple:
+        return {key: _generate(item, rng, key) for key, item in shape}
+    if type(shape) is list:
+        # nested lists (e.g. statistics per team) are kept short
+        return [_generate(shape[0], rng, name) for _ in range(2)] if shape else []
+    if shape == 'int':
+        return rng.randrange(1, 10 ** 7 if name == 'id' else 1000)
+    if shape == 'float':
+        return round(rng.uniform(0, 100), 2)
+    if shape == 'bool':
+        return rng.random() < .5
+    if shape == 'str':
+        return f'{name or "value"} {rng.randrange(1000)}'
+    return None
+
+
+def _assign(row, path, value):
+    parts = path.split('.')
+    for part in parts[:-1]:
+        row = row.setdefault(part, {}) if isinstance(row, dict) else {}
+    if isinstance(row, dict):
+        row[parts[-1]] = value
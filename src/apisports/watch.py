@@ -0,0 +1,90 @@
+from collections import namedtuple
+from collections.abc import Mapping
+
+from ._client import _field_path, _lookup
+
+
+class WatchError(Exception):
+    """Raised by :meth:`Client.watch <apisports._client.Client.watch>` when polling fails"""
+
+    def __init__(self, message, error_description=''):
+        super().__init__(': '.join((message, error_description)))
+
+
+class Change(namedtuple('Change', 'kind key row previous fields')):
+    """
+    A row that was added, removed or changed since the previous poll.
+
+    * ``kind``: ``added``, ``removed`` or ``changed``
+    * ``key``: the key of the row, e.g. the fixture id
+    * ``row``: the row, `None` when removed
+    * ``previous``: the row as seen in the previous poll, `None` when added
+    * ``fields``: dotted paths of the values that changed, e.g. ``('goals.home', 'fixture.status.elapsed')``, empty
+      unless changed
+    """
+
+    __slots__ = ()
+
+
+class Watcher:
+    """
+    Keeps an index of the rows of the last poll by key, to find out what changed in the next one.
+
+    :param key: Dotted path of the key of each row (e.g. ``fixture.id``) or a function returning it
+    :type key: Union[str, Callable[[Any], Hashable]]
+    """
+
+    def __init__(self, key):
+        if not callable(key):
+            path = _field_path(key)
+
+            def key(row):
+                return _lookup(row, path)
+
+        self._key = key
+        self._rows = None
+
+    def update(self, rows):
+        """
+        Compare ``rows`` to the rows of the previous call, all rows are added on the first call.
+
+        :param rows: The rows of the current poll
+        :type rows: Iterable
+
+        :return: The changes, in the order of ``rows``, removed rows last
+        :rtype: List[Change]
+        """
+
+        previous = self._rows or {}
+        current = {}
+        changes = []
+
+        for row in rows:
+            key = self._key(row)
+            current[key] = row
+            old = previous.get(key)
+
+            if old is None:
+                changes.append(Change('added', key, row, None, ()))
+            elif old != row:
+                changes.append(Change('changed', key, row, old, tuple(_diff(old, row))))
+
+        changes += [Change('removed', key, None, row, ()) for key, row in previous.items() if key not in current]
+
+        self._rows = current
+        return changes
+
+
+def _diff(old, new, prefix=''):
+    """Dotted paths of the values that differ between ``old`` and ``new``"""
+
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        for key in list(old) + [key for key in new if key not in old]:
+            if old.get(key) != new.get(key):
+                yield from _diff(old.get(key), new.get(key), f'{prefix}{key}.')
+    elif type(old) is list and type(new) is list and len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            if old_item != new_item:
+                yield from _diff(old_item, new_item, f'{prefix}{index}.')
+    else:
+        yield prefix[:-1]
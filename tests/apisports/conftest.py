@@ -0,0 +1,22 @@
+import pytest
+import requests
+import requests_mock
+
+from helpers import clientmeta_test_class
+
+
+@pytest.fixture
+def test_v3():
+    return clientmeta_test_class('test', 3)
+
+
+@pytest.fixture
+def session(adapter):
+    session = requests.Session()
+    session.mount('http+mock://', adapter)
+    return session
+
+
+@pytest.fixture
+def adapter():
+    return requests_mock.Adapter()
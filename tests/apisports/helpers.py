@@ -1,5 +1,15 @@
 import code
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlsplit
 
+from apisports import _client_class
+from apisports._client import ClientMeta
 from apisports.data import NoneData
 
 
@@ -24,9 +34,81 @@ def assert_response_error(response):
     assert response.error_description != "Success"
 
 
+@contextmanager
+def clientmeta_test_path():
+    """
+    Get ClientMeta which loads from tests YAML location
+    """
+
+    prev_dir = ClientMeta.data_dir
+
+    try:
+        ClientMeta.data_dir = os.path.join(os.path.dirname(__file__), 'data')
+        yield ClientMeta
+    finally:
+        ClientMeta.data_dir = prev_dir
+
+
+def clientmeta_test_class(name, version=None, **kwargs):
+    with clientmeta_test_path():
+        cls = _client_class(name, version, **kwargs)
+    return cls
+
+
+def register_mock_uri(adapter, *args, **kwargs):
+    def _(func):
+        def wrapped_func(request, context):
+            context.status_code = 200
+            context.headers['Content-Type'] = 'application/json'
+            return func(request, context)
+
+        adapter.register_uri(
+            'GET',
+            *args,
+            **kwargs,
+            json=wrapped_func
+        )
+
+    return _
+
+
+def register_paginated_mock(adapter, total, per_page=3, delay=0.0, failing_page=None):
+    stats = dict(active=0, max_active=0, pages=[])
+    lock = threading.Lock()
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/paginated-count')
+    def mock_paginated_count(request, context):
+        page = int(request.qs['page'][0]) if 'page' in request.qs else 1
+
+        with lock:
+            stats['active'] += 1
+            stats['max_active'] = max(stats['max_active'], stats['active'])
+            stats['pages'].append(page)
+
+        time.sleep(delay)
+
+        with lock:
+            stats['active'] -= 1
+
+        if page == failing_page:
+            return {"errors": {"page": "failed"}}
+
+        start = (page - 1) * per_page
+        return {
+            "get": "paginated-count",
+            "parameters": {},
+            "paging": {"current": page, "total": total},
+            "results": per_page,
+            "response": list(range(start, start + per_page))
+        }
+
+    return stats
+
+
 class MockResponse:
     def __init__(self, text, status_code=200, headers=None):
         self.text = text
+        self.content = text.encode('UTF-8')
         self.status_code = status_code
         self.reason = f"HTTP {status_code}"
         self.headers = headers if headers else {}
@@ -38,3 +120,72 @@ class MockClient:
 
     def get(self, *_args, **_kwargs):
         return self._response
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StubServer:
+    """
+    Local HTTP/1.1 keep-alive server for offline tests.
+
+    Handlers are registered per path and receive the query parameters, they return the JSON serializable body
+    and optionally the status code and headers.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.connections = set()
+        self.requests = []
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://%s:%d' % self._server.server_address[:2]
+
+    def route(self, path):
+        def _(func):
+            self.handlers[path] = func
+            return func
+
+        return _
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                stub.connections.add(self.client_address)
+                stub.requests.append((url.path, params))
+
+                result = stub.handlers[url.path](params)
+                if type(result) is not tuple:
+                    result = (result,)
+                body, status, headers = result + (200, {})[len(result) - 1:]
+
+                content = json.dumps(body).encode('UTF-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,111 @@
+import os
+
+import pytest
+import requests
+
+from apisports.archive import Archive, ArchivedResponse
+from apisports.data import PagedData, SingleData
+from helpers import register_paginated_mock
+
+
+@pytest.fixture
+def archive(tmpdir):
+    archive = Archive(str(tmpdir.join('archive')))
+    yield archive
+    archive.close()
+
+
+def register_status_mock(adapter, statuses):
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/status', [
+        {'json': {"get": "status", "errors": [], "results": 1, "response": {"status": status}},
+         'headers': {'X-RateLimit-Remaining': '9'}}
+        for status in statuses
+    ] + [{'json': {"errors": {"status": "failed"}}}])
+
+
+def test_archive_client(test_v3, session, adapter, archive):
+    register_status_mock(adapter, ['first', 'second'])
+    api = test_v3(session=session, archive=archive)
+
+    assert api.status().ok
+    assert api.status().ok
+    assert not api.status().ok
+    assert len(archive) == 2
+
+    response = archive.get('status')
+    assert isinstance(response, ArchivedResponse)
+    assert response.ok
+    assert response.headers.rate_limit_remaining == '9'
+    assert type(response.data) is SingleData
+    assert response.data.item() == {"status": "second"}
+
+    entries = list(archive.replay())
+    assert [entry.response.data.item()['status'] for entry in entries] == ['first', 'second']
+    assert entries[0].endpoint == 'status'
+    assert entries[0].params == {}
+    assert archive.get('status', at=entries[0].fetched_at).data.item() == {"status": "first"}
+
+    missing = archive.get('status', at=entries[0].fetched_at - 1)
+    assert not missing.ok
+    assert missing.errors['http_status_code'] == 404
+    assert not archive.get('ping').ok
+
+
+def test_archive_paged(test_v3, session, adapter, archive):
+    register_paginated_mock(adapter, total=4)
+    api = test_v3(session=session, archive=archive)
+    assert list(api.paginated_count(to=12)) == list(range(12))
+    assert len(archive) == 4
+
+    entries = list(archive.replay('paginated-count'))
+    assert len(entries) == 1
+    assert entries[0].params == {'to': 12}
+
+    data = entries[0].response.data
+    assert type(data) is PagedData
+    assert list(data) == list(range(12))
+
+    assert len(list(archive.replay(pages=True))) == 4
+    assert list(archive.replay('status')) == []
+
+
+def test_archive_segments(tmpdir, test_v3, session, adapter):
+    directory = str(tmpdir.join('archive'))
+    register_status_mock(adapter, [str(i) * 100 for i in range(10)])
+
+    archive = Archive(directory, segment_size=500)
+    api = test_v3(session=session, archive=archive)
+    for _ in range(10):
+        api.status()
+    archive.close()
+
+    assert 1 < len([name for name in os.listdir(directory) if name.endswith('.segment')]) < 10
+
+    archive = Archive(directory)
+    try:
+        statuses = [entry.response.data.item()['status'] for entry in archive.replay()]
+        assert statuses == [str(i) * 100 for i in range(10)]
+    finally:
+        archive.close()
+
+
+def test_archive_lazy(archive, monkeypatch):
+    class Response:
+        ok = True
+        _data = {"get": "status", "response": {"status": "ok"}}
+        raw = requests.Response()
+
+    Response.raw.status_code = 200
+    archive.append('status', {'season': 2020, 'team': None}, Response(), fetched_at=1.)
+
+    loads = []
+    load = archive._load
+    monkeypatch.setattr(archive, '_load', lambda *args: loads.append(args) or load(*args))
+
+    entry, = archive.replay()
+    assert entry.params == {'season': 2020}
+    assert entry.fetched_at == 1.
+    assert loads == []
+    assert entry.response.data.item() == {"status": "ok"}
+    assert len(loads) == 1
+    assert archive.get('status', {'season': '2020'}).ok
@@ -0,0 +1,190 @@
+import asyncio
+from math import ceil
+
+import pytest
+
+import apisports
+from apisports import AsyncClient
+from apisports.data import PagedData, SingleData
+from apisports.response import HttpErrorResponse
+from apisports.testing import StubAPI
+from helpers import StubServer, assert_response_ok, assert_response_error, clientmeta_test_class
+
+
+@pytest.fixture
+def async_test_v3():
+    return clientmeta_test_class('test', 3, base=AsyncClient)
+
+
+@pytest.fixture
+def stub():
+    with StubServer() as server:
+        @server.route('/status')
+        def status(params):
+            return {"response": {"status": "ok"}}
+
+        @server.route('/ping')
+        def ping(params):
+            return {"errors": {"ping": "no pong"}}
+
+        @server.route('/null')
+        def null(params):
+            return {"message": "Something went wrong"}, 500
+
+        @server.route('/paginated-count')
+        def paginated_count(params):
+            per_page = 3
+            page = int(params.get('page', 1))
+            stop = int(params['to']) + 1
+            start = 1 + (page - 1) * per_page
+            result = list(range(start, min(stop, start + per_page)))
+
+            return {
+                "get": "paginated-count",
+                "parameters": {"to": params['to']},
+                "paging": {
+                    "current": page,
+                    "total": ceil((stop - 1) / per_page),
+                },
+                "results": len(result),
+                "response": result
+            }
+
+        yield server
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_async_sports_classes():
+    assert issubclass(apisports.AsyncFootball, AsyncClient)
+    assert apisports.AsyncFootball.__name__ == 'AsyncFootball'
+    assert apisports.AsyncFootball.default_host == apisports.Football.default_host
+    assert 'AsyncHockey' in dir(apisports)
+
+
+def test_async_client(async_test_v3, stub):
+    async def main():
+        async with async_test_v3(host=stub.url) as api:
+            response = await api.status()
+            assert_response_ok(response)
+            assert type(response.data) is SingleData
+            assert response.data.item() == {"status": "ok"}
+            assert response.headers['Content-Type'] == 'application/json'
+
+            response = await api.ping()
+            assert_response_error(response)
+            assert response.errors == {"ping": "no pong"}
+
+            response = await api.null()
+            assert_response_error(response)
+            assert type(response) is HttpErrorResponse
+            assert response.errors['http_status_code'] == 500
+
+    run(main())
+
+
+def test_async_client_pooled(async_test_v3, stub):
+    async def main():
+        async with async_test_v3(host=stub.url, pool_maxsize=4) as api:
+            responses = await asyncio.gather(*(api.status() for _ in range(40)))
+            assert all(response.ok for response in responses)
+
+    run(main())
+
+    assert len(stub.requests) == 40
+    assert len(stub.connections) <= 4
+
+
+def test_async_paged_data(async_test_v3, stub):
+    async def main():
+        async with async_test_v3(host=stub.url) as api:
+            response = await api.paginated_count(to=10)
+            assert type(response.data) is PagedData
+            assert [row async for row in response] == list(range(1, 11))
+
+            # already fetched pages are not fetched again
+            assert [row async for row in response.data] == list(range(1, 11))
+
+            response = await api.status()
+            assert [row async for row in response] == [{"status": "ok"}]
+
+    run(main())
+
+    assert [params.get('page') for path, params in stub.requests if path == '/paginated-count'] == \
+        [None, '2', '3', '4']
+
+
+def test_async_paged_data_sync_methods(async_test_v3, stub):
+    async def main():
+        async with async_test_v3(host=stub.url) as api:
+            data = (await api.paginated_count(to=10)).data
+
+            for method in (iter, PagedData.prefetch, PagedData.stream, PagedData.resume):
+                with pytest.raises(TypeError):
+                    method(data)
+            with pytest.raises(TypeError):
+                data.to_columns(['x'])
+
+    run(main())
+
+    assert [params.get('page') for path, params in stub.requests if path == '/paginated-count'] == [None]
+
+
+def test_async_to_columns():
+    numpy = pytest.importorskip('numpy')
+
+    async def main():
+        async with apisports.AsyncFootball(host=stub.url) as api:
+            response = await api.players(league=39, season=2020)
+            return await response.data.to_columns_async(['player.id', 'player.name'], backend='numpy')
+
+    with StubAPI('football', rows=5, pages=3) as stub:
+        columns = run(main())
+
+    assert len(columns['player.id']) == 15
+    assert columns['player.id'].dtype == numpy.int64
+    assert not columns['player.name'].mask.any()
+
+
+def test_async_batch(async_test_v3, stub):
+    @stub.route('/echo')
+    def echo(params):
+        return {"response": [int(params['id'])]}
+
+    async def main():
+        async with async_test_v3(host=stub.url) as api:
+            results = [
+                (request, response.data.item())
+                async for request, response in api.batch([('echo', {'id': i}) for i in range(8)], concurrency=3)
+            ]
+            assert results == [(('echo', {'id': i}), i) for i in range(8)]
+
+            unordered = [response.data.item() async for _, response in api.batch(
+                (('echo', {'id': i}) for i in range(8)), concurrency=3, ordered=False
+            )]
+            assert sorted(unordered) == list(range(8))
+
+            rows = [list(response) async for _, response in api.many('paginated_count', to=[1, 2])]
+            assert rows == [[1], [1, 2]]
+
+    run(main())
+
+
+def test_async_by_ids(async_test_v3, stub):
+    @stub.route('/items')
+    def items(params):
+        return {"response": [{"item": {"id": int(i)}} for i in params['ids'].split('-')]}
+
+    async def main():
+        async with async_test_v3(host=stub.url) as api:
+            rows = await api.by_ids('items', range(1, 8))
+            assert rows == {i: {"item": {"id": i}} for i in range(1, 8)}
+
+    run(main())
+    assert len(stub.requests) == 3
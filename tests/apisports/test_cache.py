@@ -0,0 +1,139 @@
+import time
+
+import pytest
+
+from apisports.cache import AbstractCache, MemoryCache, SqliteCache
+from apisports.response import SuccessResponse
+from helpers import register_mock_uri
+
+
+@pytest.fixture
+def calls(adapter):
+    calls = []
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/status')
+    def mock_status(request, context):
+        calls.append('status')
+        return {"response": {"status": "ok"}}
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/ping')
+    def mock_ping(request, context):
+        calls.append('ping')
+        return {"errors": {"ping": "no pong"}}
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/paginated-count')
+    def mock_paginated_count(request, context):
+        calls.append('paginated-count')
+        return {"response": [request.qs]}
+
+    return calls
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache_class(request, tmpdir):
+    if request.param == 'memory':
+        return MemoryCache
+
+    def sqlite_cache(**kwargs):
+        return SqliteCache(str(tmpdir.join('cache.sqlite')), **kwargs)
+
+    return sqlite_cache
+
+
+def test_key():
+    assert AbstractCache.key('status') == 'status'
+    assert AbstractCache.key('status', {}) == 'status'
+    assert AbstractCache.key('fixtures', {"season": 2021, "league": 39, "team": None}) == \
+        AbstractCache.key('fixtures', {"league": "39", "season": "2021"}) == \
+        'fixtures?league=39&season=2021'
+
+
+def test_cache_hits(test_v3, session, calls, cache_class):
+    test = test_v3(session=session, cache=cache_class())
+
+    first = test.status()
+    second = test.status()
+    assert calls == ['status']
+    assert type(second) is SuccessResponse
+    assert second.data.item() == first.data.item() == {"status": "ok"}
+    assert second.raw.status_code == 200
+    assert second.headers['Content-Type'] == 'application/json'
+
+    test.paginated_count(to=2, **{"from": 1})
+    test.paginated_count(**{"from": 1}, to="2")
+    test.paginated_count(to=3)
+    assert calls == ['status', 'paginated-count', 'paginated-count']
+
+
+def test_memory_cache_same_object(test_v3, session, calls):
+    test = test_v3(session=session, cache=MemoryCache())
+    assert test.status() is test.status()
+
+
+def test_errors_not_cached(test_v3, session, calls, cache_class):
+    test = test_v3(session=session, cache=cache_class())
+
+    assert not test.ping().ok
+    assert not test.ping().ok
+    assert calls == ['ping', 'ping']
+
+
+def test_ttl(test_v3, session, calls, cache_class, monkeypatch):
+    cache = cache_class(ttl=0, ttls={'/status': 10})
+    test = test_v3(session=session, cache=cache)
+
+    test.status()
+    test.status()
+    test.paginated_count()
+    test.paginated_count()
+    assert calls == ['status', 'paginated-count', 'paginated-count']
+    assert len(cache) == 1
+
+    monotonic, now = time.monotonic() + 11, time.time() + 11
+    monkeypatch.setattr(time, 'monotonic', lambda: monotonic)
+    monkeypatch.setattr(time, 'time', lambda: now)
+
+    test.status()
+    assert calls == ['status', 'paginated-count', 'paginated-count', 'status']
+
+
+def test_lru_max_entries(test_v3, session, calls, cache_class):
+    cache = cache_class(max_entries=2)
+    test = test_v3(session=session, cache=cache)
+
+    test.paginated_count(to=1)
+    test.paginated_count(to=2)
+    test.paginated_count(to=1)
+    test.paginated_count(to=3)
+    assert len(cache) == 2
+    assert len(calls) == 3
+
+    # to=2 was the least recently used
+    test.paginated_count(to=1)
+    assert len(calls) == 3
+    test.paginated_count(to=2)
+    assert len(calls) == 4
+
+
+def test_lru_max_bytes(test_v3, session, calls, cache_class):
+    size = len(test_v3(session=session).paginated_count(to=0).raw.content)
+    cache = cache_class(max_entries=None, max_bytes=size * 2)
+    test = test_v3(session=session, cache=cache)
+
+    for to in range(5):
+        test.paginated_count(to=to)
+
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_sqlite_persistent(test_v3, session, calls, tmpdir):
+    filename = str(tmpdir.join('cache.sqlite'))
+
+    test_v3(session=session, cache=SqliteCache(filename)).status()
+    response = test_v3(session=session, cache=SqliteCache(filename)).status()
+
+    assert calls == ['status']
+    assert response.data.item() == {"status": "ok"}
@@ -1,30 +1,26 @@
 import os
-from contextlib import contextmanager
+import sys
+import threading
+import time
 from math import ceil
 
 import pytest
 import requests
 import requests_mock
 
+import apisports
 from apisports import _client_class
-from apisports._client import ClientMeta, ClientInitError
-from apisports.data import SingleData, NoneData, SimpleData, PagedData
-from helpers import assert_response_ok
+from apisports._client import ClientMeta, ClientInitError, EndpointMethod, BatchError, plan_ids
+from apisports.data import SingleData, NoneData, SimpleData, PagedData, PagedDataError
+from apisports.ratelimit import RateLimiter
+from helpers import assert_response_ok, clientmeta_test_class, clientmeta_test_path, register_mock_uri, \
+    register_paginated_mock
 
 
-@contextmanager
-def clientmeta_test_path():
-    """
-    Get ClientMeta which loads from tests YAML location
-    """
-
-    prev_dir = ClientMeta.data_dir
-
-    try:
-        ClientMeta.data_dir = os.path.join(os.path.dirname(__file__), 'data')
-        yield ClientMeta
-    finally:
-        ClientMeta.data_dir = prev_dir
+@pytest.fixture
+def mock(session):
+    with requests_mock.mock() as mock:
+        return mock
 
 
 def expect_client_init_error(name, version=None):
@@ -43,55 +39,51 @@ def expect_client_init_error(name, version=None):
         )
 
 
-def clientmeta_test_class(name, version=None):
-    with clientmeta_test_path():
-        cls = _client_class(name, version)
-    return cls
+def test_client_init_error():
+    expect_client_init_error('FileDoesNotExist')
+    expect_client_init_error('InvalidYAML')
 
 
-@pytest.fixture
-def test_v3():
-    return clientmeta_test_class('test', 3)
+def test_clientmeta_compiled_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(ClientMeta, 'cache_dir', str(tmpdir))
 
+    cls = clientmeta_test_class('test', 3)
+    compiled = tmpdir.listdir()
+    assert len(compiled) == 1
+    assert compiled[0].basename.startswith('test-v3.')
+    assert compiled[0].basename.endswith(f'.{sys.implementation.cache_tag}.marshal')
 
-@pytest.fixture
-def mock(session):
-    with requests_mock.mock() as mock:
-        return mock
+    def fail_compile(source):
+        raise AssertionError('compiled API config should have been used')
 
+    monkeypatch.setattr(ClientMeta, 'compile', fail_compile)
+    cached_cls = clientmeta_test_class('test', 3)
 
-@pytest.fixture
-def session(adapter):
-    session = requests.Session()
-    session.mount('http+mock://', adapter)
-    return session
+    assert cached_cls.default_host == cls.default_host
+    assert cached_cls.paginated_count.__doc__ == cls.paginated_count.__doc__
 
 
-@pytest.fixture
-def adapter():
-    return requests_mock.Adapter()
-
-
-def register_mock_uri(adapter, *args, **kwargs):
-    def _(func):
-        def wrapped_func(request, context):
-            context.status_code = 200
-            context.headers['Content-Type'] = 'application/json'
-            return func(request, context)
-
-        adapter.register_uri(
-            'GET',
-            *args,
-            **kwargs,
-            json=wrapped_func
-        )
+def test_clientmeta_compiled_cache_invalid(tmpdir, monkeypatch):
+    monkeypatch.setattr(ClientMeta, 'cache_dir', str(tmpdir))
 
-    return _
+    clientmeta_test_class('test', 3)
+    tmpdir.listdir()[0].write_binary(b'invalid')
 
+    cls = clientmeta_test_class('test', 3)
+    assert callable(cls.paginated_count)
 
-def test_client_init_error():
-    expect_client_init_error('FileDoesNotExist')
-    expect_client_init_error('InvalidYAML')
+
+def test_lazy_client_classes():
+    from apisports import Hockey
+
+    assert 'Hockey' in vars(apisports)
+    assert apisports.Hockey is Hockey
+    assert issubclass(Hockey, apisports.Client)
+    assert Hockey.__name__ == 'Hockey'
+    assert 'Formula1' in dir(apisports)
+
+    with pytest.raises(AttributeError):
+        apisports.Cricket
 
 
 def test_clientmeta(test_v3, session):
@@ -104,6 +96,32 @@ def test_clientmeta(test_v3, session):
     assert callable(test_v3.import_)
 
 
+def test_lazy_docstrings(test_v3, session, adapter):
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/ping')
+    def mock_ping(request, context):
+        return {"response": "pong"}
+
+    method = vars(test_v3)['ping']
+    assert type(method) is EndpointMethod
+
+    test = test_v3(session=session)
+    assert test.ping().data.item() == 'pong'
+    assert method._doc is None
+
+    assert test.ping.__name__ == 'ping'
+    assert 'Ping/Pong Protocol' in test.ping.__doc__
+    assert ':rtype: apisports.response.AbstractResponse' in test.ping.__doc__
+    assert method._doc is not None
+
+    # class access gives a plain function for the benefit of introspection tools
+    assert test_v3.paginated_count.__name__ == 'paginated_count'
+    assert ':type from_: integer' in test_v3.paginated_count.__doc__
+    assert test_v3.paginated_count is test_v3.paginated_count
+
+    # the class keeps its own docstring
+    assert EndpointMethod.__doc__.strip().startswith('Method calling an API endpoint')
+
+
 def test_session(test_v3, session):
     t = test_v3(session=session)
     t2 = test_v3()
@@ -232,3 +250,197 @@ def test_paginated_count(test_v3, session, mock, adapter):
     assert list(iter(response.data)) == expected
     assert list(iter(response)) == expected
     assert response.data.item() == 1
+
+
+@pytest.mark.parametrize('concurrency', [None, 2])
+def test_paginated_shared(test_v3, session, adapter, concurrency):
+    stats = register_paginated_mock(adapter, total=6)
+    data = test_v3(session=session).paginated_count().data
+
+    a = data.prefetch(concurrency) if concurrency else iter(data)
+    b = iter(data)
+    rows_a = [next(a) for _ in range(4)]  # fetches page 2
+    rows_b = [next(b) for _ in range(7)]  # fetches page 3
+    rows_a += list(a)  # fetches page 4 on, not page 3 again
+    rows_b += list(b)
+
+    assert rows_a == rows_b == list(range(18))
+    if concurrency is None:
+        assert stats['pages'] == [1, 2, 3, 4, 5, 6]
+    else:
+        # page 3 was requested ahead by the thread pool of a when b needed it, later pages are requested once
+        assert sorted(stats['pages']) == [1, 2, 3, 3, 4, 5, 6]
+
+
+def test_paginated_prefetch(test_v3, session, adapter):
+    stats = register_paginated_mock(adapter, total=10, delay=0.02)
+
+    response = test_v3(session=session).paginated_count()
+    assert list(response.data.prefetch(4)) == list(range(30))
+    assert sorted(stats['pages']) == list(range(1, 11))
+    assert 1 < stats['max_active'] <= 4
+
+    # all pages are known now, iterating again does not fetch anything
+    assert list(response.data.prefetch(4)) == list(range(30))
+    assert list(response.data) == list(range(30))
+    assert len(stats['pages']) == 10
+    assert len(response.data) == 30
+
+
+def test_paginated_prefetch_error(test_v3, session, adapter):
+    stats = register_paginated_mock(adapter, total=10, failing_page=4)
+
+    response = test_v3(session=session).paginated_count()
+    rows = []
+    with pytest.raises(PagedDataError) as exc:
+        for row in response.data.prefetch(2):
+            rows.append(row)
+
+    assert "page: failed" in str(exc.value)
+    assert rows == list(range(9))
+    # no more than `concurrency` pages are requested beyond the failed page
+    assert max(stats['pages']) <= 5
+
+
+def register_ping_mock(adapter, delays=None):
+    """Ping endpoint answering with its ``id`` parameter, after the delay given per id"""
+
+    stats = dict(active=0, max_active=0, ids=[])
+    lock = threading.Lock()
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/ping')
+    def mock_ping(request, context):
+        request_id = int(request.qs['id'][0])
+
+        with lock:
+            stats['active'] += 1
+            stats['max_active'] = max(stats['max_active'], stats['active'])
+            stats['ids'].append(request_id)
+
+        time.sleep((delays or {}).get(request_id, 0.01))
+
+        with lock:
+            stats['active'] -= 1
+
+        return {"get": "ping", "parameters": {"id": str(request_id)}, "errors": [], "results": 1,
+                "response": [request_id]}
+
+    return stats
+
+
+def test_batch(test_v3, session, adapter):
+    stats = register_ping_mock(adapter, delays={0: 0.1})
+
+    requests_list = [('ping', {'id': i}) for i in range(10)]
+    results = list(test_v3(session=session).batch(requests_list, concurrency=3))
+
+    assert [request for request, _ in results] == requests_list
+    assert [response.data.item() for _, response in results] == list(range(10))
+    assert 1 < stats['max_active'] <= 3
+
+
+def test_batch_unordered(test_v3, session, adapter):
+    register_ping_mock(adapter, delays={0: 0.2})
+
+    results = test_v3(session=session).batch((('ping', {'id': i}) for i in range(6)), concurrency=3, ordered=False)
+    ids = [response.data.item() for _, response in results]
+
+    # the slow first request does not hold back the others
+    assert sorted(ids) == list(range(6))
+    assert ids[-1] == 0
+
+
+def test_batch_close(test_v3, session, adapter):
+    stats = register_ping_mock(adapter)
+
+    results = test_v3(session=session).batch((('ping', {'id': i}) for i in range(100)), concurrency=2)
+    next(results)
+    results.close()
+    time.sleep(0.05)
+
+    assert len(stats['ids']) <= 4
+
+
+def test_batch_rate_limited(test_v3, session, adapter):
+    register_ping_mock(adapter, delays={i: 0 for i in range(6)})
+    sleeps = []
+    limiter = RateLimiter(per_minute=2, clock=lambda: 0., sleep=sleeps.append)
+
+    list(test_v3(session=session, rate_limiter=limiter).batch([('ping', {'id': i}) for i in range(6)]))
+
+    assert sorted(sleeps) == [30., 60., 90., 120.]
+
+
+def test_many(test_v3, session, adapter):
+    register_ping_mock(adapter)
+
+    client = test_v3(session=session)
+    results = list(client.many('ping', id=[1, 2, 3], x=('a', 'b'), y=1))
+
+    assert [request for request, _ in results] == [
+        ('ping', {'id': i, 'x': x, 'y': 1}) for i in (1, 2, 3) for x in ('a', 'b')
+    ]
+    assert [response.data.item() for _, response in results] == [1, 1, 2, 2, 3, 3]
+
+    assert [request for request, _ in client.many('ping', id=5)] == [('ping', {'id': 5})]
+
+    with pytest.raises(AttributeError):
+        client.many('status')
+    with pytest.raises(AttributeError):
+        client.many('unknown')
+
+
+def test_plan_ids():
+    assert plan_ids([1, 2, 3, 4, 5, 2, '1'], 2) == ['1-2', '3-4', '5']
+    assert plan_ids(range(3)) == ['0-1-2']
+    assert plan_ids([]) == []
+
+
+def test_multi_ids(test_v3):
+    assert test_v3._multi_ids == {'items': ('ids', 3, 'item.id')}
+    assert apisports.Football._multi_ids['fixtures'] == ('ids', 20, 'fixture.id')
+
+
+def register_items_mock(adapter, missing=(), failing=None):
+    calls = []
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/items')
+    def mock_items(request, context):
+        ids = request.qs['ids'][0]
+        calls.append(ids)
+        if ids == failing:
+            return {"errors": {"ids": "failed"}}
+
+        rows = [{"item": {"id": int(i)}, "value": f"item {i}"} for i in ids.split('-') if int(i) not in missing]
+        return {"get": "items", "parameters": {"ids": ids}, "errors": [], "results": len(rows), "response": rows}
+
+    return calls
+
+
+def test_by_ids(test_v3, session, adapter):
+    calls = register_items_mock(adapter, missing=(5,))
+
+    rows = test_v3(session=session).by_ids('items', [7, 1, 2, 3, 4, 5, 6, 1, '2'], concurrency=2)
+
+    assert sorted(calls) == ['3-4-5', '6', '7-1-2']
+    assert list(rows) == [7, 1, 2, 3, 4, 5, 6, '2']
+    assert rows[7] == {"item": {"id": 7}, "value": "item 7"}
+    assert rows['2'] == rows[2]
+    assert rows[5] is None
+
+
+def test_by_ids_error(test_v3, session, adapter):
+    register_items_mock(adapter, failing='4-5')
+
+    client = test_v3(session=session)
+    with pytest.raises(BatchError) as exc:
+        client.by_ids('items', range(1, 6))
+    assert "ids=4-5" in str(exc.value)
+
+    with pytest.raises(ValueError):
+        client.by_ids('ping', [1, 2])
+
+
+def test_prefetch_non_paged():
+    assert list(NoneData.prefetch(4)) == []
+    assert list(SimpleData([1, 2]).prefetch(4)) == [1, 2]
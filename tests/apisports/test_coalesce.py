@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+import requests_mock
+
+from apisports import AsyncClient
+from apisports.coalesce import Coalescer
+from helpers import StubServer, clientmeta_test_class, register_mock_uri, register_paginated_mock
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def test_client(calls):
+    adapter = requests_mock.Adapter()
+    session = requests.Session()
+    session.mount('http+mock://', adapter)
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/paginated-count')
+    def mock_paginated_count(request, context):
+        calls.append(request.qs)
+        time.sleep(0.1)
+        return {"response": [request.qs]}
+
+    return clientmeta_test_class('test', 3)(session=session, coalesce=True)
+
+
+def test_coalesce(test_client, calls):
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        responses = list(executor.map(lambda i: test_client.paginated_count(to=i % 2), range(10)))
+
+    assert len(calls) == 2
+    assert all(response is responses[i % 2] for i, response in enumerate(responses))
+    assert test_client.coalescer.stats == dict(calls=10, coalesced=8)
+
+    # nothing in flight anymore, so a new request is made
+    test_client.paginated_count(to=0)
+    assert len(calls) == 3
+    assert test_client.coalescer.stats == dict(calls=11, coalesced=8)
+
+
+def test_coalesce_paged(test_v3, session, adapter):
+    stats = register_paginated_mock(adapter, total=4, delay=0.05)
+    api = test_v3(session=session, coalesce=True)
+    barrier = threading.Barrier(3)
+
+    def rows(prefetch):
+        barrier.wait()
+        data = api.paginated_count().data
+        barrier.wait()
+        return list(data.prefetch(2) if prefetch else data)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(rows, [False, False, True]))
+
+    # all threads iterate over the same data object, every page is added once
+    assert results == [list(range(12))] * 3
+    assert sorted(set(stats['pages'])) == [1, 2, 3, 4]
+    assert stats['pages'].count(1) == 1
+
+
+def test_coalesce_disabled():
+    assert clientmeta_test_class('test', 3)().coalescer is None
+
+
+def test_coalesce_exception():
+    coalescer = Coalescer()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError('failed')
+
+    def follower():
+        started.wait()
+        return coalescer.call('key', lambda: 'not called')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(coalescer.call, 'key', fail)
+        follower = executor.submit(follower)
+
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert coalescer.stats == dict(calls=2, coalesced=1)
+
+
+def test_async_coalesce():
+    with StubServer() as stub:
+        @stub.route('/status')
+        def status(params):
+            time.sleep(0.1)
+            return {"response": {"status": "ok"}}
+
+        async def main():
+            async with clientmeta_test_class('test', 3, base=AsyncClient)(host=stub.url, coalesce=True) as api:
+                responses = await asyncio.gather(*(api.status() for _ in range(10)))
+                assert all(response is responses[0] for response in responses)
+                assert api.coalescer.stats == dict(calls=10, coalesced=9)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+        assert len(stub.requests) == 1
+
+
+def test_async_coalesce_leader_cancelled():
+    coalescer = Coalescer()
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return 'response'
+
+    async def main():
+        leader = asyncio.ensure_future(asyncio.wait_for(coalescer.async_call('key', request), 0.01))
+        while not calls:
+            await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(coalescer.async_call('key', request)) for _ in range(3)]
+
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+
+        return await asyncio.gather(*followers)
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(main()) == ['response'] * 3
+    finally:
+        loop.close()
+
+    assert calls == [1]
+    assert coalescer.stats == dict(calls=4, coalesced=3)
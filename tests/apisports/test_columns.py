@@ -0,0 +1,172 @@
+import json
+
+import pytest
+
+from apisports.columns import concat_columns, to_columns
+from apisports.data import AbstractData, NoneData
+from apisports.records import RecordFactory
+from apisports.response import AbstractResponse
+from helpers import MockResponse
+
+SHAPE = (
+    ('player', (('id', 'int'), ('name', 'str'), ('rating', 'float'), ('injured', 'bool'), ('number', None))),
+    ('statistics', [(('team', (('id', 'int'), ('name', 'str'))), ('goals', 'int'))]),
+)
+
+ROWS = [
+    {
+        'player': {'id': 1, 'name': 'A', 'rating': 7, 'injured': False, 'number': None},
+        'statistics': [{'team': {'id': 10, 'name': 'X'}, 'goals': 3}],
+    },
+    {
+        'player': {'id': 2, 'name': None, 'rating': 6.5, 'injured': True, 'number': None},
+        'statistics': [],
+    },
+    {
+        'player': {'id': 3, 'name': 'C', 'rating': None, 'injured': None, 'number': None},
+        'statistics': [{'team': {'id': 11, 'name': 'Y'}, 'goals': None}],
+    },
+]
+
+FIELDS = ['player.id', 'player.name', 'player.rating', 'player.injured', 'player.number',
+          'statistics.0.team.name', 'statistics.0.goals', 'statistics.0.team', 'player.missing.deeper']
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+
+    columns = to_columns(ROWS, FIELDS, shape=SHAPE, backend='numpy')
+
+    assert list(columns) == FIELDS
+    for column in columns.values():
+        assert isinstance(column, numpy.ma.MaskedArray)
+        assert len(column) == 3
+
+    assert columns['player.id'].dtype == numpy.int64
+    assert columns['player.id'].tolist() == [1, 2, 3]
+    assert columns['player.name'].tolist() == ['A', None, 'C']
+    assert columns['player.rating'].dtype == numpy.float64
+    assert columns['player.rating'].tolist() == [7., 6.5, None]
+    assert columns['player.injured'].dtype == numpy.bool_
+    assert columns['player.injured'].tolist() == [False, True, None]
+    assert columns['player.number'].mask.all()
+    assert columns['statistics.0.team.name'].tolist() == ['X', None, 'Y']
+    assert columns['statistics.0.goals'].dtype == numpy.int64
+    assert columns['statistics.0.goals'].mask.tolist() == [False, True, True]
+    assert columns['statistics.0.team'].dtype == object
+    assert columns['statistics.0.team'][0] == {'id': 10, 'name': 'X'}
+    assert columns['player.missing.deeper'].mask.all()
+
+
+def test_arrow():
+    pyarrow = pytest.importorskip('pyarrow')
+
+    columns = to_columns(ROWS, FIELDS, shape=SHAPE, backend='arrow')
+
+    assert columns['player.id'].type == pyarrow.int64()
+    assert columns['player.name'].to_pylist() == ['A', None, 'C']
+    assert columns['player.rating'].type == pyarrow.float64()
+    assert columns['player.rating'].null_count == 1
+    assert columns['player.injured'].type == pyarrow.bool_()
+    assert columns['statistics.0.goals'].to_pylist() == [3, None, None]
+    assert columns['statistics.0.team'].to_pylist() == [{'id': 10, 'name': 'X'}, None, {'id': 11, 'name': 'Y'}]
+    assert columns['player.missing.deeper'].null_count == 3
+
+
+def test_arrow_mixed_types():
+    pyarrow = pytest.importorskip('pyarrow')
+
+    columns = to_columns([{'value': 1}, {'value': 'a'}, {'value': [1]}, {}], ['value'], backend='arrow')
+
+    assert columns['value'].type == pyarrow.string()
+    assert columns['value'].to_pylist() == ['1', '"a"', '[1]', None]
+
+
+def test_concat():
+    numpy = pytest.importorskip('numpy')
+    pyarrow = pytest.importorskip('pyarrow')
+
+    parts = [to_columns(ROWS[:1], FIELDS, shape=SHAPE, backend='numpy'),
+             to_columns(ROWS[1:], FIELDS, shape=SHAPE, backend='numpy')]
+    columns = concat_columns(parts, FIELDS)
+    assert isinstance(columns['player.id'], numpy.ma.MaskedArray)
+    assert columns['player.rating'].tolist() == [7., 6.5, None]
+
+    # a column without values in one of the parts
+    parts = [to_columns([{'value': 1}], ['value'], backend='arrow'), to_columns([{}], ['value'], backend='arrow')]
+    columns = concat_columns(parts, ['value'])
+    assert columns['value'].type == pyarrow.int64()
+    assert columns['value'].to_pylist() == [1, None]
+
+
+def test_declared_types():
+    numpy = pytest.importorskip('numpy')
+
+    rows = [{'player': {'id': None, 'rating': 7}}]
+    columns = to_columns(rows, ['player.id', 'player.rating', 'player.other'], shape=SHAPE, backend='numpy')
+
+    # all null, typed from the shape
+    assert columns['player.id'].dtype == numpy.int64
+    # declared float, the values are integers
+    assert columns['player.rating'].dtype == numpy.float64
+    assert columns['player.other'].dtype == object
+
+
+def test_records():
+    pytest.importorskip('numpy')
+
+    rows = RecordFactory({'players': [[SHAPE]]}).convert('players', ROWS)
+    columns = to_columns(rows, FIELDS, shape=SHAPE, backend='numpy')
+
+    assert columns['player.id'].tolist() == [1, 2, 3]
+    assert columns['statistics.0.team.name'].tolist() == ['X', None, 'Y']
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        to_columns(ROWS, FIELDS, backend='pandas')
+
+
+def test_data_to_columns():
+    pytest.importorskip('numpy')
+
+    class Client:
+        _row_shapes = {'players': [[SHAPE]]}
+
+    data = AbstractData.create(Client(), {'get': 'players', 'response': ROWS})
+
+    columns = data.to_columns(['player.id', 'player.number'], backend='numpy')
+    assert columns['player.id'].tolist() == [1, 2, 3]
+    assert columns['player.number'].dtype == object
+
+    assert len(NoneData.to_columns(['player.id'], backend='numpy')['player.id']) == 0
+
+
+class PagedClient:
+    _row_shapes = {'players': [[SHAPE]]}
+
+    def page(self, page):
+        return {
+            'get': 'players',
+            'parameters': {},
+            'paging': {'current': page, 'total': 3},
+            'results': 1,
+            'response': [{'player': {'id': page}}],
+        }
+
+    def get(self, _endpoint, params):
+        return AbstractResponse.create(self, MockResponse(json.dumps(self.page(params['page']))))
+
+
+def test_paged_to_columns():
+    numpy = pytest.importorskip('numpy')
+
+    client = PagedClient()
+    data = AbstractData.create(client, client.page(1))
+
+    columns = data.to_columns(['player.id', 'player.name'], backend='numpy', concurrency=2)
+
+    assert columns['player.id'].tolist() == [1, 2, 3]
+    assert columns['player.name'].dtype == object
+    assert columns['player.name'].mask.all()
+    assert isinstance(columns['player.id'], numpy.ma.MaskedArray)
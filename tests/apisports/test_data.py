@@ -1,3 +1,6 @@
+import json
+import weakref
+
 import pytest
 
 from apisports.data import *
@@ -157,3 +160,118 @@ def test_paged_data():
 
     assert "Could not fetch next page" in str(exc)
     assert "error: Mock Error" in str(exc)
+
+
+class PagesMockClient:
+    def __init__(self, total, per_page=3, failing=()):
+        self.total = total
+        self.per_page = per_page
+        self.responses = []
+        # pages failing once
+        self.failing = set(failing)
+
+    def page(self, page):
+        start = (page - 1) * self.per_page
+        return {
+            "get": "/pages",
+            "paging": {"current": page, "total": self.total},
+            "results": self.per_page,
+            "response": list(range(start, start + self.per_page)),
+        }
+
+    def get(self, _endpoint, params):
+        if params['page'] in self.failing:
+            self.failing.remove(params['page'])
+            return AbstractResponse.create(self, MockResponse('{"errors": {"page": "failed"}}'))
+        response = AbstractResponse.create(self, MockResponse(json.dumps(self.page(params['page']))))
+        self.responses.append(weakref.ref(response))
+        return response
+
+
+def test_paged_data_stream():
+    client = PagesMockClient(total=5)
+    data_obj = AbstractData.create(client, client.page(1))
+
+    alive = []
+    rows = []
+    for row in data_obj.stream():
+        rows.append(row)
+        alive.append(sum(ref() is not None for ref in client.responses))
+
+    assert rows == list(range(15))
+    # never more than the page being consumed is kept alive
+    assert max(alive) == 1
+    assert len(client.responses) == 4
+
+    # streamed pages are not kept, normal iteration fetches them
+    assert list(data_obj) == list(range(15))
+    assert len(client.responses) == 8
+    assert list(data_obj.stream()) == list(range(15))
+    assert len(client.responses) == 8
+
+
+def test_paged_data_stream_concurrent():
+    client = PagesMockClient(total=20)
+    data_obj = AbstractData.create(client, client.page(1))
+
+    assert list(data_obj.stream(concurrency=4)) == list(range(60))
+    assert len(client.responses) == 19
+    assert all(ref() is None for ref in client.responses)
+
+
+def test_paged_data_stream_error():
+    data_obj = PagedData(
+        MockClient(AbstractResponse.create(None, MockResponse('{"errors": {"error": "Mock Error"}}'))),
+        {"response": [0, 1], "paging": {"current": 1, "total": 3}, "results": 2, "get": "/null"}
+    )
+
+    iterator = data_obj.stream()
+    assert next(iterator) == 0
+    assert next(iterator) == 1
+    with pytest.raises(PagedDataError) as exc:
+        next(iterator)
+
+    assert "error: Mock Error" in str(exc.value)
+
+
+def test_paged_data_resume():
+    client = PagesMockClient(total=5, failing=[3])
+    data_obj = AbstractData.create(client, client.page(1))
+
+    rows = []
+    with pytest.raises(PagedDataError) as exc:
+        rows.extend(data_obj)
+    assert exc.value.page == 3
+    assert rows == list(range(6))
+
+    rows.extend(data_obj.resume())
+    assert rows == list(range(15))
+    # the failed page is fetched again, the pages before it are not
+    assert len(client.responses) == 4
+    assert list(data_obj.resume()) == []
+    assert list(data_obj) == list(range(15))
+
+
+def test_paged_data_stream_resume():
+    client = PagesMockClient(total=5, failing=[4])
+    data_obj = AbstractData.create(client, client.page(1))
+
+    rows = []
+    with pytest.raises(PagedDataError) as exc:
+        rows.extend(data_obj.stream())
+    assert exc.value.page == 4
+
+    rows.extend(data_obj.stream(page=exc.value.page))
+    assert rows == list(range(15))
+    assert len(client.responses) == 4
+
+    assert list(data_obj.stream(page=5)) == [12, 13, 14]
+    list(data_obj)
+    assert list(data_obj.stream(page=2)) == list(range(3, 15))
+    assert list(data_obj.stream(page=1)) == list(range(15))
+    assert len(client.responses) == 9
+
+
+def test_stream_non_paged():
+    assert list(NoneData.stream()) == []
+    assert list(SimpleData([1, 2]).stream()) == [1, 2]
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from apisports import Football
+from apisports.data import PagedDataError
+from apisports.decodepool import DecodePool
+from apisports.metrics import Listener
+from apisports.testing import StubAPI
+
+FIELDS = ['player.id', 'player.name', 'statistics.0.games.rating', 'player.injured']
+
+
+@pytest.fixture(scope='module')
+def stub():
+    with StubAPI('football', rows=50, pages=4) as stub:
+        yield stub
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = DecodePool(processes=1, min_size=1024)
+    yield pool
+    pool.shutdown()
+
+
+class Decodes(Listener):
+    def __init__(self):
+        self.sizes = []
+
+    def decode(self, size, duration):
+        self.sizes.append(size)
+
+
+def test_decode(stub, pool):
+    decodes = Decodes()
+    api = Football(host=stub.url, decode_pool=pool, hooks=[decodes])
+
+    assert api.decode_pool is pool
+    response = api.teams(league=39, season=2020)
+    assert response._pending is not None
+    assert list(response.data) == list(Football(host=stub.url).teams(league=39, season=2020).data)
+    assert response._pending is None
+    assert decodes.sizes == [len(response.raw.content)]
+
+    # too small
+    assert api.timezone()._pending is None
+
+
+def test_decode_fallback(stub):
+    # a decoder that can not be sent to the worker processes
+    pool = DecodePool(processes=1, min_size=0)
+    try:
+        api = Football(host=stub.url, decode_pool=pool, json_decoder=lambda content: {"errors": [], "response": [1]})
+        response = api.teams(league=39, season=2020)
+        assert response._pending is not None
+        assert list(response.data) == [1]
+    finally:
+        pool.shutdown()
+
+
+def test_to_columns_fallback(stub):
+    numpy = pytest.importorskip('numpy')
+
+    # a local function, it can not be sent to the worker processes
+    def loads(content):
+        payload = json.loads(content)
+        return {**payload, "response": [{"player": {"id": row['player']['id']}} for row in payload['response']]}
+
+    expected = Football(host=stub.url, json_decoder=loads).players(league=39, season=2020).data.to_columns(
+        ['player.id'], backend='numpy')
+
+    pool = DecodePool(processes=1)
+    try:
+        api = Football(host=stub.url, decode_pool=pool, json_decoder=loads)
+        columns = api.players(league=39, season=2020).data.to_columns(['player.id'], backend='numpy')
+    finally:
+        pool.shutdown()
+
+    assert len(columns['player.id']) == 200
+    assert numpy.array_equal(columns['player.id'], expected['player.id'])
+
+
+def test_columns_only(stub):
+    api = Football(host=stub.url, decode_pool=True)
+
+    assert api.decode_pool.min_size is None
+    assert api.teams(league=39, season=2020)._pending is None
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'arrow'])
+@pytest.mark.parametrize('concurrency', [None, 2])
+def test_to_columns(stub, pool, backend, concurrency):
+    pytest.importorskip('pyarrow' if backend == 'arrow' else 'numpy')
+
+    expected = Football(host=stub.url).players(league=39, season=2020).data.to_columns(FIELDS, backend=backend)
+    columns = Football(host=stub.url, decode_pool=pool).players(league=39, season=2020).data.to_columns(
+        FIELDS, backend=backend, concurrency=concurrency)
+
+    def values(column):
+        return column.tolist() if backend == 'numpy' else column.to_pylist()
+
+    assert list(columns) == FIELDS
+    for field in FIELDS:
+        assert type(columns[field]) is type(expected[field])
+        assert values(columns[field]) == values(expected[field])
+    assert len(columns['player.id']) == 200
+
+
+def test_to_columns_error(pool):
+    with StubAPI('football', rows=5, pages=4, bursts=(3, 1)) as stub:
+        data = Football(host=stub.url, decode_pool=pool).players(league=39, season=2020).data
+
+        with pytest.raises(PagedDataError) as info:
+            data.to_columns(FIELDS)
+        assert info.value.page == 3
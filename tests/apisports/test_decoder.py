@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from apisports.decoder import get_decoder
+from apisports.response import AbstractResponse, ErrorResponse, SuccessResponse
+from helpers import MockResponse, clientmeta_test_class
+
+
+def installed_decoders():
+    for name in ('orjson', 'simdjson', 'ujson'):
+        try:
+            get_decoder(name)
+        except ImportError:
+            continue
+        yield name
+    yield 'json'
+
+
+def test_get_decoder():
+    assert get_decoder('json') is json.loads
+    assert get_decoder('auto') is get_decoder()
+    assert callable(get_decoder())
+
+    def custom(content):
+        return {}
+
+    assert get_decoder(custom) is custom
+
+    with pytest.raises(ValueError):
+        get_decoder('yaml')
+
+
+@pytest.mark.parametrize("name", list(installed_decoders()))
+def test_decoders(name):
+    client = clientmeta_test_class('test', 3)(json_decoder=name)
+    text = '{"response": [{"name": "Zoë", "id": 1}]}'
+
+    response = AbstractResponse.create(client, MockResponse(text))
+    assert type(response) is SuccessResponse
+    assert response.data.item() == {"name": "Zoë", "id": 1}
+
+    response = AbstractResponse.create(client, MockResponse('{"response": '))
+    assert type(response) is ErrorResponse
+
+
+def test_client_decoder():
+    decoded = []
+
+    def custom(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    client = clientmeta_test_class('test', 3)(json_decoder=custom)
+    assert client.json_decoder is custom
+
+    response = AbstractResponse.create(client, MockResponse('{"response": "ok"}'))
+    assert response.data.item() == "ok"
+    assert decoded == [b'{"response": "ok"}']
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+import requests
+
+from apisports import AsyncClient
+from apisports.metrics import Histogram, Listener, MetricsCollector
+from helpers import StubServer, clientmeta_test_class, register_paginated_mock
+
+
+class Events(Listener):
+    def __init__(self):
+        self.events = []
+
+    def request_start(self, endpoint, params):
+        self.events.append(('request_start', endpoint))
+
+    def request_end(self, endpoint, params, response, duration, error=None):
+        self.events.append(('request_end', endpoint, type(error).__name__ if error else response.raw.status_code))
+
+    def decode(self, size, duration):
+        self.events.append(('decode', size))
+
+    def page(self, endpoint, page, wait):
+        self.events.append(('page', endpoint, page))
+
+
+def test_histogram():
+    histogram = Histogram([1, 2, 4])
+    assert histogram.quantile(.5) is None
+
+    for value in (.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.count == 5
+    assert histogram.sum == 16.5
+    assert histogram.quantile(.5) == 1.75
+    assert histogram.quantile(.2) == 1
+    assert histogram.quantile(1) == 4
+
+
+def test_events(test_v3, session, adapter):
+    register_paginated_mock(adapter, total=3)
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', exc=requests.exceptions.ConnectTimeout)
+
+    listener = Events()
+    api = test_v3(session=session, hooks=[listener])
+
+    response = api.paginated_count()
+    assert listener.events == [('request_start', 'paginated-count'), ('request_end', 'paginated-count', 200)]
+
+    list(response.data)
+    size = len(response.raw.content)
+    assert listener.events[2:] == [('decode', size)] + [
+        ('request_start', 'paginated-count'), ('request_end', 'paginated-count', 200), ('page', 'paginated-count', 2),
+        ('decode', size),
+        ('request_start', 'paginated-count'), ('request_end', 'paginated-count', 200), ('page', 'paginated-count', 3),
+        ('decode', size),
+    ]
+
+    api.hooks.remove(listener)
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        api.ping()
+    assert len(listener.events) == 11
+
+    api.hooks.add(listener)
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        api.ping()
+    assert listener.events[-1] == ('request_end', 'ping', 'ConnectTimeout')
+
+
+def test_no_hooks(test_v3):
+    api = test_v3()
+    assert api._hooks is None
+    assert len(api.hooks) == 0
+    assert api._hooks is not None
+
+
+def test_collector(test_v3, session, adapter):
+    stats = register_paginated_mock(adapter, total=4)
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', status_code=500, headers={
+        'x-ratelimit-requests-limit': '100', 'x-ratelimit-requests-remaining': '42', 'X-RateLimit-Remaining': 'n/a',
+    })
+
+    metrics = MetricsCollector()
+    api = test_v3(session=session, hooks=[metrics])
+    assert list(api.paginated_count().data.prefetch(2)) == list(range(12))
+    api.ping()
+
+    assert len(stats['pages']) == 4
+    assert metrics.requests == {('paginated-count', '200'): 4, ('ping', '500'): 1}
+    assert metrics.histogram('request_duration_seconds', 'paginated-count').count == 4
+    assert metrics.histogram('response_bytes', 'ping').count == 1
+    assert metrics.histogram('decode_duration_seconds').count == 4
+    assert metrics.histogram('page_wait_seconds', 'paginated-count').count == 3
+    assert metrics.histogram('request_duration_seconds', 'missing') is None
+    assert metrics.quota == {'requests_limit': 100., 'requests_remaining': 42.}
+
+    text = metrics.prometheus()
+    assert '# TYPE apisports_requests_total counter\n' in text
+    assert 'apisports_requests_total{endpoint="paginated-count",status="200"} 4\n' in text
+    assert 'apisports_request_duration_seconds_bucket{endpoint="ping",le="+Inf"} 1\n' in text
+    assert 'apisports_request_duration_seconds_count{endpoint="paginated-count"} 4\n' in text
+    assert 'apisports_decode_duration_seconds_count 4\n' in text
+    assert 'apisports_quota{name="requests_remaining"} 42.0\n' in text
+
+
+def test_async_hooks():
+    async_test_v3 = clientmeta_test_class('test', 3, base=AsyncClient)
+    listener = Events()
+
+    with StubServer() as stub:
+        @stub.route('/ping')
+        def ping(params):
+            return {"get": "ping", "errors": [], "results": 1, "response": {"pong": True}}
+
+        async def main():
+            async with async_test_v3(host=stub.url, hooks=[listener]) as api:
+                return await api.ping()
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(main()).ok
+        finally:
+            loop.close()
+
+    assert listener.events == [('request_start', 'ping'), ('request_end', 'ping', 200)]
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from apisports import AsyncClient
+from apisports.pool import PoolStats
+from helpers import StubServer, clientmeta_test_class
+
+
+@pytest.fixture
+def stub():
+    with StubServer() as server:
+        @server.route('/ping')
+        def ping(params):
+            time.sleep(float(params.get('sleep', 0)))
+            return {"get": "ping", "errors": [], "results": 1, "response": {"pong": True}}
+
+        yield server
+
+
+def test_pool_stats():
+    stats = PoolStats()
+    stats.add(requests=2, hits=1, misses=1)
+    stats.add(discarded=1)
+
+    assert stats.as_dict() == dict(requests=2, hits=1, misses=1, waited=0, discarded=1)
+
+
+def test_keepalive(test_v3, stub):
+    api = test_v3(host=stub.url)
+    for _ in range(5):
+        assert api.ping().ok
+
+    assert api.pool_stats == dict(requests=5, hits=4, misses=1, waited=0, discarded=0)
+    assert len(stub.connections) == 1
+
+
+def test_no_keepalive(test_v3, stub):
+    api = test_v3(host=stub.url, keepalive=False)
+    for _ in range(3):
+        assert api.ping().ok
+
+    assert api.pool_stats['misses'] == 3
+    assert len(stub.connections) == 3
+
+
+def test_pool_size(test_v3, stub):
+    def ping(api):
+        return api.ping(sleep=.05).ok
+
+    api = test_v3(host=stub.url, pool_maxsize=2)
+    with ThreadPoolExecutor(4) as executor:
+        assert all(executor.map(ping, [api] * 4))
+    assert api.pool_stats['discarded'] == 2
+
+    api = test_v3(host=stub.url, pool_maxsize=2, pool_block=True)
+    with ThreadPoolExecutor(4) as executor:
+        assert all(executor.map(ping, [api] * 4))
+    stats = api.pool_stats
+    assert stats['discarded'] == 0
+    assert stats['misses'] == 2
+    assert stats['waited'] >= 1
+
+
+def test_timeout(test_v3, stub):
+    api = test_v3(host=stub.url, timeout=(1, .05))
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        api.ping(sleep=.5)
+    assert test_v3(host=stub.url, timeout=1).ping(sleep=.05).ok
+
+
+def test_custom_session(test_v3, stub):
+    assert test_v3(host=stub.url, session=requests.Session()).pool_stats is None
+
+
+def test_async_pool(stub):
+    async_test_v3 = clientmeta_test_class('test', 3, base=AsyncClient)
+
+    async def main():
+        async with async_test_v3(host=stub.url, pool_maxsize=2) as api:
+            responses = await asyncio.gather(*(api.ping(sleep=.05) for _ in range(6)))
+            assert all(response.ok for response in responses)
+            return api.pool_stats
+
+    loop = asyncio.new_event_loop()
+    try:
+        stats = loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+    assert stats['requests'] == 6
+    assert stats['misses'] == 2
+    assert stats['hits'] == 4
+    assert stats['waited'] >= 1
+
+
+def test_async_timeout(stub):
+    async_test_v3 = clientmeta_test_class('test', 3, base=AsyncClient)
+
+    async def main():
+        async with async_test_v3(host=stub.url, timeout=(1, .05), keepalive=False) as api:
+            with pytest.raises(asyncio.TimeoutError):
+                await api.ping(sleep=.5)
+            assert (await api.ping()).ok
+            return api.pool_stats
+
+    loop = asyncio.new_event_loop()
+    try:
+        stats = loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+    assert stats['hits'] == 0
@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+import requests
+import requests_mock
+
+from apisports.ratelimit import RateLimiter, TokenBucket
+from apisports.response import AbstractResponse
+from helpers import MockResponse, clientmeta_test_class, register_mock_uri
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def rate_limit_response(limit=None, remaining=None, requests_limit=None, requests_remaining=None, status_code=200):
+    headers = {
+        "X-RateLimit-Limit": limit,
+        "X-RateLimit-Remaining": remaining,
+        "x-ratelimit-requests-limit": requests_limit,
+        "x-ratelimit-requests-remaining": requests_remaining,
+    }
+    return AbstractResponse.create(
+        None,
+        MockResponse('{"response": []}', status_code, {k: str(v) for k, v in headers.items() if v is not None})
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_unknown_limits(clock):
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+    for _ in range(1000):
+        limiter.acquire()
+
+    assert clock.now == 1000.
+
+
+def test_token_bucket(clock):
+    bucket = TokenBucket(60, 10, clock=clock)
+
+    assert [bucket.reserve() for _ in range(10)] == [0.] * 10
+    assert bucket.reserve() == pytest.approx(6.)
+    assert bucket.reserve() == pytest.approx(12.)
+
+    clock.now += 60
+    assert bucket.reserve() == 0.
+
+
+def test_pacing(clock):
+    limiter = RateLimiter(per_minute=30, clock=clock, sleep=clock.sleep)
+
+    for _ in range(30):
+        limiter.acquire()
+    assert clock.now == 1000.
+
+    for _ in range(30):
+        limiter.acquire()
+    assert clock.now == pytest.approx(1060.)
+
+
+def test_update_from_headers(clock):
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+    limiter.update(rate_limit_response(limit=10, remaining=2, requests_limit=100, requests_remaining=50))
+    assert limiter.minute.capacity == 10
+    assert limiter.minute.tokens == 2
+    assert limiter.day.capacity == 100
+    assert limiter.day.tokens == 50
+
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.now == 1000.
+    limiter.acquire()
+    assert clock.now == pytest.approx(1006.)
+
+    # daily quota used up, paced by the daily refill rate
+    limiter.update(rate_limit_response(limit=10, remaining=10, requests_limit=100, requests_remaining=0))
+    clock.now += 60
+    limiter.acquire()
+    assert clock.now == pytest.approx(1066. + (1 - 60 * 100 / 86400) * 864)
+
+
+def test_too_many_requests(clock):
+    limiter = RateLimiter(per_minute=60, clock=clock, sleep=clock.sleep)
+
+    limiter.update(rate_limit_response(status_code=429))
+    limiter.acquire()
+    assert clock.now == pytest.approx(1001.)
+
+
+def test_thread_safe(clock):
+    limiter = RateLimiter(per_minute=60, clock=clock)
+    delays = []
+
+    def worker():
+        for _ in range(50):
+            delays.append(limiter.reserve())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # every request got its own slot
+    assert sorted(delays) == pytest.approx([max(0., i - 59.) for i in range(400)])
+
+
+def test_client_rate_limiter(clock):
+    adapter = requests_mock.Adapter()
+    session = requests.Session()
+    session.mount('http+mock://', adapter)
+    remaining = iter(range(4, -100, -1))
+
+    @register_mock_uri(adapter, 'http+mock://api-test1.server.local/status')
+    def mock_status(request, context):
+        context.headers.update({"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": str(max(0, next(remaining)))})
+        return {"response": {"status": "ok"}}
+
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    test = clientmeta_test_class('test', 3)(session=session, rate_limiter=limiter)
+
+    for _ in range(5):
+        assert test.status().ok
+    assert clock.now == 1000.
+
+    test.status()
+    assert clock.now == pytest.approx(1012.)
@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+import apisports
+from apisports import ClientMeta
+from apisports.records import Record, RecordFactory, record_class
+
+
+def operation(get, response):
+    example = {'value': {'get': get, 'response': response}}
+    return {'get': {'responses': {'200': {'content': {'application/json': {'examples': {'example-1': example}}}}}}}
+
+
+SHAPES = ClientMeta._response_shapes({
+    '/teams': operation('teams', [{
+        'team': {'id': 33, 'name': 'Manchester United', 'national': False},
+        'venue': {'id': 556, 'name': 'Old Trafford'},
+        'players': [{'id': 1, 'name': 'A', 'in': 0}],
+    }]),
+    '/rankings/teams': operation('rankings', [{'position': 1, 'team': {'id': 1}, 'points': 99}]),
+    '/rankings/drivers': operation('rankings', [{'position': 1, 'driver': {'id': 1}}]),
+    '/status': operation('status', []),
+})
+
+
+def team_row(team_id, name='Manchester United'):
+    return {
+        'team': {'id': team_id, 'name': name, 'national': False},
+        'venue': {'id': 556, 'name': 'Old Trafford'},
+        'players': [{'id': 1, 'name': 'A', 'in': 0}, {'id': 2, 'name': 'B', 'in': 3}],
+    }
+
+
+def test_response_shapes():
+    assert SHAPES['teams'] == [[(
+        ('team', (('id', 'int'), ('name', 'str'), ('national', 'bool'))),
+        ('venue', (('id', 'int'), ('name', 'str'))),
+        ('players', [(('id', 'int'), ('name', 'str'), ('in', 'int'))]),
+    )]]
+    assert len(SHAPES['rankings']) == 2
+    assert SHAPES['rankings/teams'] == SHAPES['rankings'][:1]
+    assert 'status' not in SHAPES
+
+
+def test_convert():
+    rows = [team_row(33), team_row(34)]
+    converted = RecordFactory(SHAPES).convert('teams', json.loads(json.dumps(rows)))
+
+    assert len(converted) == 2
+    row = converted[0]
+    assert isinstance(row, Record)
+    assert type(row).__name__ == 'Teams'
+    assert type(row.team).__name__ == 'Team'
+    assert row.team.id == 33
+    assert row['team']['name'] == 'Manchester United'
+    assert row.players[1].in_ == 3
+    assert row.players[1]['in'] == 3
+    assert type(converted[1]) is type(row)
+
+    assert converted == rows
+    assert [r._asdict() for r in converted] == rows
+    assert type(row._asdict()['players'][0]) is dict
+    assert dict(row.venue) == {'id': 556, 'name': 'Old Trafford'}
+    assert list(row) == ['team', 'venue', 'players']
+    assert len(row) == 3
+    assert 'team' in row and 'missing' not in row
+    assert row.get('missing') is None
+    with pytest.raises(KeyError):
+        row['missing']
+    with pytest.raises(AttributeError):
+        row.missing = 1
+    assert repr(row.venue) == "Venue(id=556, name='Old Trafford')"
+
+
+def test_interned_strings():
+    rows = json.loads(json.dumps([team_row(33), team_row(34)]))
+    assert rows[0]['team']['name'] is not rows[1]['team']['name']
+
+    converted = RecordFactory(SHAPES).convert('teams', rows)
+    assert converted[0].team.name is converted[1].team.name
+
+    factory = RecordFactory(SHAPES, max_strings=0)
+    converted = factory.convert('teams', json.loads(json.dumps([team_row(33), team_row(34)])))
+    assert converted[0].team.name is not converted[1].team.name
+
+
+def test_unexpected_shapes():
+    row = team_row(33)
+    row['team']['founded'] = 1878
+    row['venue'] = None
+    row['players'] = {'id': 1}
+
+    converted = RecordFactory(SHAPES).convert('teams', [row])[0]
+
+    assert isinstance(converted, Record)
+    assert type(converted.team) is dict
+    assert converted.venue is None
+    assert converted.players == {'id': 1}
+    assert converted == row
+
+    assert RecordFactory(SHAPES).convert('unknown', [row]) == [row]
+
+
+def test_select_shape():
+    factory = RecordFactory(SHAPES)
+
+    teams = factory.convert('rankings', [{'position': 1, 'team': {'id': 1}, 'points': 99}])
+    drivers = factory.convert('rankings', [{'position': 1, 'driver': {'id': 1}}])
+
+    assert teams[0].team.id == 1
+    assert drivers[0].driver.id == 1
+    assert type(teams[0]) is not type(drivers[0])
+
+
+def test_record_class():
+    cls = record_class('Test', ['id', 'class', 'keys', '_private'])
+    record = cls(1, 2, 3, 4)
+
+    assert (record.id, record.class_, record.keys_, record._private_) == (1, 2, 3, 4)
+    assert dict(record) == {'id': 1, 'class': 2, 'keys': 3, '_private': 4}
+    assert not hasattr(record, '__dict__')
+
+    assert record_class('Test', ['0-15', '16-30']) is None
+
+
+def sample(shape, value='x'):
+    if type(shape) is tuple:
+        return {key: sample(child, value) for key, child in shape}
+    if type(shape) is list:
+        return [sample(shape[0], value)]
+    return value
+
+
+def test_client_records(adapter, session):
+    assert apisports.Football().records is None
+
+    client = apisports.Football(host='http+mock://football', session=session, records=True)
+    row = sample(client.records._shapes['players'][0][0], 'Brazil')
+    adapter.register_uri('GET', 'http+mock://football/players', json={
+        'get': 'players', 'parameters': {'id': '276'}, 'errors': [], 'results': 2, 'response': [row, row],
+    })
+
+    rows = list(client.players(id=276))
+
+    assert rows == [row, row]
+    assert isinstance(rows[0].player.birth, Record)
+    assert rows[0].statistics[0].team.name is rows[1].player.nationality
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from apisports import Football
+from apisports.replay import NotRecordedError, RecordReplayAdapter
+from apisports.testing import StubAPI
+
+
+@pytest.fixture(scope='module')
+def stub():
+    with StubAPI('football', rows=5, pages=3) as stub:
+        yield stub
+
+
+def record(directory, stub, mode='record'):
+    adapter = RecordReplayAdapter(directory, mode=mode)
+    return adapter, Football(host=stub.url, session=adapter.session())
+
+
+def test_record_replay(tmp_path, stub):
+    adapter, api = record(str(tmp_path), stub)
+    recorded = api.fixtures(league=39, season=2020)
+    players = list(api.players(league=39, season=2020).data)
+    adapter.close()
+
+    assert len(players) == 15
+
+    requests = stub.stats['requests']
+    adapter = RecordReplayAdapter(str(tmp_path))
+    api = Football(host=stub.url, session=adapter.session())
+
+    # parameters in any order
+    replayed = api.get('fixtures', {'season': 2020, 'league': 39})
+    assert replayed.ok
+    assert replayed.raw.content == recorded.raw.content
+    assert replayed.headers.requests_remaining == recorded.headers.requests_remaining
+    assert list(replayed.data) == list(recorded.data)
+    assert list(api.players(league=39, season=2020).data) == players
+    assert len(adapter) == 4
+    assert stub.stats['requests'] == requests
+
+    with pytest.raises(NotRecordedError):
+        api.fixtures(league=40, season=2020)
+
+
+def test_replay_in_order(tmp_path):
+    with StubAPI(responses={'timezone': lambda params: {"errors": [], "response": [str(os.urandom(4))]}}) as stub:
+        adapter, api = record(str(tmp_path), stub)
+        recorded = [list(api.timezone().data) for _ in range(3)]
+        url = stub.url
+        adapter.close()
+
+    assert len({str(rows) for rows in recorded}) == 3
+
+    adapter = RecordReplayAdapter(str(tmp_path), max_entries=1)
+    api = Football(host=url, session=adapter.session())
+
+    assert [list(api.timezone().data) for _ in range(4)] == recorded + recorded[-1:]
+
+
+def test_auto(tmp_path, stub):
+    adapter, api = record(str(tmp_path), stub, mode='auto')
+
+    api.teams(league=39, season=2020)
+    requests = stub.stats['requests']
+    api.teams(league=39, season=2020)
+    api.teams(league=39, season=2021)
+
+    assert stub.stats['requests'] == requests + 1
+    assert len(adapter) == 2
+
+
+def test_mode():
+    with pytest.raises(ValueError):
+        RecordReplayAdapter('unused', mode='rewind')
@@ -1,7 +1,8 @@
 import json
 import pytest
 
-from apisports.response import AbstractResponse, ErrorResponse, HttpErrorResponse, Headers
+from apisports.response import AbstractResponse, ErrorResponse, HttpErrorResponse, SuccessResponse, Headers, \
+    _scan_errors, _UNDECODED
 from helpers import MockResponse, assert_response_ok, assert_response_error
 
 
@@ -92,3 +93,85 @@ def test_response_headers(text):
     assert "X-Unknown-Header" not in response.headers
 
     assert response.headers["X-Unknown-Header"] is None
+
+
+class CountingClient:
+    def __init__(self):
+        self.decoded = 0
+
+    def json_decoder(self, content):
+        self.decoded += 1
+        return json.loads(content)
+
+
+@pytest.mark.parametrize("text", [
+    '{"get": "teams", "parameters": {"id": "33"}, "errors": [], "results": 1, "response": [{"id": 33}]}',
+    '{"errors": {}, "response": [{"id": 33}]}',
+    ' { "parameters" : [ "a\\"b", {"x": [1, {"y": "]}"}]} ] , "errors" : null , "response": []}',
+    '{"response": [{"id": 33}]}',
+])
+def test_lazy_success(text):
+    client = CountingClient()
+    response = AbstractResponse.create(client, MockResponse(text))
+
+    assert type(response) is SuccessResponse
+    assert response.ok
+    assert response.errors == {}
+    assert client.decoded == 0
+
+    assert response.data is not None
+    assert client.decoded == 1
+    assert response.ok
+    assert response.data is response.data
+    assert client.decoded == 1
+
+
+def test_lazy_error():
+    client = CountingClient()
+    response = AbstractResponse.create(
+        client,
+        MockResponse('{"get": "teams", "errors": {"token": "Invalid key"}, "response": [' + '1, ' * 1000 + '1]}')
+    )
+
+    assert_response_error(response)
+    assert type(response) is ErrorResponse
+    assert response.errors == {"token": "Invalid key"}
+    assert client.decoded == 0
+
+
+def test_lazy_invalid_payload():
+    # the errors key is fine, the rest of the body is not
+    response = AbstractResponse.create(None, MockResponse('{"errors": [], "response": [1, 2'))
+
+    assert type(response) is SuccessResponse
+    assert response.ok
+
+    assert len(response.data) == 0
+    assert not response.ok
+    assert response.errors
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"errors": [], "response": []}', []),
+    ('{"errors": {"a": "b"}}', {"a": "b"}),
+    ('{"errors": "oops"}', "oops"),
+    ('{"errors": false}', False),
+    ('{"response": [], "results": 0}', None),
+    ('{}', None),
+    ('{"response": "}", "errors": ["x"]}', ["x"]),
+    ('[]', _UNDECODED),
+    ('-', _UNDECODED),
+    ('', _UNDECODED),
+    ('{"response": [1, 2', _UNDECODED),
+    ('{"response" 1}', _UNDECODED),
+    ('{"errors": [}', _UNDECODED),
+])
+def test_scan_errors(text, expected):
+    assert _scan_errors(text.encode()) == expected
+
+
+def test_scan_errors_limit():
+    content = json.dumps(dict(response=list(range(1000)), errors=[])).encode()
+
+    assert _scan_errors(content) == []
+    assert _scan_errors(content, limit=100) is _UNDECODED
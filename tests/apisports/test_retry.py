@@ -0,0 +1,114 @@
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from apisports import AsyncClient
+from apisports.response import AbstractResponse
+from apisports.retry import RetryPolicy
+from helpers import MockResponse, StubServer, clientmeta_test_class
+
+PONG = {"get": "ping", "errors": [], "results": 1, "response": {"pong": True}}
+
+
+class Sleeps(list):
+    def __call__(self, delay):
+        self.append(delay)
+
+
+def policy(**kwargs):
+    return RetryPolicy(**{'random': lambda: .5, 'sleep': Sleeps(), **kwargs})
+
+
+def response(text='{}', status_code=200, headers=None):
+    return AbstractResponse.create(None, MockResponse(text, status_code, headers))
+
+
+def test_backoff():
+    retry = policy(backoff=1, max_backoff=5, retries=5)
+
+    assert [retry.delay(attempt) for attempt in range(6)] == [.5, 1, 2, 2.5, 2.5, None]
+    assert policy(backoff=1, jitter=False).delay(2) == 4
+
+
+def test_transient():
+    retry = policy()
+
+    assert retry.delay(0, response(status_code=503)) == .25
+    assert retry.delay(0, response(status_code=429)) == .25
+    assert retry.delay(0, response('{"errors": {"rateLimit": "Too many requests"}}')) == .25
+    assert retry.delay(0, response(status_code=404)) is None
+    assert retry.delay(0, response('{"errors": {"requests": "You have reached the request limit for the day"}}')) \
+        is None
+
+
+def test_retry_after():
+    retry = policy(max_retry_after=60)
+
+    assert retry.delay(0, response(status_code=429, headers={'Retry-After': '7'})) == 7
+    assert retry.delay(0, response(status_code=429, headers={'Retry-After': '3600'})) is None
+    assert retry.delay(0, response(status_code=429, headers={'Retry-After': 'soon'})) == .25
+
+    moment = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < retry.delay(0, response(status_code=503, headers={'Retry-After': moment})) <= 30
+
+
+def test_client_retry(test_v3, session, adapter):
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', [
+        {'exc': requests.exceptions.ConnectionError},
+        {'status_code': 502, 'text': 'Bad Gateway'},
+        {'status_code': 429, 'json': {}, 'headers': {'Retry-After': '2'}},
+        {'json': PONG},
+    ])
+
+    retry = policy()
+    response = test_v3(session=session, retry=retry).ping()
+
+    assert response.ok
+    assert retry.sleep == [.25, .5, 2]
+    assert adapter.call_count == 4
+
+
+def test_client_retry_exhausted(test_v3, session, adapter):
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', status_code=503, text='Unavailable')
+
+    retry = policy(retries=2)
+    response = test_v3(session=session, retry=retry).ping()
+    assert response.errors['http_status_code'] == 503
+    assert adapter.call_count == 3
+
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', exc=requests.exceptions.ConnectTimeout)
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        test_v3(session=session, retry=retry).ping()
+    assert adapter.call_count == 6
+
+
+def test_client_no_retry(test_v3, session, adapter):
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', status_code=503, text='Unavailable')
+
+    assert not test_v3(session=session).ping().ok
+    assert adapter.call_count == 1
+
+
+def test_async_retry():
+    async_test_v3 = clientmeta_test_class('test', 3, base=AsyncClient)
+    failures = [({}, 503), ({"errors": {"rateLimit": "Too many requests"}},)]
+
+    with StubServer() as stub:
+        @stub.route('/ping')
+        def ping(params):
+            return failures.pop(0) if failures else PONG
+
+        async def main():
+            async with async_test_v3(host=stub.url, retry=RetryPolicy(backoff=.01)) as api:
+                return await api.ping()
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(main()).ok
+        finally:
+            loop.close()
+
+        assert len(stub.requests) == 3
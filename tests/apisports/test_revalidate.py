@@ -0,0 +1,144 @@
+import asyncio
+import json
+
+from apisports import AsyncClient
+from apisports.data import SimpleData
+from apisports.revalidate import Revalidator
+from helpers import StubServer, clientmeta_test_class
+
+PING = {"get": "ping", "errors": [], "results": 2, "response": [{"id": 1}, {"id": 2}]}
+
+
+def register_ping_mock(adapter, versions, etag=True):
+    """Ping endpoint answering with the next of ``versions``, supporting ``If-None-Match`` if ``etag``"""
+
+    requests_seen = []
+
+    def mock_ping(request, context):
+        requests_seen.append(dict(request.headers))
+        body = versions.pop(0) if len(versions) > 1 else versions[0]
+        tag = '"%d"' % hash(json.dumps(body))
+        context.headers['X-RateLimit-Remaining'] = str(100 - len(requests_seen))
+        if etag:
+            context.headers['ETag'] = tag
+            if request.headers.get('If-None-Match') == tag:
+                context.status_code = 304
+                return ''
+        context.headers['Content-Type'] = 'application/json'
+        return json.dumps(body)
+
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', text=mock_ping)
+    return requests_seen
+
+
+def test_not_modified(test_v3, session, adapter):
+    changed = {**PING, "response": [{"id": 3}]}
+    seen = register_ping_mock(adapter, [PING, PING, changed])
+    api = test_v3(session=session, revalidate=True)
+
+    first = api.ping()
+    assert not first.not_modified
+    assert 'If-None-Match' not in seen[0]
+
+    second = api.ping()
+    assert seen[1]['If-None-Match'] == first.raw.headers['ETag']
+    assert second.raw.status_code == 200
+    assert second.ok
+    assert second.not_modified
+    assert second.data is first.data
+    assert type(second.data) is SimpleData
+    assert second.text == first.text
+    assert second.headers['X-RateLimit-Remaining'] == '98'
+
+    third = api.ping()
+    assert not third.not_modified
+    assert list(third) == [{"id": 3}]
+    assert api.revalidator.stats == dict(requests=3, not_modified=1, unchanged=0)
+
+
+def test_unchanged_body(test_v3, session, adapter):
+    seen = register_ping_mock(adapter, [PING], etag=False)
+    api = test_v3(session=session, revalidate=Revalidator(max_entries=1))
+
+    first = api.ping()
+    list(first)
+    second = api.ping()
+    assert 'If-None-Match' not in seen[1]
+    assert second.not_modified
+    assert second.data is first.data
+    assert api.revalidator.stats == dict(requests=2, not_modified=0, unchanged=1)
+
+    # other requests evict the response kept, as max_entries is 1
+    api.ping(id=1)
+    assert not api.ping().not_modified
+    assert len(api.revalidator) == 1
+
+
+def test_paged_data(test_v3, session, adapter):
+    polls = []
+
+    def mock_paginated_count(request, context):
+        page = int(request.qs.get('page', ['1'])[0])
+        polls.append(page)
+        context.headers['Content-Type'] = 'application/json'
+        # the first page never changes, the second one does
+        rows = [1, 2] if page == 1 else [polls.count(2)]
+        return json.dumps({
+            "get": "paginated-count", "errors": [], "parameters": {}, "results": len(rows),
+            "paging": {"current": page, "total": 2}, "response": rows,
+        })
+
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/paginated-count', text=mock_paginated_count)
+    api = test_v3(session=session, revalidate=True)
+
+    first = api.paginated_count()
+    assert list(first.data) == [1, 2, 1]
+
+    second = api.paginated_count()
+    assert second.not_modified
+    assert second.data is not first.data
+    assert list(second.data) == [1, 2, 2]
+    assert list(first.data) == [1, 2, 1]
+    assert polls == [1, 2, 1, 2]
+
+
+def test_errors_not_kept(test_v3, session, adapter):
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/ping', json={"errors": {"ping": "no pong"}})
+    api = test_v3(session=session, revalidate=True)
+
+    assert not api.ping().ok
+    assert not api.ping().not_modified
+    assert len(api.revalidator) == 0
+
+
+def test_no_revalidate(test_v3, session, adapter):
+    register_ping_mock(adapter, [PING])
+    api = test_v3(session=session)
+
+    assert api.revalidator is None
+    assert not api.ping().not_modified
+    assert not api.ping().not_modified
+
+
+def test_async_revalidate():
+    async_test_v3 = clientmeta_test_class('test', 3, base=AsyncClient)
+
+    with StubServer() as stub:
+        @stub.route('/ping')
+        def ping(params):
+            return PING
+
+        async def main():
+            async with async_test_v3(host=stub.url, revalidate=True) as api:
+                first = await api.ping()
+                second = await api.ping()
+                return first, second
+
+        loop = asyncio.new_event_loop()
+        try:
+            first, second = loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+    assert second.not_modified
+    assert second.data is first.data
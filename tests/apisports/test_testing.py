@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import pytest
+
+from apisports import AsyncFootball, Football, Formula1
+from apisports.data import PagedData, SingleData
+from apisports.retry import RetryPolicy
+from apisports.testing import StubAPI
+
+
+@pytest.fixture(scope='module')
+def stub():
+    with StubAPI('football', rows=5, pages=3) as stub:
+        yield stub
+
+
+@pytest.fixture
+def api(stub):
+    return Football(host=stub.url)
+
+
+def test_synthetic_rows(api):
+    response = api.teams(league=39, season=2020)
+
+    assert response.ok
+    assert response.headers.requests_limit == '100'
+    assert len(response.data) == 5
+    for row in response.data:
+        assert type(row['team']['id']) is int
+        assert type(row['team']['name']) is str
+        assert type(row['venue']['capacity']) is int
+
+    # the same request gets the same rows
+    assert list(api.teams(league=39, season=2020).data) == list(response.data)
+    assert list(api.teams(league=39, season=2021).data) != list(response.data)
+
+
+def test_paging(api):
+    data = api.players(league=39, season=2020).data
+
+    assert type(data) is PagedData
+    assert len(list(data)) == 15
+    assert api.players(league=39, season=2020, page=4).raw.json()['results'] == 0
+
+
+def test_bodies_bounded():
+    with StubAPI(max_entries=2) as stub:
+        api = Football(host=stub.url)
+        first = api.fixtures(id=1).raw.content
+        for i in range(2, 10):
+            api.fixtures(id=i)
+
+        assert len(stub._bodies) == 2
+        # dropped bodies are built again, the same way
+        assert api.fixtures(id=1).raw.content == first
+
+
+def test_single_object(api):
+    data = api.teams_statistics(league=39, season=2020, team=33).data
+
+    assert type(data) is SingleData
+    assert type(data.item()['fixtures']['played']['home']) is int
+
+
+def test_ids(api):
+    assert [row['fixture']['id'] for row in api.fixtures(id=77).data] == [77]
+    assert [row['fixture']['id'] for row in api.fixtures(ids='3-1-2').data] == [3, 1, 2]
+    assert list(api.by_ids('fixtures', [5, 6, 7])) == [5, 6, 7]
+
+
+def test_parameter_errors(api):
+    response = api.players(season='last', search='x', unknown=1)
+
+    assert not response.ok
+    assert response.errors == {
+        'season': 'The season field is invalid.',
+        'unknown': 'The unknown field does not exist.',
+    }
+    assert not api.fixtures(date='12/01/2021').ok
+    assert api.fixtures(date='2021-01-12').ok
+
+
+def test_other_sports():
+    with StubAPI('formula1') as stub:
+        api = Formula1(host=stub.url)
+        assert api.rankings_drivers(season=2020).ok
+        assert api.get('nope').errors == {'endpoint': 'This endpoint does not exist.'}
+
+
+def test_responses():
+    payload = {"get": "status", "errors": [], "results": 1, "response": {"account": {"firstname": "Test"}}}
+
+    with StubAPI(responses={'status': payload, 'timezone': lambda params: {**payload, "get": "timezone"}}) as stub:
+        api = Football(host=stub.url)
+        assert api.status().data.item() == {"account": {"firstname": "Test"}}
+        assert api.timezone().raw.json()['get'] == 'timezone'
+
+
+def test_error_injection():
+    with StubAPI(error_rate=.5, error_status=503, seed=1) as stub:
+        api = Football(host=stub.url)
+        statuses = [api.timezone().raw.status_code for _ in range(40)]
+
+        assert set(statuses) == {200, 503}
+        assert stub.stats == dict(requests=40, errors=statuses.count(503), throttled=0)
+
+        retried = Football(host=stub.url, retry=RetryPolicy(retries=10, backoff=0))
+        assert all(retried.timezone().ok for _ in range(10))
+
+
+def test_rate_limit():
+    with StubAPI(rate_limit=3) as stub:
+        api = Football(host=stub.url)
+        responses = [api.timezone() for _ in range(4)]
+
+        assert [response.raw.status_code for response in responses] == [200, 200, 200, 429]
+        assert responses[2].headers.rate_limit == '3'
+        assert responses[2].headers.rate_limit_remaining == '0'
+        assert 0 < int(responses[3].headers['Retry-After']) <= 60
+        assert stub.stats['throttled'] == 1
+
+
+def test_bursts():
+    with StubAPI(bursts=(5, 2)) as stub:
+        api = Football(host=stub.url)
+
+        assert [api.timezone().raw.status_code for _ in range(10)] == [200, 200, 200, 429, 429] * 2
+
+
+def test_latency():
+    with StubAPI(latency=.05) as stub:
+        api = Football(host=stub.url)
+        started = time.perf_counter()
+        api.timezone()
+
+        assert time.perf_counter() - started >= .05
+
+
+def test_concurrent_async(stub):
+    async def run():
+        async with AsyncFootball(host=stub.url) as api:
+            return [response async for _, response in api.many('fixtures', concurrency=16, id=list(range(100)))]
+
+    responses = asyncio.run(run())
+
+    assert len(responses) == 100
+    assert all(response.ok for response in responses)
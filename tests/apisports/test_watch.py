@@ -0,0 +1,170 @@
+import asyncio
+from itertools import islice
+
+import pytest
+
+from apisports import AsyncClient
+from apisports.watch import Change, Watcher, WatchError
+from helpers import StubServer, clientmeta_test_class
+
+SNAPSHOTS = [
+    [{"item": {"id": 1}, "goals": {"home": 0, "away": 0}}, {"item": {"id": 2}, "goals": {"home": 1, "away": 0}}],
+    [{"item": {"id": 1}, "goals": {"home": 0, "away": 0}}, {"item": {"id": 2}, "goals": {"home": 1, "away": 0}}],
+    [{"item": {"id": 1}, "goals": {"home": 0, "away": 1}}, {"item": {"id": 3}, "goals": {"home": 0, "away": 0}}],
+]
+
+
+def body(rows):
+    return {"get": "items", "errors": [], "results": len(rows), "response": rows}
+
+
+def test_watcher():
+    watcher = Watcher('item.id')
+
+    assert [(c.kind, c.key) for c in watcher.update(SNAPSHOTS[0])] == [('added', 1), ('added', 2)]
+    assert watcher.update(SNAPSHOTS[1]) == []
+    assert watcher.update(SNAPSHOTS[2]) == [
+        Change('changed', 1, SNAPSHOTS[2][0], SNAPSHOTS[1][0], ('goals.away',)),
+        Change('added', 3, SNAPSHOTS[2][1], None, ()),
+        Change('removed', 2, None, SNAPSHOTS[1][1], ()),
+    ]
+
+
+def test_watcher_fields():
+    watcher = Watcher(lambda row: row['id'])
+    watcher.update([{"id": 1, "events": [{"type": "Goal"}], "status": {"short": "1H"}}])
+
+    change, = watcher.update([{"id": 1, "events": [{"type": "Card"}], "status": {"short": "HT", "elapsed": 45}}])
+    assert change.fields == ('events.0.type', 'status.short', 'status.elapsed')
+
+    change, = watcher.update([{"id": 1, "events": [{"type": "Card"}, {"type": "Goal"}], "status": None}])
+    assert change.fields == ('events', 'status')
+
+
+def test_watch(test_v3, session, adapter):
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/items', [
+        {'json': body(rows)} for rows in SNAPSHOTS
+    ])
+
+    changes = list(islice(test_v3(session=session).watch('items', interval=0, ids='1-2-3'), 5))
+
+    assert [(c.kind, c.key) for c in changes] == [
+        ('added', 1), ('added', 2), ('changed', 1), ('added', 3), ('removed', 2)
+    ]
+    assert changes[2].fields == ('goals.away',)
+    # the second poll did not change anything
+    assert adapter.call_count == 3
+    assert adapter.last_request.qs == {'ids': ['1-2-3']}
+
+
+def test_watch_restart(test_v3, session, adapter):
+    def items(request, context):
+        if len(adapter.request_history) > 4:
+            return {"errors": {"watch": "polled too often"}}
+        context.headers['ETag'] = '"items"'
+        if request.headers.get('If-None-Match') == '"items"':
+            context.status_code = 304
+            return None
+        return body(SNAPSHOTS[0])
+
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/items', json=items)
+    api = test_v3(session=session, revalidate=True)
+
+    for _ in range(2):
+        # a new watch starts with the rows it sees, even though they were not modified since the previous watch
+        changes = list(islice(api.watch('items', interval=0), 2))
+        assert [(c.kind, c.key) for c in changes] == [('added', 1), ('added', 2)]
+
+    assert [request.headers.get('If-None-Match') for request in adapter.request_history] == [None, '"items"']
+
+
+def paged_items(polls):
+    """Two pages of items, the first one never changes, the goals of item 3 on the second page do on every poll"""
+
+    def items(params):
+        page = int(params.get('page', 1))
+        if page == 2:
+            polls.append(page)
+        rows = SNAPSHOTS[0] if page == 1 else [{"item": {"id": 3}, "goals": {"home": len(polls), "away": 0}}]
+        return {**body(rows), "parameters": {}, "paging": {"current": page, "total": 2}}
+
+    return items
+
+
+@pytest.mark.parametrize('revalidate', [False, True])
+def test_watch_paged(test_v3, session, adapter, revalidate):
+    items = paged_items([])
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/items',
+                         json=lambda request, context: items({k: v[0] for k, v in request.qs.items()}))
+
+    changes = list(islice(test_v3(session=session, revalidate=revalidate).watch('items', interval=0), 5))
+
+    assert [(c.kind, c.key) for c in changes] == [('added', 1), ('added', 2), ('added', 3), ('changed', 3),
+                                                  ('changed', 3)]
+    assert [c.row['goals']['home'] for c in changes[2:]] == [1, 2, 3]
+
+
+def test_watch_error(test_v3, session, adapter):
+    adapter.register_uri('GET', 'http+mock://api-test1.server.local/items', json={"errors": {"live": "failed"}})
+
+    with pytest.raises(WatchError) as exc:
+        next(test_v3(session=session).watch('items', interval=0))
+    assert "live: failed" in str(exc.value)
+
+
+def test_watch_key(test_v3):
+    with pytest.raises(ValueError):
+        test_v3().watch('ping').__next__()
+    with pytest.raises(AttributeError):
+        test_v3().watch('missing').__next__()
+
+
+def test_async_watch():
+    async_test_v3 = clientmeta_test_class('test', 3, base=AsyncClient)
+    snapshots = list(SNAPSHOTS)
+
+    with StubServer() as stub:
+        @stub.route('/items')
+        def items(params):
+            return body(snapshots.pop(0) if len(snapshots) > 1 else snapshots[0])
+
+        async def main():
+            changes = []
+            async with async_test_v3(host=stub.url) as api:
+                async for change in api.watch('items', interval=.01):
+                    changes.append(change)
+                    if len(changes) == 5:
+                        break
+            return changes
+
+        loop = asyncio.new_event_loop()
+        try:
+            changes = loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+    assert [c.kind for c in changes] == ['added', 'added', 'changed', 'added', 'removed']
+
+
+def test_async_watch_paged():
+    async_test_v3 = clientmeta_test_class('test', 3, base=AsyncClient)
+
+    with StubServer() as stub:
+        stub.route('/items')(paged_items([]))
+
+        async def main():
+            changes = []
+            async with async_test_v3(host=stub.url) as api:
+                async for change in api.watch('items', interval=.01):
+                    changes.append(change)
+                    if len(changes) == 4:
+                        break
+            return changes
+
+        loop = asyncio.new_event_loop()
+        try:
+            changes = loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+    assert [(c.kind, c.key) for c in changes] == [('added', 1), ('added', 2), ('added', 3), ('changed', 3)]